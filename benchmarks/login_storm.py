@@ -0,0 +1,104 @@
+"""Benchmark event-loop latency during a storm of password checks.
+
+Fires concurrent logins at two verifiers, one running scrypt inline in
+the coroutine and ``ScryptPasswordHasher`` running it in worker
+processes, while a probe measures how late the event loop wakes up
+from short sleeps. Logins rejected by the bounded pool are counted::
+
+    python benchmarks/login_storm.py --logins 200 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from kairo.application.exceptions import ServiceOverloadedError
+from kairo.config import PasswordHashConfig
+from kairo.infrastructure.security.scrypt_hasher import (
+    ScryptPasswordHasher,
+    verify_password,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+PROBE_INTERVAL = 0.005
+
+
+async def probe(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each short sleep returns, in milliseconds."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - start - PROBE_INTERVAL) * 1000)
+
+
+async def storm(
+    label: str,
+    verify: Callable[[str, str], Awaitable[bool]],
+    password_hash: str,
+    logins: int,
+) -> None:
+    """Run ``logins`` concurrent checks and print loop lag and throughput."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(verify("password123", password_hash) for _ in range(logins)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await prober
+
+    rejected = sum(isinstance(r, ServiceOverloadedError) for r in results)
+    lags.sort()
+    sys.stdout.write(
+        f"{label:<10} {logins - rejected:5d} ok {rejected:5d} rejected"
+        f"   {(logins - rejected) / elapsed:7.1f} logins/s"
+        f"   loop lag p50 {statistics.median(lags):7.1f} ms"
+        f"   p99 {lags[int(len(lags) * 0.99)]:7.1f} ms   max {lags[-1]:7.1f} ms\n",
+    )
+
+
+async def run(logins: int, config: PasswordHashConfig) -> None:
+    """Run the storm against both verifiers."""
+    hasher = ScryptPasswordHasher(config)
+    try:
+        password_hash = await hasher.hash("password123")
+
+        async def inline(password: str, stored: str) -> bool:
+            return verify_password(password, stored)
+
+        await storm("inline", inline, password_hash, logins)
+        await storm("pool", hasher.verify, password_hash, logins)
+    finally:
+        hasher.close()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--n", type=int, default=PasswordHashConfig().n)
+    args = parser.parse_args()
+    config = PasswordHashConfig(
+        n=args.n,
+        workers=args.workers,
+        max_pending=args.max_pending,
+    )
+    asyncio.run(run(args.logins, config))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark row-to-entity mappers with and without domain validation.
+
+Maps in-memory rows to entities through the infrastructure mappers, which
+restore entities without running ``__post_init__``, and through adaptix
+converters that construct them normally, as the mappers did before::
+
+    python benchmarks/mappers.py --rows 10000
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+from adaptix import P
+from adaptix.conversion import allow_unlinked_optional, get_converter, impl_converter
+from uuid_extensions import uuid7
+
+from kairo.domain.entities.base import LazyEntityCollection
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.infrastructure.sqlalchemy.mappers.project_mapper import (
+    convert_project_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.mappers.task_mapper import (
+    convert_task_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.mappers.user_mapper import (
+    convert_user_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.models.project import ProjectModel
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+from kairo.infrastructure.sqlalchemy.models.user import UserModel
+
+validated_user = get_converter(UserModel, User)
+validated_task = get_converter(
+    TaskModel,
+    Task,
+    recipe=[allow_unlinked_optional(P[Task].subtasks)],
+)
+
+
+@impl_converter(recipe=[allow_unlinked_optional(P[Project].tasks)])
+def validated_project(model: ProjectModel, owner: User) -> Project:  # type: ignore[empty-body]
+    """Construct a project with its validation, as the mapper did before."""
+
+
+def make_rows(count: int) -> dict[str, list[Any]]:
+    """Build detached user, task and project rows."""
+    now = datetime.now(UTC)
+    users = [
+        UserModel(
+            id=uuid7(),
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+            password="password123",  # noqa: S106
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+    tasks = [
+        TaskModel(id=uuid7(), name=f"Task {i}", description="Description")
+        for i in range(count)
+    ]
+    projects = [
+        ProjectModel(id=uuid7(), name=f"Project {i}", description="Description")
+        for i in range(count)
+    ]
+    return {"users": users, "tasks": tasks, "projects": projects}
+
+
+def time_it(label: str, fn: Callable[[], object], rows: int, repeat: int) -> float:
+    """Print and return the best time per row in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    per_row = best / rows * 1e6
+    sys.stdout.write(f"{label:<32} {best * 1000:8.2f} ms   {per_row:6.3f} us/row\n")
+    return per_row
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rows = make_rows(args.rows)
+    owner = convert_user_model_to_domain(rows["users"][0])
+
+    def projects(convert: Callable[..., Project]) -> list[Project]:
+        return [convert(model, owner) for model in rows["projects"]]
+
+    for name, before, after in [
+        (
+            "users",
+            lambda: [validated_user(model) for model in rows["users"]],
+            lambda: [convert_user_model_to_domain(model) for model in rows["users"]],
+        ),
+        (
+            "tasks",
+            lambda: [validated_task(model) for model in rows["tasks"]],
+            lambda: [convert_task_model_to_domain(model) for model in rows["tasks"]],
+        ),
+        (
+            "projects",
+            partial(projects, validated_project),
+            partial(
+                projects,
+                lambda model, owner: convert_project_model_to_domain(
+                    model,
+                    owner,
+                    LazyEntityCollection(),
+                ),
+            ),
+        ),
+    ]:
+        slow = time_it(f"{args.rows} {name}, validated", before, args.rows, args.repeat)
+        fast = time_it(f"{args.rows} {name}, trusted", after, args.rows, args.repeat)
+        sys.stdout.write(f"{'':<32} x{slow / fast:.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
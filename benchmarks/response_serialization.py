@@ -0,0 +1,123 @@
+"""Benchmark per-response CPU cost of serializing domain entities.
+
+Compares the previous response path with the precompiled serializers
+behind ``EntityJSONResponse``. Before, ``get_user`` returned the ``User``
+entity for FastAPI to re-validate through a generated model, and list
+endpoints returned dicts built with ``dataclasses``-style recursion that
+FastAPI then walked again; both ended in ``JSONResponse``::
+
+    python benchmarks/response_serialization.py --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from dataclasses import fields, is_dataclass
+from typing import TYPE_CHECKING, Any
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from kairo.domain.entities.base import EntityCollection, LazyEntityCollection
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.presentation.http.serialization import EntityJSONResponse, to_response
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+PAGE_SIZE = 50
+
+
+def _plain(value: Any) -> Any:  # noqa: ANN401
+    # The dict conversion list endpoints used before.
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, (list, EntityCollection)):
+        return [_plain(item) for item in value]
+    if isinstance(value, LazyEntityCollection):
+        return [_plain(item) for item in value] if value.is_loaded else None
+    return value
+
+
+def previous(annotation: Any) -> Callable[[Any], Awaitable[bytes]]:  # noqa: ANN401
+    """Render content the way the endpoints did before precompiled serializers.
+
+    ``annotation`` is the endpoint's return annotation, or None where the
+    endpoint built a plain dict because FastAPI cannot model the entity.
+    """
+    convert = _plain if annotation is None else None
+    field = create_model_field("Response", annotation or Any, mode="serialization")
+
+    async def render(content: Any) -> bytes:  # noqa: ANN401
+        if convert is not None:
+            content = convert(content)
+        serialized = await serialize_response(field=field, response_content=content)
+        return JSONResponse(serialized).body
+
+    return render
+
+
+async def precompiled(content: Any) -> bytes:  # noqa: ANN401
+    """Render content with the compiled public-schema serializers."""
+    if isinstance(content, list):
+        return EntityJSONResponse([to_response(item) for item in content]).body
+    return EntityJSONResponse(to_response(content)).body
+
+
+async def time_per_call(
+    render: Callable[[Any], Awaitable[bytes]],
+    content: Any,  # noqa: ANN401
+    number: int,
+) -> float:
+    """Return the best mean time per call in microseconds over three runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            await render(content)
+        best = min(best, (time.perf_counter() - start) / number * 1e6)
+    return best
+
+
+async def run(number: int) -> None:
+    """Time both paths for each kind of response and print the comparison."""
+    owner = User(email="owner@example.com", username="owner", password="password123")  # noqa: S106
+    project = Project(name="Project", description="Description", owner=owner)
+    task = Task(name="Task", description="Description", project_id=project.id)
+    for i in range(3):
+        task.add_subtask(Task(name=f"Subtask {i}", description="Description"))
+    page = [
+        Task(name=f"Task {i}", description="Description", project_id=project.id)
+        for i in range(PAGE_SIZE)
+    ]
+
+    for label, annotation, content, calls in [
+        ("user", User | None, owner, number),
+        ("project", None, project, number),
+        ("task with 3 subtasks", None, task, number),
+        (f"page of {PAGE_SIZE} tasks", None, page, number // PAGE_SIZE),
+    ]:
+        before = await time_per_call(previous(annotation), content, calls)
+        after = await time_per_call(precompiled, content, calls)
+        sys.stdout.write(
+            f"{label:<24} before {before:9.1f} us   after {after:9.1f} us"
+            f"   x{before / after:.1f}\n",
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
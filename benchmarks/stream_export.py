@@ -0,0 +1,149 @@
+"""Benchmark peak memory of streamed task exports against buffered ones.
+
+Fills a throwaway SQLite database with one project's tasks, then exports
+them twice: loaded into a list and serialized as one JSON document, and
+streamed from a server-side cursor through ``json_array_stream``::
+
+    python benchmarks/stream_export.py --tasks 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import insert, select
+from uuid_extensions import uuid7
+
+from kairo.config import DatabaseConfig
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.user import User
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.infrastructure.sqlalchemy.hierarchy import path_segment
+from kairo.infrastructure.sqlalchemy.mappers.task_mapper import (
+    convert_task_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+from kairo.presentation.http.serialization import encode, to_response
+from kairo.presentation.http.streaming import json_array_stream
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+INSERT_BATCH = 10_000
+
+
+async def fill(session: AsyncSession, tasks: int) -> UUID:
+    """Create a project with ``tasks`` tasks and return its id."""
+    owner = await UserGateway(session).save(
+        User(email="owner@example.com", username="owner", password="password123"),  # noqa: S106
+    )
+    project = await ProjectGateway(session).create(
+        Project(name="Export", description="Benchmark", owner=owner),
+    )
+    rows: list[dict[str, object]] = []
+    for i in range(tasks):
+        task_id = uuid7()
+        rows.append(
+            {
+                "id": task_id,
+                "name": f"Task {i}",
+                "description": "Exported by the stream benchmark " * 4,
+                "project_id": project.id,
+                "path": path_segment(task_id),
+            },
+        )
+        if len(rows) == INSERT_BATCH:
+            await session.execute(insert(TaskModel), rows)
+            rows.clear()
+    if rows:
+        await session.execute(insert(TaskModel), rows)
+    await session.commit()
+    return project.id
+
+
+async def buffered(session: AsyncSession, project_id: UUID) -> int:
+    """Load every task, then serialize them as one document."""
+    result = await session.scalars(
+        select(TaskModel)
+        .where(TaskModel.project_id == project_id)
+        .order_by(TaskModel.id),
+    )
+    tasks = [convert_task_model_to_domain(model) for model in result]
+    body = encode([to_response(task) for task in tasks])
+    return len(body)
+
+
+async def streamed(session: AsyncSession, project_id: UUID) -> int:
+    """Serialize tasks as the cursor yields them, discarding each chunk."""
+    tasks = TaskGateway(session).stream_by_project_id(project_id)
+    return sum([len(chunk) async for chunk in json_array_stream(tasks)])
+
+
+async def measure(
+    label: str,
+    session_maker: async_sessionmaker[AsyncSession],
+    export: Callable[[AsyncSession], Awaitable[int]],
+) -> None:
+    """Run one export in a fresh session and print its time and peak memory."""
+    async with session_maker() as session:
+        tracemalloc.start()
+        start = time.perf_counter()
+        size = await export(session)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    sys.stdout.write(
+        f"{label:<28} {size / 2**20:8.1f} MiB body"
+        f"   peak {peak / 2**20:8.1f} MiB   {elapsed:6.2f}s\n",
+    )
+
+
+async def run(sizes: list[int]) -> None:
+    """Fill one database per size and print the comparison."""
+    for tasks in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(
+                DatabaseConfig(url=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"),
+            )
+            await MigrationEngine(engine, MIGRATIONS).upgrade()
+            try:
+                session_maker = create_session_maker(engine)
+                async with session_maker() as session:
+                    project_id = await fill(session, tasks)
+                for label, export in [("buffered", buffered), ("streamed", streamed)]:
+                    await measure(
+                        f"{tasks} tasks, {label}",
+                        session_maker,
+                        lambda session, export=export, project_id=project_id: export(
+                            session,
+                            project_id,
+                        ),
+                    )
+            finally:
+                await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,698 @@
+"""Run the benchmark suite and compare it against a stored baseline.
+
+Times the domain entities, the row mappers, the SQLAlchemy user gateway on
+a throwaway SQLite database, dependency resolution per request and the
+``/api/v1/users`` routes through an in-process ASGI client. Results are
+written as JSON, one entry per case with the time per operation, so a run
+made before an upgrade can be kept as the baseline for the runs after it::
+
+    python benchmarks/suite.py --output baseline.json
+    python benchmarks/suite.py --compare baseline.json --output current.json
+    python benchmarks/suite.py --compare baseline.json --current current.json
+
+Comparing exits with status 1 when any case got slower than the baseline
+by more than ``--threshold``. Both runs must come from the same machine;
+the environment of each is stored alongside the results to check that.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from fnmatch import fnmatch
+from itertools import count
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any
+
+import httpx
+from fastapi import Depends, FastAPI, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from kairo.application.caching import (
+    CacheInvalidatingSession,
+    CachingUserGateway,
+    UserCache,
+)
+from kairo.application.interactors.user import CreateUserUseCase
+from kairo.application.interfaces import DBSession, PasswordHasher
+from kairo.config import (
+    CacheConfig,
+    DatabaseConfig,
+    PasswordHashConfig,
+    ServerConfig,
+    Settings,
+)
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.domain.gateways.user_gateway import UserGateway as UserGatewayProtocol
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.infrastructure.sqlalchemy.mappers.user_mapper import (
+    convert_user_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+from kairo.infrastructure.sqlalchemy.models.user import UserModel
+from kairo.ioc import create_container
+from kairo.presentation.http.application import get_production_app
+from kairo.presentation.http.deps import ContainerMiddleware, inject
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+    from starlette.types import ASGIApp, Message
+
+FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+SUBTASK_COUNTS = (10, 100, 1_000, 10_000)
+DOMAIN_BATCH = 1_000
+GATEWAY_BATCH = 200
+HTTP_BATCH = 50
+BULK_LINES = 500
+DI_BATCH = 500
+# The routes are measured, not the key derivation; login_storm.py covers that.
+HTTP_ENV = {"KAIRO_PASSWORD_SCRYPT_N": "16", "KAIRO_PASSWORD_WORKERS": "1"}
+
+_serial = count()
+
+
+@dataclass(slots=True, frozen=True)
+class Case:
+    """One benchmark.
+
+    Attributes
+    ----------
+        name (str): Stable name the baseline is matched on.
+        ops (int): Operations performed by one call of ``run``.
+        run (Callable[[], Awaitable[object]]): The timed body.
+        prepare (Callable[[], Awaitable[object]] | None): Untimed set-up
+            run before every call of ``run``.
+
+    """
+
+    name: str
+    ops: int
+    run: Callable[[], Awaitable[object]]
+    prepare: Callable[[], Awaitable[object]] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Result:
+    """Timings of one case, in microseconds per operation."""
+
+    name: str
+    ops: int
+    rounds: int
+    median_us: float
+    min_us: float
+    stdev_us: float
+
+
+def new_user(prefix: str = "user") -> User:
+    """Build a valid user that does not clash with any other."""
+    serial = next(_serial)
+    return User(
+        email=f"{prefix}{serial}@example.com",
+        username=f"{prefix}{serial}",
+        password="password123",  # noqa: S106
+    )
+
+
+def sync(fn: Callable[[], object]) -> Callable[[], Awaitable[object]]:
+    """Wrap a synchronous body so it can be timed like the others."""
+
+    async def run() -> object:
+        return fn()
+
+    return run
+
+
+@asynccontextmanager
+async def domain_cases() -> AsyncIterator[list[Case]]:
+    """Subtask bookkeeping at growing sizes and user validation."""
+    cases = []
+    for size in SUBTASK_COUNTS:
+        parent = Task(name="Parent", description="Description")
+        children = [
+            Task(name=f"Task {i}", description="Description", parent_id=parent.id)
+            for i in range(size)
+        ]
+
+        def add_all(parent: Task = parent, children: list[Task] = children) -> None:
+            parent.subtasks = type(parent.subtasks)()
+            for child in children:
+                parent.add_subtask(child)
+
+        def remove_all(parent: Task = parent, children: list[Task] = children) -> None:
+            for child in children:
+                parent.remove_subtask(child.id)
+
+        cases.append(Case(f"domain.task.add_subtask[{size}]", size, sync(add_all)))
+        cases.append(
+            Case(
+                f"domain.task.remove_subtask[{size}]",
+                size,
+                sync(remove_all),
+                prepare=sync(add_all),
+            ),
+        )
+
+    def construct_users() -> None:
+        for i in range(DOMAIN_BATCH):
+            User(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                password="password123",  # noqa: S106
+            )
+
+    cases.append(Case("domain.user.construct", DOMAIN_BATCH, sync(construct_users)))
+    yield cases
+
+
+@asynccontextmanager
+async def mapper_cases() -> AsyncIterator[list[Case]]:
+    """Users restored from their rows through ``user_mapper``."""
+    models = [
+        UserModel(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            password=user.password,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+        for user in (new_user() for _ in range(DOMAIN_BATCH))
+    ]
+    yield [
+        Case(
+            "mapper.user.to_domain",
+            DOMAIN_BATCH,
+            sync(lambda: [convert_user_model_to_domain(model) for model in models]),
+        ),
+    ]
+
+
+@asynccontextmanager
+async def sqlite_database() -> AsyncIterator[str]:
+    """Create a migrated SQLite database in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(DatabaseConfig(url=url))
+        try:
+            await MigrationEngine(engine, MIGRATIONS).upgrade()
+        finally:
+            await engine.dispose()
+        yield url
+
+
+async def seed_users(
+    session_maker: async_sessionmaker[AsyncSession],
+    users: int,
+    projects: int = 0,
+) -> list[User]:
+    """Insert ``users`` users, the first owning ``projects`` projects."""
+    async with session_maker() as session:
+        saved = await UserGateway(session).save_many(
+            [new_user("seed") for _ in range(users)],
+        )
+        for i in range(projects):
+            await ProjectGateway(session).create(
+                Project(name=f"Project {i}", description="Description", owner=saved[0]),
+            )
+        await session.commit()
+    return saved
+
+
+@asynccontextmanager
+async def gateway_cases() -> AsyncIterator[list[Case]]:
+    """User CRUD through ``UserGateway``, one commit per batch."""
+    async with AsyncExitStack() as stack:
+        url = await stack.enter_async_context(sqlite_database())
+        engine = create_engine(DatabaseConfig(url=url))
+        stack.push_async_callback(engine.dispose)
+        session_maker = create_session_maker(engine)
+        seeded = await seed_users(session_maker, GATEWAY_BATCH)
+        doomed: list[User] = []
+
+        async def batch(
+            operation: Callable[[UserGateway, User], Awaitable[object]],
+            users: Callable[[], list[User]],
+        ) -> None:
+            async with session_maker() as session:
+                gateway = UserGateway(session)
+                for user in users():
+                    await operation(gateway, user)
+                await session.commit()
+
+        async def prepare_delete() -> None:
+            doomed[:] = [new_user() for _ in range(GATEWAY_BATCH)]
+            async with session_maker() as session:
+                await UserGateway(session).save_many(doomed)
+                await session.commit()
+
+        async def save_many() -> None:
+            async with session_maker() as session:
+                await UserGateway(session).save_many(
+                    [new_user() for _ in range(GATEWAY_BATCH)],
+                )
+                await session.commit()
+
+        def fresh() -> list[User]:
+            return [new_user() for _ in range(GATEWAY_BATCH)]
+
+        def renamed() -> list[User]:
+            for user in seeded:
+                user.username = f"renamed{next(_serial)}"
+            return seeded
+
+        yield [
+            Case(
+                "gateway.user.save",
+                GATEWAY_BATCH,
+                lambda: batch(lambda g, u: g.save(u), fresh),
+            ),
+            Case("gateway.user.save_many", GATEWAY_BATCH, save_many),
+            Case(
+                "gateway.user.get_by_id",
+                GATEWAY_BATCH,
+                lambda: batch(lambda g, u: g.get_by_id(u.id), lambda: seeded),
+            ),
+            Case(
+                "gateway.user.get_by_email",
+                GATEWAY_BATCH,
+                lambda: batch(lambda g, u: g.get_by_email(u.email), lambda: seeded),
+            ),
+            Case(
+                "gateway.user.update",
+                GATEWAY_BATCH,
+                lambda: batch(lambda g, u: g.update(u), renamed),
+            ),
+            Case(
+                "gateway.user.delete",
+                GATEWAY_BATCH,
+                lambda: batch(lambda g, u: g.delete(u), lambda: doomed),
+                prepare=prepare_delete,
+            ),
+        ]
+
+
+@asynccontextmanager
+async def patched_environ(values: dict[str, str]) -> AsyncIterator[None]:
+    """Set environment variables for the duration of the block."""
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@asynccontextmanager
+async def http_cases() -> AsyncIterator[list[Case]]:
+    """Serve the ``/api/v1/users`` routes in-process from the production app."""
+    async with AsyncExitStack() as stack:
+        url = await stack.enter_async_context(sqlite_database())
+        engine = create_engine(DatabaseConfig(url=url))
+        try:
+            seeded = await seed_users(create_session_maker(engine), HTTP_BATCH, 20)
+        finally:
+            await engine.dispose()
+        await stack.enter_async_context(
+            patched_environ({**HTTP_ENV, "KAIRO_DATABASE_URL": url}),
+        )
+        app = get_production_app()
+        await stack.enter_async_context(app.router.lifespan_context(app))
+        client = await stack.enter_async_context(
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://bench",
+            ),
+        )
+
+        async def requests(send: Callable[[User], Awaitable[httpx.Response]]) -> None:
+            for user in seeded:
+                response = await send(user)
+                response.raise_for_status()
+
+        def signup(user: User) -> Awaitable[httpx.Response]:
+            fresh = new_user()
+            return client.post(
+                "/api/v1/users",
+                json={
+                    "email": fresh.email,
+                    "username": fresh.username,
+                    "password": fresh.password,
+                },
+            )
+
+        async def bulk() -> None:
+            lines = []
+            for _ in range(BULK_LINES):
+                user = new_user()
+                lines.append(
+                    json.dumps(
+                        {
+                            "email": user.email,
+                            "username": user.username,
+                            "password": user.password,
+                        },
+                    ),
+                )
+            response = await client.post(
+                "/api/v1/users:bulk",
+                content="\n".join(lines).encode(),
+            )
+            response.raise_for_status()
+            await response.aread()
+
+        yield [
+            Case("http.users.create", HTTP_BATCH, lambda: requests(signup)),
+            Case(
+                "http.users.get",
+                HTTP_BATCH,
+                lambda: requests(lambda u: client.get(f"/api/v1/users/{u.id}")),
+            ),
+            Case(
+                "http.users.projects",
+                HTTP_BATCH,
+                lambda: requests(
+                    lambda _: client.get(f"/api/v1/users/{seeded[0].id}/projects"),
+                ),
+            ),
+            Case("http.users.bulk", BULK_LINES, bulk),
+        ]
+
+
+# The chain of FastAPI dependencies that built CreateUserUseCase before the
+# IoC container, kept as the reference the container is measured against.
+
+
+async def _depends_session(request: Request) -> AsyncIterator[AsyncSession]:
+    async with request.app.state.session_maker() as session:
+        yield session
+
+
+def _depends_user_cache(request: Request) -> UserCache | None:
+    user_cache: UserCache | None = request.app.state.user_cache
+    return user_cache
+
+
+def _depends_password_hasher(request: Request) -> PasswordHasher:
+    password_hasher: PasswordHasher = request.app.state.password_hasher
+    return password_hasher
+
+
+def _depends_user_gateway(
+    session: Annotated[AsyncSession, Depends(_depends_session)],
+    user_cache: Annotated[UserCache | None, Depends(_depends_user_cache)],
+) -> UserGatewayProtocol:
+    user_gateway = UserGateway(session)
+    if user_cache is None:
+        return user_gateway
+    return CachingUserGateway(user_gateway, user_cache)
+
+
+def _depends_db_session(
+    session: Annotated[AsyncSession, Depends(_depends_session)],
+    user_gateway: Annotated[UserGatewayProtocol, Depends(_depends_user_gateway)],
+) -> DBSession:
+    if isinstance(user_gateway, CachingUserGateway):
+        return CacheInvalidatingSession(session, user_gateway)
+    return session
+
+
+def _depends_create_user(
+    db_session: Annotated[DBSession, Depends(_depends_db_session)],
+    user_gateway: Annotated[UserGatewayProtocol, Depends(_depends_user_gateway)],
+    password_hasher: Annotated[PasswordHasher, Depends(_depends_password_hasher)],
+) -> CreateUserUseCase:
+    return CreateUserUseCase(db_session, user_gateway, password_hasher)
+
+
+async def _resolved_by_depends(
+    use_case: Annotated[CreateUserUseCase, Depends(_depends_create_user)],
+) -> Response:
+    return Response(status_code=204)
+
+
+async def _resolved_by_container(
+    use_case: Annotated[CreateUserUseCase, inject(CreateUserUseCase)],
+) -> Response:
+    return Response(status_code=204)
+
+
+async def call_asgi(app: ASGIApp, path: str) -> None:
+    """Send one bodiless GET straight to an ASGI app, without a client."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    await app(scope, receive, send)
+
+
+@asynccontextmanager
+async def di_cases() -> AsyncIterator[list[Case]]:
+    """Build the create-user use case per request, with and without FastAPI.
+
+    The session is opened and closed but never used, so these time the
+    resolution alone.
+    """
+    async with AsyncExitStack() as stack:
+        url = await stack.enter_async_context(sqlite_database())
+        settings = Settings(
+            database=DatabaseConfig(url=url),
+            cache=CacheConfig(),
+            password=PasswordHashConfig(n=16, workers=1),
+            server=ServerConfig(),
+        )
+        container = await stack.enter_async_context(create_container(settings))
+
+        depends_app = FastAPI()
+        depends_app.state.session_maker = await container.get(
+            async_sessionmaker[AsyncSession],
+        )
+        depends_app.state.user_cache = await container.get(UserCache | None)  # type: ignore[arg-type]
+        depends_app.state.password_hasher = await container.get(PasswordHasher)
+        depends_app.add_api_route("/", _resolved_by_depends)
+
+        container_app = FastAPI()
+        container_app.state.container = container
+        container_app.add_middleware(ContainerMiddleware)
+        container_app.add_api_route("/", _resolved_by_container)
+
+        async def resolve() -> None:
+            for _ in range(DI_BATCH):
+                async with container.enter() as request:
+                    await request.get(CreateUserUseCase)
+
+        async def route(app: ASGIApp) -> None:
+            for _ in range(DI_BATCH):
+                await call_asgi(app, "/")
+
+        yield [
+            Case("di.container.resolve", DI_BATCH, resolve),
+            Case("di.http.depends", DI_BATCH, lambda: route(depends_app)),
+            Case("di.http.container", DI_BATCH, lambda: route(container_app)),
+        ]
+
+
+GROUPS = (domain_cases, mapper_cases, gateway_cases, di_cases, http_cases)
+
+
+async def measure(case: Case, rounds: int) -> Result:
+    """Run a case once to warm up, then ``rounds`` more times."""
+    timings = []
+    for _ in range(rounds + 1):
+        if case.prepare is not None:
+            await case.prepare()
+        gc.collect()
+        start = time.perf_counter()
+        await case.run()
+        timings.append((time.perf_counter() - start) / case.ops * 1e6)
+    timings = timings[1:]
+    return Result(
+        name=case.name,
+        ops=case.ops,
+        rounds=rounds,
+        median_us=statistics.median(timings),
+        min_us=min(timings),
+        stdev_us=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+async def run_suite(rounds: int, patterns: list[str]) -> list[Result]:
+    """Run every case whose name matches one of ``patterns``."""
+    results = []
+    for group in GROUPS:
+        async with group() as cases:
+            for case in cases:
+                if not any(fnmatch(case.name, pattern) for pattern in patterns):
+                    continue
+                result = await measure(case, rounds)
+                sys.stdout.write(
+                    f"{result.name:<36} {result.median_us:12.3f} us/op"
+                    f"   min {result.min_us:12.3f}   stdev {result.stdev_us:10.3f}\n",
+                )
+                results.append(result)
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """Describe the machine and interpreter the results were measured on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def dump(results: list[Result]) -> dict[str, Any]:
+    """Build the JSON document for a run."""
+    return {
+        "version": FORMAT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Read a JSON document written by ``dump``.
+
+    :raises SystemExit: If the file was written by another format version.
+    """
+    document: dict[str, Any] = json.loads(path.read_text())
+    if document.get("version") != FORMAT_VERSION:
+        msg = f"{path}: unsupported benchmark format {document.get('version')!r}"
+        raise SystemExit(msg)
+    return document
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+) -> Iterator[tuple[str, float | None, float | None, str]]:
+    """Yield ``(name, baseline_us, current_us, verdict)`` per case.
+
+    Medians are compared. The verdict is ``regressed`` or ``improved`` when
+    they differ by more than ``threshold`` (a fraction of the baseline),
+    ``ok`` otherwise, and ``new`` or ``missing`` for cases found in only
+    one of the runs.
+    """
+    before = {result["name"]: result["median_us"] for result in baseline["results"]}
+    after = {result["name"]: result["median_us"] for result in current["results"]}
+    for name, now in after.items():
+        was = before.get(name)
+        if was is None:
+            yield name, None, now, "new"
+        elif now > was * (1 + threshold):
+            yield name, was, now, "regressed"
+        elif now < was * (1 - threshold):
+            yield name, was, now, "improved"
+        else:
+            yield name, was, now, "ok"
+    for name, was in before.items():
+        if name not in after:
+            yield name, was, None, "missing"
+
+
+def report(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> bool:
+    """Print the comparison and return whether anything regressed."""
+    if baseline["environment"] != current["environment"]:
+        sys.stdout.write("warning: the runs come from different environments\n")
+    regressed = False
+    for name, was, now, verdict in compare(baseline, current, threshold):
+        change = f"{(now - was) / was:+8.1%}" if was and now is not None else ""
+        sys.stdout.write(
+            f"{name:<36} {_us(was)} -> {_us(now)} {change:>8}   {verdict}\n",
+        )
+        regressed |= verdict == "regressed"
+    return regressed
+
+
+def _us(value: float | None) -> str:
+    return f"{value:12.3f}" if value is not None else f"{'-':>12}"
+
+
+def main() -> None:
+    """Parse arguments, run or load the suite and compare it if asked to."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only run cases whose name matches this glob; may be repeated.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results here.")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE")
+    parser.add_argument(
+        "--current",
+        type=Path,
+        help="Compare these stored results instead of running the suite.",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    patterns = args.filter or ["*"]
+    if args.current is not None:
+        if args.compare is None:
+            parser.error("--current needs --compare")
+        current = load(args.current)
+    else:
+        results = asyncio.run(run_suite(args.rounds, patterns))
+        current = dump(results)
+        if args.output is not None:
+            args.output.write_text(json.dumps(current, indent=2) + "\n")
+
+    if args.compare is not None:
+        baseline = load(args.compare)
+        # Cases left out by --filter are not missing from this run.
+        baseline["results"] = [
+            result
+            for result in baseline["results"]
+            if any(fnmatch(result["name"], pattern) for pattern in patterns)
+        ]
+        regressed = report(baseline, current, args.threshold)
+        sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
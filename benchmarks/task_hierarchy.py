@@ -0,0 +1,205 @@
+"""Benchmark materialized task paths against parent_id traversal.
+
+Builds a task tree in a throwaway SQLite database and times descendant
+reads, ancestor reads and subtree moves both ways::
+
+    python benchmarks/task_hierarchy.py --nodes 100000 --fanout 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func, insert, select, update
+from uuid_extensions import uuid7
+
+from kairo.config import DatabaseConfig
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.hierarchy import child_path, in_subtree
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+INSERT_BATCH = 5000
+
+
+async def build_tree(session: AsyncSession, nodes: int, fanout: int) -> list[UUID]:
+    """Insert a breadth-first tree of ``nodes`` tasks; return ids in order."""
+    ids: list[UUID] = []
+    paths: list[str] = []
+    rows: list[dict[str, object]] = []
+    for index in range(nodes):
+        task_id = uuid7()
+        parent = (index - 1) // fanout if index else None
+        path = child_path(paths[parent] if parent is not None else None, task_id)
+        ids.append(task_id)
+        paths.append(path)
+        rows.append(
+            {
+                "id": task_id,
+                "name": f"Task {index}",
+                "description": "Benchmark task",
+                "parent_id": ids[parent] if parent is not None else None,
+                "path": path,
+            },
+        )
+        if len(rows) == INSERT_BATCH:
+            await session.execute(insert(TaskModel), rows)
+            rows.clear()
+    if rows:
+        await session.execute(insert(TaskModel), rows)
+    await session.commit()
+    return ids
+
+
+async def descendants_by_parent_id(session: AsyncSession, task_id: UUID) -> int:
+    """Count descendants with a recursive CTE over parent_id."""
+    tree = (
+        select(TaskModel.id)
+        .where(TaskModel.parent_id == task_id)
+        .cte("tree", recursive=True)
+    )
+    tree = tree.union_all(
+        select(TaskModel.id).join(tree, TaskModel.parent_id == tree.c.id),
+    )
+    return int(await session.scalar(select(func.count()).select_from(tree)) or 0)
+
+
+async def descendants_by_path(session: AsyncSession, path: str) -> int:
+    """Count descendants with a range scan on the path index."""
+    statement = select(func.count()).where(in_subtree(path, include_root=False))
+    return int(await session.scalar(statement) or 0)
+
+
+async def ancestors_by_parent_id(session: AsyncSession, task_id: UUID) -> int:
+    """Walk up parent_id one query per level."""
+    count = 0
+    parent_id = await session.scalar(
+        select(TaskModel.parent_id).where(TaskModel.id == task_id),
+    )
+    while parent_id is not None:
+        count += 1
+        parent_id = await session.scalar(
+            select(TaskModel.parent_id).where(TaskModel.id == parent_id),
+        )
+    return count
+
+
+async def move_by_parent_id(session: AsyncSession, task_id: UUID, to: UUID) -> None:
+    """Reparent by updating a single parent_id; descendants are untouched."""
+    await session.execute(
+        update(TaskModel)
+        .where(TaskModel.id == task_id)
+        .values(parent_id=to)
+        .execution_options(synchronize_session=False),
+    )
+
+
+async def time_it(
+    label: str,
+    fn: Callable[[], Awaitable[object]],
+    repeat: int,
+) -> None:
+    """Run ``fn`` ``repeat`` times and print the median and best time."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    sys.stdout.write(
+        f"{label:<44} median {statistics.median(timings):9.3f} ms"
+        f"   best {min(timings):9.3f} ms\n",
+    )
+
+
+async def run(nodes: int, fanout: int, repeat: int) -> None:
+    """Build the tree and print the comparison."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            DatabaseConfig(url=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"),
+        )
+        await MigrationEngine(engine, MIGRATIONS).upgrade()
+        try:
+            async with create_session_maker(engine)() as session:
+                start = time.perf_counter()
+                ids = await build_tree(session, nodes, fanout)
+                build_time = time.perf_counter() - start
+                sys.stdout.write(
+                    f"Built {nodes} tasks (fanout {fanout}) in {build_time:.1f}s\n",
+                )
+                gateway = TaskGateway(session)
+                # A node one level below the root owns roughly 1/fanout of the tree.
+                subtree_root = ids[1]
+                leaf = ids[-1]
+                path = await session.scalar(
+                    select(TaskModel.path).where(TaskModel.id == subtree_root),
+                )
+                assert path is not None  # noqa: S101
+
+                await time_it(
+                    "descendants: recursive CTE on parent_id",
+                    lambda: descendants_by_parent_id(session, subtree_root),
+                    repeat,
+                )
+                await time_it(
+                    "descendants: path range scan",
+                    lambda: descendants_by_path(session, path),
+                    repeat,
+                )
+                await time_it(
+                    "ancestors: parent_id walk",
+                    lambda: ancestors_by_parent_id(session, leaf),
+                    repeat,
+                )
+                await time_it(
+                    "ancestors: ids from path",
+                    lambda: gateway.get_ancestors(leaf),
+                    repeat,
+                )
+
+                # Move the subtree under its sibling and back under the root.
+                targets = [ids[2], ids[0]]
+                task = await gateway.get_by_id(subtree_root)
+                assert task is not None  # noqa: S101
+
+                async def move_by_path() -> None:
+                    task.parent_id = targets[0]
+                    targets.reverse()
+                    await gateway.update(task)
+
+                await time_it("subtree move: path rewrite", move_by_path, repeat)
+                await time_it(
+                    "subtree move: parent_id only",
+                    lambda: move_by_parent_id(session, subtree_root, ids[0]),
+                    repeat,
+                )
+                await session.rollback()
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--fanout", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.nodes, args.fanout, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Benchmark full-text task search against ILIKE scans.
+
+Fills a throwaway SQLite database with synthetic tasks, then times the
+first page of ranked search results next to the equivalent substring
+scan, plus the cost of keeping the index current on writes::
+
+    python benchmarks/task_search.py --tasks 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, insert, select, text
+from uuid_extensions import uuid7
+
+from kairo.config import DatabaseConfig
+from kairo.domain.entities.task import Task
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.hierarchy import path_segment
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+INSERT_BATCH = 10_000
+PAGE_SIZE = 50
+# Every common word appears in most tasks, each rare word in about 175 of
+# a million.
+COMMON_WORDS = ["fix", "update", "review", "service", "page", "test", "release"]
+RARE_WORDS = [f"component{i}" for i in range(20_000)]
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    """Return ``words`` words, mostly common with the odd rare one."""
+    return " ".join(
+        rng.choice(RARE_WORDS) if rng.random() < 0.1 else rng.choice(COMMON_WORDS)  # noqa: PLR2004
+        for _ in range(words)
+    )
+
+
+async def fill(session: AsyncSession, tasks: int) -> None:
+    """Insert ``tasks`` synthetic root tasks in batches."""
+    rng = random.Random(42)  # noqa: S311
+    rows: list[dict[str, object]] = []
+    for _ in range(tasks):
+        task_id = uuid7()
+        rows.append(
+            {
+                "id": task_id,
+                "name": random_text(rng, 5),
+                "description": random_text(rng, 30),
+                "path": path_segment(task_id),
+            },
+        )
+        if len(rows) == INSERT_BATCH:
+            await session.execute(insert(TaskModel), rows)
+            rows.clear()
+    if rows:
+        await session.execute(insert(TaskModel), rows)
+    # One task with a word found nowhere else, so a scan has to read all rows.
+    await TaskGateway(session).create(
+        Task(name="Investigate flaky zeppelin", description=random_text(rng, 30)),
+    )
+    await session.commit()
+
+
+async def ilike_scan(session: AsyncSession, words: list[str]) -> int:
+    """Fetch the first page of tasks containing every word, by substring."""
+    criteria = [
+        TaskModel.name.ilike(f"%{word}%") | TaskModel.description.ilike(f"%{word}%")
+        for word in words
+    ]
+    result = await session.scalars(
+        select(TaskModel)
+        .where(and_(*criteria))
+        .order_by(TaskModel.id)
+        .limit(PAGE_SIZE),
+    )
+    return len(result.all())
+
+
+async def time_it(
+    label: str,
+    fn: Callable[[], Awaitable[object]],
+    repeat: int,
+) -> None:
+    """Run ``fn`` ``repeat`` times and print the median and best time."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    sys.stdout.write(
+        f"{label:<44} median {statistics.median(timings):9.3f} ms"
+        f"   best {min(timings):9.3f} ms\n",
+    )
+
+
+async def run(tasks: int, repeat: int) -> None:
+    """Fill the database and print the comparison."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            DatabaseConfig(url=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"),
+        )
+        await MigrationEngine(engine, MIGRATIONS).upgrade()
+        try:
+            async with create_session_maker(engine)() as session:
+                start = time.perf_counter()
+                await fill(session, tasks)
+                sys.stdout.write(
+                    f"Inserted {tasks} indexed tasks "
+                    f"in {time.perf_counter() - start:.1f}s\n",
+                )
+                gateway = TaskGateway(session)
+
+                for label, words in [
+                    ("unique word", ["zeppelin"]),
+                    ("rare word", ["component123"]),
+                    ("common word", ["review"]),
+                    ("rare and common word", ["component123", "review"]),
+                ]:
+                    query = " ".join(words)
+                    await time_it(
+                        f"{label}: full-text search",
+                        lambda query=query: gateway.search(query, limit=PAGE_SIZE),
+                        repeat,
+                    )
+                    await time_it(
+                        f"{label}: ILIKE scan",
+                        lambda words=words: ilike_scan(session, words),
+                        repeat,
+                    )
+
+                task = Task(name="Deploy billing", description="Roll out")
+                await gateway.create(task)
+
+                async def rename() -> None:
+                    task.name = random_text(random.Random(), 5)  # noqa: S311
+                    await gateway.update(task)
+
+                await time_it("update one task, reindexing it", rename, repeat)
+                await session.rollback()
+
+                start = time.perf_counter()
+                await session.execute(
+                    text("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"),
+                )
+                await session.commit()
+                sys.stdout.write(
+                    f"Rebuilt the index in {time.perf_counter() - start:.1f}s\n",
+                )
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
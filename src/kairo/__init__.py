@@ -0,0 +1,5 @@
+def main() -> None:
+    """Entry point for the ``kairo`` command."""
+    from kairo.presentation.cli.main import main as cli_main  # noqa: PLC0415
+
+    cli_main()
@@ -0,0 +1,311 @@
+"""Read-through caching for user lookups.
+
+``CachingUserGateway`` wraps a request's user gateway. Reads by id are
+served from an application-wide ``Cache`` and concurrent misses on the same
+id are coalesced into a single query. Updates and deletes are only
+evicted from the cache once the surrounding transaction has committed,
+which ``CacheInvalidatingSession`` takes care of. A load that was in
+flight when its user was evicted may have read the old row, so it does
+not fill the cache. Given the request's
+``IdentityMap``, users it already holds are never read from the cache, and
+cached users are merged into it like loaded ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from copy import copy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from kairo.application.interfaces import DBSession
+from kairo.domain.entities.user import User
+from kairo.domain.gateways.user_gateway import UserReader, UserWriter
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Awaitable,
+        Callable,
+        Collection,
+        Hashable,
+        Iterable,
+        Mapping,
+        Sequence,
+    )
+    from uuid import UUID
+
+    from kairo.application.interfaces import Cache, IdentityMap
+    from kairo.domain.gateways.user_gateway import UserGateway
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Cache effectiveness counters.
+
+    Attributes
+    ----------
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to go to the source.
+        evictions (int): Entries dropped to respect the size bound.
+        expirations (int): Entries dropped because their TTL elapsed.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class SingleFlight(Generic[K, V]):
+    """Share one in-flight call between concurrent callers of the same key."""
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Future[V]] = {}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Followers wait for the leader's result. If the leader is cancelled,
+        one of the followers takes over instead of failing.
+        """
+        while (leader := self._calls.get(key)) is not None:
+            # asyncio.wait never cancels the leader, even if we are cancelled.
+            await asyncio.wait([leader])
+            if not leader.cancelled():
+                return leader.result()
+
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case there are no followers.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+class UserCache:
+    """Application-wide user cache shared by all requests.
+
+    Fills go through ``start_fill`` and ``fill``. Every eviction bumps the
+    generation of the users it evicts, and ``fill`` skips users whose
+    generation changed since their load started: they may have been read
+    before the write that evicted them committed. Generations are only
+    kept while a load of the user is in flight.
+    """
+
+    def __init__(self, backend: Cache[User]) -> None:
+        self.backend = backend
+        self.single_flight: SingleFlight[UUID, User | None] = SingleFlight()
+        # user id -> [loads in flight, generation]
+        self._loads: dict[UUID, list[int]] = {}
+
+    @staticmethod
+    def key(user_id: UUID) -> str:
+        """Return the cache key for a user id."""
+        return f"user:{user_id}"
+
+    def start_fill(self, user_ids: Iterable[UUID]) -> dict[UUID, int]:
+        """Note that these users are being loaded; pass the result to ``fill``."""
+        started = {}
+        for user_id in user_ids:
+            load = self._loads.setdefault(user_id, [0, 0])
+            load[0] += 1
+            started[user_id] = load[1]
+        return started
+
+    async def fill(
+        self,
+        started: dict[UUID, int],
+        users: Mapping[UUID, User],
+    ) -> None:
+        """Cache the loaded users that were not evicted while they loaded.
+
+        Must be called once for every ``start_fill``, even if the load failed.
+        """
+        fresh = []
+        for user_id, generation in started.items():
+            load = self._loads[user_id]
+            load[0] -= 1
+            if load[1] == generation and user_id in users:
+                fresh.append(users[user_id])
+            if not load[0]:
+                del self._loads[user_id]
+        for user in fresh:
+            await self.backend.set(self.key(user.id), copy(user))
+
+    async def evict(self, user_ids: Collection[UUID]) -> None:
+        """Drop users from the cache and from the loads in flight."""
+        for user_id in user_ids:
+            load = self._loads.get(user_id)
+            if load is not None:
+                load[1] += 1
+        await self.backend.delete(*(self.key(user_id) for user_id in user_ids))
+
+
+class CachingUserGateway(UserReader, UserWriter):
+    """User gateway decorator with read-through caching by id.
+
+    Create one instance per request, next to the request's session.
+    """
+
+    def __init__(
+        self,
+        user_gateway: UserGateway,
+        cache: UserCache,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        self.user_gateway = user_gateway
+        self.cache = cache
+        self.identity_map = identity_map
+        self._written: set[UUID] = set()
+        self._pending_invalidation: set[UUID] = set()
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        """Get a user by ID, serving it from the cache when possible."""
+        identity_map = self.identity_map
+        if user_id in self._written or (
+            identity_map is not None
+            and (
+                identity_map.is_removed(User, user_id)
+                or identity_map.get(User, user_id) is not None
+            )
+        ):
+            return await self.user_gateway.get_by_id(user_id)
+
+        user = await self.cache.backend.get(UserCache.key(user_id))
+        if user is None:
+            user = await self.cache.single_flight.do(
+                user_id,
+                lambda: self._load(user_id),
+            )
+        return self._merge(copy(user)) if user is not None else None
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Get a user by email."""
+        return await self.user_gateway.get_by_email(email)
+
+    async def get_by_username(self, username: str) -> User | None:
+        """Get a user by username."""
+        return await self.user_gateway.get_by_username(username)
+
+    async def get_many_by_ids(self, user_ids: Collection[UUID]) -> dict[UUID, User]:
+        """Get users by IDs, querying only the ones missing from the cache."""
+        cacheable = {uid for uid in user_ids if uid not in self._written}
+        if self.identity_map is not None:
+            # The gateway serves these from the identity map.
+            identity_map = self.identity_map
+            cacheable = {
+                uid
+                for uid in cacheable
+                if identity_map.get(User, uid) is None
+                and not identity_map.is_removed(User, uid)
+            }
+        cached = await self.cache.backend.get_many(
+            [UserCache.key(uid) for uid in cacheable],
+        )
+        found = {user.id: self._merge(copy(user)) for user in cached.values()}
+
+        missing = set(user_ids) - found.keys()
+        if missing:
+            started = self.cache.start_fill(missing & cacheable)
+            loaded: dict[UUID, User] = {}
+            try:
+                loaded = await self.user_gateway.get_many_by_ids(missing)
+            finally:
+                await self.cache.fill(started, loaded)
+            found.update(loaded)
+        return found
+
+    async def get_many_by_emails(self, emails: Collection[str]) -> dict[str, User]:
+        """Get users by emails."""
+        return await self.user_gateway.get_many_by_emails(emails)
+
+    async def save(self, user: User) -> User:
+        """Create a new user."""
+        self._written.add(user.id)
+        return await self.user_gateway.save(user)
+
+    async def save_many(self, users: Sequence[User]) -> list[User]:
+        """Create many users."""
+        self._written.update(user.id for user in users)
+        return await self.user_gateway.save_many(users)
+
+    async def update(self, user: User) -> User:
+        """Update a user and evict it from the cache after commit."""
+        self._written.add(user.id)
+        self._pending_invalidation.add(user.id)
+        return await self.user_gateway.update(user)
+
+    async def delete(self, user: User) -> None:
+        """Delete a user and evict it from the cache after commit."""
+        self._written.add(user.id)
+        self._pending_invalidation.add(user.id)
+        await self.user_gateway.delete(user)
+
+    async def delete_many(self, user_ids: Collection[UUID]) -> None:
+        """Delete users and evict them from the cache after commit."""
+        self._written.update(user_ids)
+        self._pending_invalidation.update(user_ids)
+        await self.user_gateway.delete_many(user_ids)
+
+    async def after_commit(self) -> None:
+        """Evict every user written in the committed transaction."""
+        pending, self._pending_invalidation = self._pending_invalidation, set()
+        self._written.clear()
+        if pending:
+            await self.cache.evict(pending)
+
+    def after_rollback(self) -> None:
+        """Forget pending evictions; the cached rows are still current."""
+        self._pending_invalidation.clear()
+        self._written.clear()
+
+    def _merge(self, user: User) -> User:
+        if self.identity_map is None:
+            return user
+        return self.identity_map.merge(user)
+
+    async def _load(self, user_id: UUID) -> User | None:
+        started = self.cache.start_fill([user_id])
+        user = None
+        try:
+            user = await self.user_gateway.get_by_id(user_id)
+        finally:
+            await self.cache.fill(started, {user_id: user} if user else {})
+        return user
+
+
+class CacheInvalidatingSession(DBSession):
+    """DBSession that applies cache evictions once a commit succeeds."""
+
+    def __init__(self, session: DBSession, gateway: CachingUserGateway) -> None:
+        self.session = session
+        self.gateway = gateway
+
+    async def commit(self) -> None:
+        """Commit the transaction, then evict written users."""
+        await self.session.commit()
+        await self.gateway.after_commit()
+
+    async def rollback(self) -> None:
+        """Rollback the transaction and drop pending evictions."""
+        await self.session.rollback()
+        self.gateway.after_rollback()
+
+    async def flush(self) -> None:
+        """Flush the current transaction."""
+        await self.session.flush()
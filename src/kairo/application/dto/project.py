@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True, slots=True)
+class GetUserProjectsQuery:
+    """Query for one page of the projects owned by a user."""
+
+    user_id: UUID
+    cursor: str | None = None
+    limit: int = DEFAULT_PAGE_LIMIT
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True, slots=True)
+class GetProjectTasksQuery:
+    """Query for one page of a project's tasks."""
+
+    project_id: UUID
+    cursor: str | None = None
+    limit: int = DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True, slots=True)
+class GetSubtasksQuery:
+    """Query for one page of a task's subtasks."""
+
+    parent_id: UUID
+    cursor: str | None = None
+    limit: int = DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True, slots=True)
+class SearchTasksQuery:
+    """Query for one page of tasks matching a full-text search."""
+
+    text: str
+    cursor: str | None = None
+    limit: int = DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True, slots=True)
+class FindTasksQuery:
+    """Query for one page of tasks matching a Kairo query expression."""
+
+    expression: str
+    cursor: str | None = None
+    limit: int = DEFAULT_PAGE_LIMIT
+
+
+@dataclass(frozen=True, slots=True)
+class ExportProjectTasksQuery:
+    """Query for every task of a project, streamed in id order."""
+
+    project_id: UUID
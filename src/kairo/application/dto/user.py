@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -11,8 +13,27 @@ class CreateUserDTO:
     password: str
 
 
+@dataclass(slots=True)
+class VerifyCredentialsDTO:
+    """Data transfer object for a login attempt."""
+
+    email: str
+    password: str
+
+
 @dataclass(frozen=True, slots=True)
 class GetUserByIdQuery:
     """Query for getting a user by ID."""
 
     user_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class CreateUserResult:
+    """Outcome of creating one user in a bulk request.
+
+    Exactly one of ``user_id`` and ``error`` is set.
+    """
+
+    user_id: UUID | None = None
+    error: str | None = None
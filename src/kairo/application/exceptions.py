@@ -0,0 +1,5 @@
+class ServiceOverloadedError(Exception):
+    """Exception raised when a bounded resource refuses more work.
+
+    The request was valid and may succeed if retried later.
+    """
@@ -1,13 +1,54 @@
 from __future__ import annotations
 
+import inspect
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
 
 TInput = TypeVar("TInput")
 TOutput = TypeVar("TOutput")
 
+# Name of the interactor running in the current task, for diagnostics such
+# as the slow-query log.
+current_interactor: ContextVar[str | None] = ContextVar(
+    "kairo_interactor",
+    default=None,
+)
+
+
+def _named_call(
+    call: Callable[..., Coroutine[Any, Any, Any]],
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    @wraps(call)
+    async def named(self: object, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        token = current_interactor.set(type(self).__name__)
+        try:
+            return await call(self, *args, **kwargs)
+        finally:
+            current_interactor.reset(token)
+
+    return named
+
+
+class _Named:
+    """Publish the subclass name in ``current_interactor`` while it runs."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        call = cls.__dict__.get("__call__")
+        if inspect.iscoroutinefunction(call) and not getattr(
+            call,
+            "__isabstractmethod__",
+            False,
+        ):
+            cls.__call__ = _named_call(call)  # type: ignore[method-assign]
+
 
-class Interactor(Generic[TInput, TOutput], ABC):
+class Interactor(_Named, Generic[TInput, TOutput], ABC):
     """Base class for all interactors."""
 
     @abstractmethod
@@ -15,7 +56,7 @@ class Interactor(Generic[TInput, TOutput], ABC):
         """Execute the interactor."""
 
 
-class Command(Generic[TInput], ABC):
+class Command(_Named, Generic[TInput], ABC):
     """Base class for commands (operations without return values)."""
 
     @abstractmethod
@@ -23,7 +64,7 @@ class Command(Generic[TInput], ABC):
         """Execute the command."""
 
 
-class Query(Generic[TInput, TOutput], ABC):
+class Query(_Named, Generic[TInput, TOutput], ABC):
     """Base class for queries (read-only operations)."""
 
     @abstractmethod
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from kairo.application.dto.project import GetUserProjectsQuery
+from kairo.application.interactors.base import Query
+from kairo.domain.entities.project import Project
+from kairo.domain.gateways.project_gateway import ProjectReader
+from kairo.domain.pagination import Page
+
+
+class GetUserProjectsUseCase(Query[GetUserProjectsQuery, Page[Project]]):
+    """Use case for listing a user's projects page by page."""
+
+    def __init__(self, project_reader: ProjectReader) -> None:
+        self.project_reader = project_reader
+
+    async def __call__(self, query: GetUserProjectsQuery) -> Page[Project]:
+        """Execute the query.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+        return await self.project_reader.get_by_user_id(
+            query.user_id,
+            cursor=query.cursor,
+            limit=query.limit,
+        )
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kairo.application.dto.task import (
+    ExportProjectTasksQuery,
+    FindTasksQuery,
+    GetProjectTasksQuery,
+    GetSubtasksQuery,
+    SearchTasksQuery,
+)
+from kairo.application.interactors.base import Query
+from kairo.domain.entities.task import Task
+from kairo.domain.gateways.task_gateway import TaskReader
+from kairo.domain.pagination import Page
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from uuid import UUID
+
+    from kairo.application.interfaces import GatewayFactory
+
+
+class GetProjectTasksUseCase(Query[GetProjectTasksQuery, Page[Task]]):
+    """Use case for listing a project's tasks page by page."""
+
+    def __init__(self, task_reader: TaskReader) -> None:
+        self.task_reader = task_reader
+
+    async def __call__(self, query: GetProjectTasksQuery) -> Page[Task]:
+        """Execute the query.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+        return await self.task_reader.get_by_project_id(
+            query.project_id,
+            cursor=query.cursor,
+            limit=query.limit,
+        )
+
+
+class GetSubtasksUseCase(Query[GetSubtasksQuery, Page[Task]]):
+    """Use case for listing a task's subtasks page by page."""
+
+    def __init__(self, task_reader: TaskReader) -> None:
+        self.task_reader = task_reader
+
+    async def __call__(self, query: GetSubtasksQuery) -> Page[Task]:
+        """Execute the query.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+        return await self.task_reader.get_by_parent_id(
+            query.parent_id,
+            cursor=query.cursor,
+            limit=query.limit,
+        )
+
+
+class SearchTasksUseCase(Query[SearchTasksQuery, Page[Task]]):
+    """Use case for full-text task search, best matches first."""
+
+    def __init__(self, task_reader: TaskReader) -> None:
+        self.task_reader = task_reader
+
+    async def __call__(self, query: SearchTasksQuery) -> Page[Task]:
+        """Execute the query.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+        return await self.task_reader.search(
+            query.text,
+            cursor=query.cursor,
+            limit=query.limit,
+        )
+
+
+class FindTasksUseCase(Query[FindTasksQuery, Page[Task]]):
+    """Use case for filtering tasks with the Kairo query language."""
+
+    def __init__(self, task_reader: TaskReader) -> None:
+        self.task_reader = task_reader
+
+    async def __call__(self, query: FindTasksQuery) -> Page[Task]:
+        """Execute the query.
+
+        :raises InvalidQueryError: If the expression is invalid.
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+        return await self.task_reader.find(
+            query.expression,
+            cursor=query.cursor,
+            limit=query.limit,
+        )
+
+
+class ExportProjectTasksUseCase:
+    """Use case for streaming all of a project's tasks.
+
+    Not a ``Query``: the result is consumed after the caller returns, so
+    the use case opens its own reader instead of borrowing one, and the
+    reader's session lives exactly as long as the iteration.
+    """
+
+    def __init__(self, open_task_reader: GatewayFactory[TaskReader]) -> None:
+        self.open_task_reader = open_task_reader
+
+    def __call__(self, query: ExportProjectTasksQuery) -> AsyncIterator[Task]:
+        """Iterate over the project's tasks as they are read."""
+        return self._stream(query.project_id)
+
+    async def _stream(self, project_id: UUID) -> AsyncIterator[Task]:
+        async with self.open_task_reader() as task_reader:
+            async for task in task_reader.stream_by_project_id(project_id):
+                yield task
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from kairo.application.dto.user import CreateUserDTO, GetUserByIdQuery
+from collections.abc import Sequence
+
+from kairo.application.dto.user import (
+    CreateUserDTO,
+    CreateUserResult,
+    GetUserByIdQuery,
+    VerifyCredentialsDTO,
+)
 from kairo.application.interactors.base import Interactor, Query
-from kairo.application.interfaces import DBSession
+from kairo.application.interfaces import DBSession, PasswordHasher
 from kairo.domain.entities.user import User
-from kairo.domain.exceptions import DomainError
+from kairo.domain.exceptions import (
+    DomainError,
+    InvalidCredentialsError,
+    UserAlreadyExistsError,
+)
 from kairo.domain.gateways.user_gateway import UserReader, UserWriter
 
 
@@ -26,28 +37,138 @@ class CreateUserUseCase(Interactor[CreateUserDTO, User]):
         self,
         db_session: DBSession,
         user_writer: UserWriter,
-        user_reader: UserReader,
+        password_hasher: PasswordHasher,
     ):
         self.db_session = db_session
         self.user_writer = user_writer
-        self.user_reader = user_reader
+        self.password_hasher = password_hasher
 
     async def __call__(self, user_dto: CreateUserDTO) -> User:
-        """Execute the use case."""
-        if self.user_reader.get_by_email(user_dto.email):
-            msg = f"User with email '{user_dto.email}' already exists."
-            raise DomainError(msg)
+        """Execute the use case.
 
-        if self.user_reader.get_by_username(user_dto.username):
-            msg = f"User with username '{user_dto.username}' already exists."
-            raise DomainError(msg)
+        The password is validated in the clear and stored hashed.
+        Uniqueness of email and username is checked by the insert itself,
+        so creating a user costs a single round trip.
 
+        :raises UserAlreadyExistsError: If the email or username is taken.
+        :raises ServiceOverloadedError: If the password hasher is saturated.
+        """
         user = User(
             email=user_dto.email,
             username=user_dto.username,
             password=user_dto.password,
         )
+        user.password = await self.password_hasher.hash(user_dto.password)
 
         user = await self.user_writer.save(user)
         await self.db_session.commit()
         return user
+
+
+class CreateUsersBulkUseCase(
+    Interactor[Sequence[CreateUserDTO], list[CreateUserResult]],
+):
+    """Use case for creating a chunk of users in one statement.
+
+    Callers import large user lists by feeding it bounded chunks; each chunk
+    is validated, inserted with a single ``save_many`` call and committed.
+    """
+
+    def __init__(
+        self,
+        db_session: DBSession,
+        user_writer: UserWriter,
+        user_reader: UserReader,
+        password_hasher: PasswordHasher,
+    ):
+        self.db_session = db_session
+        self.user_writer = user_writer
+        self.user_reader = user_reader
+        self.password_hasher = password_hasher
+
+    async def __call__(
+        self,
+        user_dtos: Sequence[CreateUserDTO],
+    ) -> list[CreateUserResult]:
+        """Execute the use case.
+
+        :return: One result per DTO, in the same order.
+        :raises ServiceOverloadedError: If the password hasher is saturated.
+        """
+        results: list[CreateUserResult] = [CreateUserResult()] * len(user_dtos)
+        valid: list[tuple[int, User]] = []
+        for index, user_dto in enumerate(user_dtos):
+            user_or_error = _build_user(user_dto)
+            if isinstance(user_or_error, User):
+                valid.append((index, user_or_error))
+            else:
+                results[index] = CreateUserResult(error=user_or_error)
+
+        hashes = await self.password_hasher.hash_many([u.password for _, u in valid])
+        for (_, user), password_hash in zip(valid, hashes, strict=True):
+            user.password = password_hash
+
+        created = {
+            user.id for user in await self.user_writer.save_many([u for _, u in valid])
+        }
+        rejected = [(index, user) for index, user in valid if user.id not in created]
+        # Only pay for the lookup when something conflicted.
+        taken_emails = (
+            await self.user_reader.get_many_by_emails([u.email for _, u in rejected])
+            if rejected
+            else {}
+        )
+
+        for index, user in valid:
+            if user.id in created:
+                results[index] = CreateUserResult(user_id=user.id)
+            elif user.email in taken_emails:
+                error = UserAlreadyExistsError("email", user.email)
+                results[index] = CreateUserResult(error=error.message)
+            else:
+                error = UserAlreadyExistsError("username", user.username)
+                results[index] = CreateUserResult(error=error.message)
+
+        await self.db_session.commit()
+        return results
+
+
+class VerifyCredentialsUseCase(Interactor[VerifyCredentialsDTO, User]):
+    """Use case for checking a user's email and password."""
+
+    def __init__(
+        self,
+        user_reader: UserReader,
+        password_hasher: PasswordHasher,
+    ):
+        self.user_reader = user_reader
+        self.password_hasher = password_hasher
+
+    async def __call__(self, credentials: VerifyCredentialsDTO) -> User:
+        """Execute the use case.
+
+        An unknown email costs the same hashing work as a wrong password,
+        so the two cannot be told apart by timing.
+
+        :return: The user the credentials belong to.
+        :raises InvalidCredentialsError: If they match no user.
+        :raises ServiceOverloadedError: If the password hasher is saturated.
+        """
+        user = await self.user_reader.get_by_email(credentials.email)
+        password_hash = None if user is None else user.password
+        matches = await self.password_hasher.verify(credentials.password, password_hash)
+        if user is None or not matches:
+            raise InvalidCredentialsError
+        return user
+
+
+def _build_user(user_dto: CreateUserDTO) -> User | str:
+    """Build a validated user, or return the validation error message."""
+    try:
+        return User(
+            email=user_dto.email,
+            username=user_dto.username,
+            password=user_dto.password,
+        )
+    except DomainError as exc:
+        return exc.message
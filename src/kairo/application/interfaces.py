@@ -1,6 +1,19 @@
+from __future__ import annotations
+
 from abc import abstractmethod
-from typing import Protocol
-from uuid import UUID
+from typing import TYPE_CHECKING, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from contextlib import AbstractAsyncContextManager
+    from uuid import UUID
+
+    from kairo.application.caching import CacheStats
+    from kairo.domain.entities.base import Identified
+
+V = TypeVar("V")
+E = TypeVar("E", bound="Identified")
+G_co = TypeVar("G_co", covariant=True)
 
 
 class UUIDGenerator(Protocol):
@@ -11,7 +24,10 @@ class UUIDGenerator(Protocol):
 
 
 class DBSession(Protocol):
-    """Database session interface."""
+    """Database session interface.
+
+    Gateway writes may be deferred until ``flush`` or ``commit``.
+    """
 
     @abstractmethod
     async def commit(self) -> None:
@@ -24,3 +40,90 @@ class DBSession(Protocol):
     @abstractmethod
     async def flush(self) -> None:
         """Flush the current transaction."""
+
+
+class IdentityMap(Protocol):
+    """The entities a unit of work has loaded, one object per id."""
+
+    @abstractmethod
+    def get(self, entity_type: type[E], entity_id: UUID) -> E | None:
+        """Return the entity already loaded, if any."""
+
+    @abstractmethod
+    def is_removed(self, entity_type: type, entity_id: UUID) -> bool:
+        """Tell whether the entity was deleted and not yet flushed."""
+
+    @abstractmethod
+    def merge(self, entity: E) -> E:
+        """Return the loaded entity with this id, mapping ``entity`` if new."""
+
+
+class PasswordHasher(Protocol):
+    """Password hashing interface.
+
+    Hashing is deliberately slow, so implementations keep it off the event
+    loop and may refuse work when they are saturated.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Hash a password with a fresh salt.
+
+        :raises ServiceOverloadedError: If no more work can be queued.
+        """
+
+    @abstractmethod
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """Hash several passwords, in order.
+
+        :raises ServiceOverloadedError: If no more work can be queued.
+        """
+
+    @abstractmethod
+    async def verify(self, password: str, password_hash: str | None) -> bool:
+        """Check a password against a stored hash.
+
+        With no hash, as for an unknown user, the same work is done and
+        False returned, so the response time does not reveal the miss.
+
+        :raises ServiceOverloadedError: If no more work can be queued.
+        """
+
+
+class GatewayFactory(Protocol[G_co]):
+    """Opens a gateway on a session of its own.
+
+    For work that outlives the request's session, such as a response body
+    streamed after the handler has returned.
+    """
+
+    def __call__(self) -> AbstractAsyncContextManager[G_co]:
+        """Open the gateway; its session closes when the context exits."""
+
+
+class Cache(Protocol[V]):
+    """Key-value cache interface."""
+
+    @abstractmethod
+    async def get(self, key: str) -> V | None:
+        """Return the cached value, or None on a miss."""
+
+    @abstractmethod
+    async def get_many(self, keys: Collection[str]) -> dict[str, V]:
+        """Return the cached values for the keys that are present."""
+
+    @abstractmethod
+    async def set(self, key: str, value: V) -> None:
+        """Store a value under the cache's configured time-to-live."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove the given keys."""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counters."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release any resources held by the cache."""
@@ -0,0 +1,146 @@
+"""Request-scoped batching loaders.
+
+A loader collects every key requested during the current event-loop tick
+and resolves them with one batched call, so N concurrent lookups cost one
+query instead of N. Results are memoized for the lifetime of the loader,
+which is meant to be one request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection, Hashable, Mapping
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from kairo.domain.gateways.user_gateway import UserReader
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from kairo.domain.entities.user import User
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesce concurrent single-key loads into batched calls."""
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int | None = None,
+    ) -> None:
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._dispatch_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Load a single value, batching it with other loads of this tick."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+        # Shield the shared future so one cancelled caller does not cancel
+        # the result for everyone else waiting on the same key.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Collection[K]) -> dict[K, V]:
+        """Load several values at once, skipping keys without a value."""
+        unique_keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(key) for key in unique_keys))
+        return {
+            key: value
+            for key, value in zip(unique_keys, values, strict=True)
+            if value is not None
+        }
+
+    def prime(self, key: K, value: V) -> None:
+        """Store a known value so later loads skip the batch call."""
+        future = self._futures.get(key)
+        if future is not None and not future.done():
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget a memoized value so the next load fetches it again."""
+        future = self._futures.get(key)
+        if future is not None and future.done():
+            del self._futures[key]
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        self._dispatch_scheduled = False
+        size = self._max_batch_size or len(queue)
+        for start in range(0, len(queue), size):
+            task = asyncio.create_task(self._resolve(queue[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, keys: list[K]) -> None:
+        try:
+            values = await self._batch_load(keys)
+        except Exception as exc:  # noqa: BLE001
+            for key in keys:
+                # Failures are not memoized; the next load retries.
+                future = self._futures.pop(key)
+                future.set_exception(exc)
+                # Mark the exception as retrieved in case nobody awaits it.
+                future.exception()
+            return
+        for key in keys:
+            self._futures[key].set_result(values.get(key))
+
+
+class BatchedUserReader(UserReader):
+    """UserReader that batches and deduplicates lookups by id.
+
+    Concurrent ``get_by_id`` calls within one event-loop tick are resolved
+    with a single ``get_many_by_ids`` call on the wrapped reader. Create one
+    instance per request.
+    """
+
+    def __init__(self, user_reader: UserReader) -> None:
+        self.user_reader = user_reader
+        self.loader: DataLoader[UUID, User] = DataLoader(
+            user_reader.get_many_by_ids,
+        )
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        """Get a user by ID, batched with other lookups of this tick."""
+        return await self.loader.load(user_id)
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Get a user by email."""
+        user = await self.user_reader.get_by_email(email)
+        if user is not None:
+            self.loader.prime(user.id, user)
+        return user
+
+    async def get_by_username(self, username: str) -> User | None:
+        """Get a user by username."""
+        user = await self.user_reader.get_by_username(username)
+        if user is not None:
+            self.loader.prime(user.id, user)
+        return user
+
+    async def get_many_by_ids(self, user_ids: Collection[UUID]) -> dict[UUID, User]:
+        """Get users by IDs, reusing already loaded users."""
+        return await self.loader.load_many(user_ids)
+
+    async def get_many_by_emails(self, emails: Collection[str]) -> dict[str, User]:
+        """Get users by emails."""
+        users = await self.user_reader.get_many_by_emails(emails)
+        for user in users.values():
+            self.loader.prime(user.id, user)
+        return users
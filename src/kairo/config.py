@@ -0,0 +1,257 @@
+"""Typed settings read from ``KAIRO_*`` environment variables and a file.
+
+Every setting has an environment variable, ``KAIRO_<SECTION>_<NAME>``.
+Settings not in the environment are looked up in the TOML file named by
+``KAIRO_CONFIG_FILE``, if any, where the same setting is ``name`` in the
+``[section]`` table; ``KAIRO_DATABASE_POOL_SIZE`` is ``pool_size`` under
+``[database]``. Whatever neither sets keeps its default.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Literal, Self, cast
+
+import tomllib
+
+ENV_PREFIX = "KAIRO_"
+CONFIG_FILE_ENV = f"{ENV_PREFIX}CONFIG_FILE"
+
+
+@cache
+def _file_values(path: str) -> dict[str, str]:
+    # Parsed once per path, not once per setting.
+    with Path(path).open("rb") as file:
+        data = tomllib.load(file)
+    values = {}
+    for section, table in data.items():
+        if not isinstance(table, dict):
+            msg = f"{path}: {section!r} must be a [section] table."
+            raise ValueError(msg)  # noqa: TRY004
+        for key, value in table.items():
+            text = str(value).lower() if isinstance(value, bool) else str(value)
+            values[f"{section}_{key}".upper()] = text
+    return values
+
+
+def _lookup(name: str) -> str | None:
+    value = os.environ.get(f"{ENV_PREFIX}{name}")
+    if value is None and (path := os.environ.get(CONFIG_FILE_ENV)):
+        value = _file_values(path).get(name)
+    return value
+
+
+def _env(name: str, default: str) -> str:
+    value = _lookup(name)
+    return default if value is None else value
+
+
+def _env_bool(name: str, *, default: bool) -> bool:
+    value = _lookup(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DatabaseConfig:
+    """Database connection and connection pool settings.
+
+    Attributes
+    ----------
+        url (str): SQLAlchemy async database URL.
+        pool_size (int): Number of connections kept open in the pool.
+        max_overflow (int): Connections allowed above pool_size under load.
+        pool_timeout (float): Seconds to wait for a free connection.
+        pool_recycle (int): Seconds after which a connection is replaced.
+        pool_pre_ping (bool): Whether to test connections on checkout.
+        echo (bool): Whether to log emitted SQL.
+        slow_query_threshold (float): Seconds from which a statement is
+            logged as slow, with its route and interactor; 0 disables.
+
+    """
+
+    url: str = "sqlite+aiosqlite:///database.db"
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    echo: bool = False
+    slow_query_threshold: float = 0.5
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build the config from ``KAIRO_DATABASE_*`` environment variables."""
+        defaults = cls()
+        return cls(
+            url=_env("DATABASE_URL", defaults.url),
+            pool_size=int(_env("DATABASE_POOL_SIZE", str(defaults.pool_size))),
+            max_overflow=int(
+                _env("DATABASE_MAX_OVERFLOW", str(defaults.max_overflow)),
+            ),
+            pool_timeout=float(
+                _env("DATABASE_POOL_TIMEOUT", str(defaults.pool_timeout)),
+            ),
+            pool_recycle=int(
+                _env("DATABASE_POOL_RECYCLE", str(defaults.pool_recycle)),
+            ),
+            pool_pre_ping=_env_bool(
+                "DATABASE_POOL_PRE_PING",
+                default=defaults.pool_pre_ping,
+            ),
+            echo=_env_bool("DATABASE_ECHO", default=defaults.echo),
+            slow_query_threshold=float(
+                _env(
+                    "DATABASE_SLOW_QUERY_THRESHOLD",
+                    str(defaults.slow_query_threshold),
+                ),
+            ),
+        )
+
+
+CacheBackend = Literal["none", "memory", "redis"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheConfig:
+    """Read-through cache settings.
+
+    Attributes
+    ----------
+        backend (str): ``"memory"``, ``"redis"`` or ``"none"`` to disable.
+        url (str): Redis URL, used by the ``redis`` backend.
+        max_size (int): Entry limit of the in-process backend.
+        ttl (float): Seconds an entry stays valid.
+
+    """
+
+    backend: CacheBackend = "memory"
+    url: str = "redis://localhost:6379/0"
+    max_size: int = 10_000
+    ttl: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build the config from ``KAIRO_CACHE_*`` environment variables."""
+        defaults = cls()
+        backend = _env("CACHE_BACKEND", defaults.backend)
+        if backend not in {"none", "memory", "redis"}:
+            msg = f"Unknown cache backend: {backend!r}"
+            raise ValueError(msg)
+        return cls(
+            backend=cast("CacheBackend", backend),
+            url=_env("CACHE_URL", defaults.url),
+            max_size=int(_env("CACHE_MAX_SIZE", str(defaults.max_size))),
+            ttl=float(_env("CACHE_TTL", str(defaults.ttl))),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHashConfig:
+    """scrypt cost parameters and the hashing worker pool.
+
+    Attributes
+    ----------
+        n (int): CPU and memory cost; a power of two.
+        r (int): Block size.
+        p (int): Parallelization.
+        workers (int): Worker processes hashing passwords.
+        max_pending (int): Hashing jobs allowed to wait or run at once
+            before new ones are rejected.
+
+    """
+
+    n: int = 2**14
+    r: int = 8
+    p: int = 1
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    max_pending: int = 64
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build the config from ``KAIRO_PASSWORD_*`` environment variables."""
+        defaults = cls()
+        return cls(
+            n=int(_env("PASSWORD_SCRYPT_N", str(defaults.n))),
+            r=int(_env("PASSWORD_SCRYPT_R", str(defaults.r))),
+            p=int(_env("PASSWORD_SCRYPT_P", str(defaults.p))),
+            workers=int(_env("PASSWORD_WORKERS", str(defaults.workers))),
+            max_pending=int(
+                _env("PASSWORD_MAX_PENDING", str(defaults.max_pending)),
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ServerConfig:
+    """HTTP server settings for ``kairo serve``.
+
+    Attributes
+    ----------
+        host (str): Interface to listen on.
+        port (int): Port to listen on.
+        workers (int): Worker processes accepting connections.
+        keep_alive (int): Seconds an idle keep-alive connection stays open.
+        max_requests (int): Requests after which a worker is replaced by a
+            fresh one; 0 never replaces workers.
+        graceful_timeout (int): Seconds a stopping worker waits for
+            in-flight requests before closing them.
+        backlog (int): Connections the socket queues before refusing.
+        access_log (bool): Log every request.
+
+    """
+
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    keep_alive: int = 5
+    max_requests: int = 10_000
+    graceful_timeout: int = 30
+    backlog: int = 2048
+    access_log: bool = False
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build the config from ``KAIRO_SERVER_*`` environment variables."""
+        defaults = cls()
+        return cls(
+            host=_env("SERVER_HOST", defaults.host),
+            port=int(_env("SERVER_PORT", str(defaults.port))),
+            workers=int(_env("SERVER_WORKERS", str(defaults.workers))),
+            keep_alive=int(_env("SERVER_KEEP_ALIVE", str(defaults.keep_alive))),
+            max_requests=int(
+                _env("SERVER_MAX_REQUESTS", str(defaults.max_requests)),
+            ),
+            graceful_timeout=int(
+                _env("SERVER_GRACEFUL_TIMEOUT", str(defaults.graceful_timeout)),
+            ),
+            backlog=int(_env("SERVER_BACKLOG", str(defaults.backlog))),
+            access_log=_env_bool("SERVER_ACCESS_LOG", default=defaults.access_log),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Settings:
+    """Every setting of the application, by section."""
+
+    database: DatabaseConfig
+    cache: CacheConfig
+    password: PasswordHashConfig
+    server: ServerConfig
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build every section from the environment and the config file.
+
+        :raises ValueError: If a setting has a value of the wrong type.
+        """
+        return cls(
+            database=DatabaseConfig.from_env(),
+            cache=CacheConfig.from_env(),
+            password=PasswordHashConfig.from_env(),
+            server=ServerConfig.from_env(),
+        )
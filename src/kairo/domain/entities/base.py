@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import MISSING, fields
+from itertools import islice
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Protocol, TypeVar, overload
+
+from kairo.domain.exceptions import CollectionNotLoadedError
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from uuid import UUID
+
+    from kairo.domain.pagination import Page
+
+
+class Identified(Protocol):
+    """Anything with a UUID ``id``."""
+
+    @property
+    def id(self) -> UUID:
+        """Unique identifier."""
+
+
+E = TypeVar("E", bound=Identified)
+T = TypeVar("T")
+
+
+class ChangeTracking:
+    """Mixin for entities that know which of their fields changed since load.
+
+    ``mark_saved`` records the values of ``tracked_fields``, and gateways
+    call it whenever an entity is restored from or written to storage.
+    ``changed_fields`` compares the current values against that record, so
+    a write can set only the columns that changed. An entity that was never
+    saved reports every tracked field as changed.
+
+    The record lives in a slot of its own rather than a dataclass field, so
+    it stays out of ``__init__``, ``repr``, comparisons and serialization.
+    """
+
+    __slots__ = ("_saved",)
+
+    tracked_fields: ClassVar[tuple[str, ...]] = ()
+    _saved: tuple[Any, ...]
+
+    def changed_fields(self) -> dict[str, Any]:
+        """Return the tracked fields changed since the last save, by name."""
+        names = self.tracked_fields
+        try:
+            saved = self._saved
+        except AttributeError:
+            return {name: getattr(self, name) for name in names}
+        changed = {}
+        for name, old in zip(names, saved, strict=True):
+            value = getattr(self, name)
+            if value != old:
+                changed[name] = value
+        return changed
+
+    def mark_saved(self) -> None:
+        """Record the current values as the stored ones."""
+        self._saved = tuple(getattr(self, name) for name in self.tracked_fields)
+
+
+def trusted_constructor(cls: type[T]) -> Callable[..., T]:
+    """Build a constructor for a dataclass that skips ``__post_init__``.
+
+    Meant for the infrastructure mappers only, which restore entities from
+    rows that were validated when they were written. The constructor takes
+    the dataclass fields as keyword arguments and fills omitted ones from
+    their defaults, like the generated ``__init__``, but runs none of the
+    entity's checks. Everything else must construct entities normally.
+    Entities with ``ChangeTracking`` come back marked as saved.
+    """
+    namespace: dict[str, Any] = {"cls": cls, "new": object.__new__, "MISSING": MISSING}
+    params = []
+    body = ["    entity = new(cls)"]
+    for f in fields(cls):  # type: ignore[arg-type]
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            params.append(f"{f.name}=_default_{f.name}")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            params.append(f"{f.name}=MISSING")
+            body.append(
+                f"    if {f.name} is MISSING: {f.name} = _factory_{f.name}()",
+            )
+        else:
+            params.append(f.name)
+        body.append(f"    entity.{f.name} = {f.name}")
+    if issubclass(cls, ChangeTracking):
+        values = "".join(f"entity.{name}, " for name in cls.tracked_fields)
+        body.append(f"    entity._saved = ({values})")
+    source = "\n".join(
+        [f"def construct(*, {', '.join(params)}):", *body, "    return entity"],
+    )
+    exec(source, namespace)  # noqa: S102
+    construct: Callable[..., T] = namespace["construct"]
+    construct.__qualname__ = f"trusted_constructor({cls.__qualname__})"
+    return construct
+
+
+class PageLoader(Protocol[E]):
+    """Fetch one keyset page of entities, as the gateway readers do."""
+
+    async def __call__(self, *, cursor: str | None, limit: int) -> Page[E]:
+        """Return the page after ``cursor``."""
+
+
+class EntityCollection(Sequence[E]):
+    """Insertion-ordered collection of entities keyed by id.
+
+    Membership, lookup, add and remove by id are O(1). The collection
+    iterates, indexes and compares like a list of its entities, so code
+    written against ``list`` keeps working; positional indexing walks the
+    collection and is meant for occasional use only.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, entities: Iterable[E] = ()) -> None:
+        self._items: dict[UUID, E] = {}
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity: E) -> None:
+        """Append an entity.
+
+        :raises ValueError: If an entity with the same id is already present.
+        """
+        if entity.id in self._items:
+            msg = f"Entity with id {entity.id} is already in the collection."
+            raise ValueError(msg)
+        self._items[entity.id] = entity
+
+    def get(self, entity_id: UUID) -> E | None:
+        """Return the entity with the given id, or None."""
+        return self._items.get(entity_id)
+
+    def remove(self, entity_id: UUID) -> E:
+        """Remove and return the entity with the given id.
+
+        :raises KeyError: If no entity has the given id.
+        """
+        return self._items.pop(entity_id)
+
+    def ids(self) -> list[UUID]:
+        """Return the ids of the entities, in insertion order."""
+        return list(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        """Check membership by entity or by id."""
+        entity_id = getattr(item, "id", item)
+        try:
+            return entity_id in self._items
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[E]:
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> E: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[E]: ...
+
+    def __getitem__(self, index: int | slice) -> E | list[E]:
+        if isinstance(index, slice):
+            return list(self._items.values())[index]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            msg = "EntityCollection index out of range"
+            raise IndexError(msg)
+        return next(islice(self._items.values(), index, None))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EntityCollection):
+            return list(self._items.values()) == list(other._items.values())
+        if isinstance(other, list):
+            return list(self._items.values()) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items.values())!r})"
+
+
+class LazyEntityCollection(Generic[E]):
+    """Entity collection that loads on demand and records its changes.
+
+    Without a loader the collection starts loaded and empty, as for a new
+    aggregate. With a loader nothing is fetched until ``load`` is awaited
+    or the collection is iterated with ``async for``, which streams it
+    page by page without keeping it in memory.
+
+    Adds and removes are accepted in either state and recorded in
+    ``added`` and ``removed``, so a writer only has to persist the
+    difference and then call ``mark_saved``. Before loading, duplicate and
+    existence checks only see changes made since; the database enforces
+    the rest.
+    """
+
+    __slots__ = ("_added", "_items", "_loader", "_page_size", "_removed")
+
+    def __init__(
+        self,
+        entities: Iterable[E] = (),
+        *,
+        loader: PageLoader[E] | None = None,
+        page_size: int = DEFAULT_PAGE_LIMIT,
+    ) -> None:
+        self._loader = loader
+        self._page_size = page_size
+        self._items: EntityCollection[E] | None = None
+        self._added: dict[UUID, E] = {}
+        self._removed: set[UUID] = set()
+        if loader is None:
+            self._items = EntityCollection()
+            for entity in entities:
+                self.add(entity)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the entities are in memory."""
+        return self._items is not None
+
+    @property
+    def added(self) -> list[E]:
+        """Entities added since the last save, in insertion order."""
+        return list(self._added.values())
+
+    @property
+    def removed(self) -> list[UUID]:
+        """Ids of entities removed since the last save."""
+        return list(self._removed)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything was added or removed since the last save."""
+        return bool(self._added or self._removed)
+
+    def mark_saved(self) -> None:
+        """Forget the recorded changes once they have been persisted."""
+        self._added.clear()
+        self._removed.clear()
+
+    async def load(self) -> EntityCollection[E]:
+        """Load every entity, applying unsaved changes, and return them."""
+        if self._items is None:
+            items: EntityCollection[E] = EntityCollection()
+            async for entity in self:
+                items.add(entity)
+            self._items = items
+        return self._items
+
+    async def __aiter__(self) -> AsyncIterator[E]:
+        if self._items is not None:
+            for entity in list(self._items):
+                yield entity
+            return
+        if self._loader is not None:
+            cursor: str | None = None
+            while True:
+                page = await self._loader(cursor=cursor, limit=self._page_size)
+                for entity in page.items:
+                    if entity.id not in self._removed and entity.id not in self._added:
+                        yield entity
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+        for entity in list(self._added.values()):
+            yield entity
+
+    def add(self, entity: E) -> None:
+        """Add an entity and record it as added.
+
+        :raises ValueError: If an entity with the same id is known to be
+            present already.
+        """
+        if self._items is not None:
+            self._items.add(entity)
+        elif entity.id in self._added:
+            msg = f"Entity with id {entity.id} is already in the collection."
+            raise ValueError(msg)
+        if entity.id in self._removed:
+            # Removed and re-added before saving: it is still stored.
+            self._removed.discard(entity.id)
+        else:
+            self._added[entity.id] = entity
+
+    def remove(self, entity_id: UUID) -> None:
+        """Remove an entity by id and record it as removed.
+
+        :raises KeyError: If the entity is known not to be present.
+        """
+        if self._items is not None:
+            self._items.remove(entity_id)
+        elif entity_id in self._removed:
+            raise KeyError(entity_id)
+        if self._added.pop(entity_id, None) is None:
+            self._removed.add(entity_id)
+
+    def __contains__(self, item: object) -> bool:
+        """Check membership; before loading only unsaved changes are seen."""
+        if self._items is not None:
+            return item in self._items
+        entity_id = getattr(item, "id", item)
+        return entity_id in self._added
+
+    def loaded(self) -> EntityCollection[E]:
+        """Return the loaded entities.
+
+        :raises CollectionNotLoadedError: If the collection is not loaded.
+        """
+        if self._items is None:
+            msg = "Collection is not loaded; await load() or use async for."
+            raise CollectionNotLoadedError(msg)
+        return self._items
+
+    def get(self, entity_id: UUID) -> E | None:
+        """Return a loaded entity by id, or None."""
+        return self.loaded().get(entity_id)
+
+    def __iter__(self) -> Iterator[E]:
+        return iter(self.loaded())
+
+    def __len__(self) -> int:
+        return len(self.loaded())
+
+    def __getitem__(self, index: int) -> E:
+        return self.loaded()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if self._items is None:
+            return self is other
+        if isinstance(other, LazyEntityCollection):
+            return other.is_loaded and self._items == other.loaded()
+        return self._items == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if self._items is None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return f"{type(self).__name__}({list(self._items)!r})"
@@ -1,16 +1,17 @@
 from dataclasses import dataclass, field
-from typing import Self
+from typing import ClassVar, Self
 from uuid import UUID
 
 from uuid_extensions import uuid7
 
+from kairo.domain.entities.base import ChangeTracking, LazyEntityCollection
 from kairo.domain.entities.task import Task
 from kairo.domain.entities.user import User
 from kairo.domain.exceptions import ProjectValidationError
 
 
 @dataclass(slots=True, kw_only=True)
-class Project:
+class Project(ChangeTracking):
     """Represents a project entity.
 
     Attributes
@@ -19,6 +20,11 @@ class Project:
         name (str): Name of the project.
         description (str): Description of the project.
         owner (User): Owner of the project, represented by a User instance.
+        tasks (LazyEntityCollection[Task]): Tasks of the project, keyed by
+            id. Loaded on demand and tracking added and removed tasks.
+
+    Changes to the name, description and owner are tracked, see
+    ``ChangeTracking``.
 
     Raises
     ------
@@ -27,11 +33,13 @@ class Project:
 
     """
 
+    tracked_fields: ClassVar[tuple[str, ...]] = ("name", "description", "owner")
+
     id: UUID = field(default_factory=lambda: uuid7())
     name: str
     description: str
     owner: User
-    tasks: list[Task] = field(default_factory=list)
+    tasks: LazyEntityCollection[Task] = field(default_factory=LazyEntityCollection)
 
     def __post_init__(self: Self) -> None:
         if not self.id:
@@ -58,22 +66,34 @@ class Project:
     def add_task(self: Self, task: Task) -> None:
         """Add a task to the project.
 
+        The tasks do not have to be loaded; the task is recorded as added
+        and written when the project is saved.
+
         :param task: The task to add.
-        :raises DomainValidationException: If the task is not an instance of Task.
+        :raises ProjectValidationError: If the task belongs to another
+          project or a task with the same id already exists in the project.
         """
-        self.tasks.append(task)
+        if task.project_id is not None and task.project_id != self.id:
+            msg = f"Task with ID {task.id} belongs to another project."
+            raise ProjectValidationError(msg)
+        if task.id in self.tasks:
+            msg = f"Task with ID {task.id} already exists in the project."
+            raise ProjectValidationError(msg)
+        task.project_id = self.id
+        self.tasks.add(task)
 
-    def remove_task(self: Self, task_id: str) -> None:
+    def remove_task(self: Self, task_id: UUID) -> None:
         """Remove a task from the project by its ID.
 
+        The tasks do not have to be loaded; the task is recorded as removed
+        and deleted when the project is saved.
+
         :param task_id: ID of the task to remove.
-        :raises DomainValidationException: If the task with the given
+        :raises ProjectValidationError: If the task with the given
           ID does not exist in the project.
         """
-        task_to_remove = next((task for task in self.tasks if task.id == task_id), None)
-        if not task_to_remove:
+        try:
+            self.tasks.remove(task_id)
+        except KeyError:
             msg = f"Task with ID {task_id} does not exist in the project."
-            raise ProjectValidationError(
-                msg,
-            )
-        self.tasks.remove(task_to_remove)
+            raise ProjectValidationError(msg) from None
@@ -1,21 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import ClassVar
+from uuid import UUID
 
 from uuid_extensions import uuid7
 
+from kairo.domain.entities.base import ChangeTracking, EntityCollection
 from kairo.domain.exceptions import (
     DomainError,
     TaskValidationError,
 )
 
-if TYPE_CHECKING:
-    from uuid import UUID
-
 
 @dataclass(slots=True, kw_only=True)
-class Task:
+class Task(ChangeTracking):
     """Represents a task in the system.
 
     Attributes
@@ -23,17 +22,29 @@ class Task:
         id (UUID): Unique identifier for the task, generated using uuid7.
         name (str): Name of the task.
         description (str): Description of the task.
+        project_id (UUID | None): Identifier of the project the task belongs to.
         parent_id (UUID | None): Identifier of the parent task, if any.
-        subtasks (list[Task]): List of subtasks associated with this task.
+        subtasks (EntityCollection[Task]): Subtasks of this task, keyed by id.
+
+    Changes to every field but the subtasks are tracked, see
+    ``ChangeTracking``.
 
     """
 
+    tracked_fields: ClassVar[tuple[str, ...]] = (
+        "name",
+        "description",
+        "project_id",
+        "parent_id",
+    )
+
     id: UUID = field(default_factory=lambda: uuid7())
     name: str
     description: str
+    project_id: UUID | None = field(default=None)
     parent_id: UUID | None = field(default=None)
 
-    subtasks: list[Task] = field(default_factory=list)
+    subtasks: EntityCollection[Task] = field(default_factory=EntityCollection)
 
     def __post_init__(self) -> None:
         if not self.name:
@@ -55,14 +66,14 @@ class Task:
             msg = "Subtask's parent_id must match the task's id."
             raise TaskValidationError(msg)
 
-        if subtask.id in [s.id for s in self.subtasks]:
+        if subtask.id in self.subtasks:
             msg = "Subtask with the same id already exists in this task."
             raise TaskValidationError(msg)
 
         if subtask.parent_id is None:
             subtask.parent_id = self.id
 
-        self.subtasks.append(subtask)
+        self.subtasks.add(subtask)
 
     def remove_subtask(self, subtask_id: UUID) -> None:
         """Remove a subtask from the task.
@@ -71,10 +82,7 @@ class Task:
         :raises DomainException: If the subtask with the given id
             does not exist in this task.
         """
-        for subtask in self.subtasks:
-            if subtask.id == subtask_id:
-                self.subtasks.remove(subtask)
-                return
-
-        msg = "Subtask with the given id does not exist in this task."
-        raise DomainError(msg)
+        if subtask_id not in self.subtasks:
+            msg = "Subtask with the given id does not exist in this task."
+            raise DomainError(msg)
+        self.subtasks.remove(subtask_id)
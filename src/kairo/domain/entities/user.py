@@ -1,17 +1,19 @@
 import re
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import ClassVar
 from uuid import UUID
 
 from uuid_extensions import uuid7
 
+from kairo.domain.entities.base import ChangeTracking
 from kairo.domain.exceptions import UserValidationError
 
 PASSWORD_LENGTH = 8
 
 
 @dataclass(slots=True, kw_only=True)
-class User:
+class User(ChangeTracking):
     """Represents a user entity.
 
     Attributes
@@ -20,17 +22,24 @@ class User:
         username (str): Username of the user.
         email (str): Email address of the user.
         password (str): Password of the user.
+        created_at (datetime): When the user was created.
+        updated_at (datetime): When the user was last updated.
+
+    Changes to the username, email and password are tracked, see
+    ``ChangeTracking``.
 
     """
 
+    tracked_fields: ClassVar[tuple[str, ...]] = ("username", "email", "password")
+
     id: UUID = field(default_factory=lambda: uuid7())
 
     username: str
     email: str
     password: str
 
-    created_at: datetime
-    updated_at: datetime
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def __post_init__(self) -> None:
         if not self.id:
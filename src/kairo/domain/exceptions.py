@@ -26,3 +26,31 @@ class ProjectValidationError(DomainValidationError):
 
 class TaskValidationError(DomainValidationError):
     """Exception raised for validation errors related to tasks."""
+
+
+class UserAlreadyExistsError(DomainError):
+    """Exception raised when a user with the same email or username exists."""
+
+    def __init__(self, field: str, value: str) -> None:
+        super().__init__(f"User with {field} '{value}' already exists.")
+        self.field = field
+        self.value = value
+
+
+class InvalidCredentialsError(DomainError):
+    """Exception raised when a login does not match any user's password."""
+
+    def __init__(self) -> None:
+        super().__init__("Invalid email or password.")
+
+
+class InvalidCursorError(DomainValidationError):
+    """Exception raised for malformed pagination cursors or page sizes."""
+
+
+class InvalidQueryError(DomainValidationError):
+    """Exception raised for task queries that are malformed or unindexable."""
+
+
+class CollectionNotLoadedError(DomainError):
+    """Exception raised when a lazy collection is read before it is loaded."""
@@ -2,34 +2,56 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from uuid import UUID
 
     from kairo.domain.entities.project import Project
+    from kairo.domain.pagination import Page
 
 
 class ProjectReader(Protocol):
     """ProjectReader defines the interface for reading project-related data."""
 
-    def get_by_id(self, project_id: UUID) -> Project | None:
+    async def get_by_id(self, project_id: UUID) -> Project | None:
         """Retrieve a project by its unique identifier."""
 
-    def get_by_user_id(self, user_id: UUID) -> list[Project]:
-        """Retrieve all projects owned by a specific user."""
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Project]:
+        """Retrieve one page of the projects owned by a specific user.
+
+        Projects are ordered by id. Pass the previous page's
+        ``next_cursor`` to continue after it.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
 
 
 class ProjectWriter(Protocol):
     """ProjectWriter defines the interface for writing project-related data."""
 
-    def create(self, project: Project) -> Project:
+    async def create(self, project: Project) -> Project:
         """Create a new project."""
 
-    def update(self, project: Project) -> Project:
+    async def update(self, project: Project) -> Project:
         """Update an existing project."""
 
-    def delete(self, project: Project) -> None:
+    async def delete(self, project: Project) -> None:
         """Delete a project by its unique identifier."""
 
+    async def delete_many(self, project_ids: Collection[UUID]) -> None:
+        """Delete the projects with these identifiers, and their tasks.
+
+        Unknown identifiers are ignored.
+        """
+
 
 class ProjectGateway(ProjectReader, ProjectWriter, Protocol):
     """ProjectGateway defines the interface for project-related operations."""
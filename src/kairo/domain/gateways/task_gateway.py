@@ -2,37 +2,151 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Collection, Sequence
     from uuid import UUID
 
     from kairo.domain.entities.task import Task
+    from kairo.domain.pagination import Page
 
 
 class TaskReader(Protocol):
-    """TaskReader defines the interface for reading user-related data."""
+    """TaskReader defines the interface for reading task-related data."""
 
-    def get_by_id(self, task_id: UUID) -> Task | None:
+    async def get_by_id(self, task_id: UUID) -> Task | None:
         """Retrieve a task by its unique identifier."""
 
-    def get_by_project_id(self, project_id: UUID) -> list[Task]:
-        """Retrieve all tasks belonging to a specific project."""
+    async def get_by_project_id(
+        self,
+        project_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Retrieve one page of the tasks belonging to a specific project.
+
+        Tasks are ordered by id. Pass the previous page's ``next_cursor``
+        to continue after it.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+
+    def stream_by_project_id(self, project_id: UUID) -> AsyncIterator[Task]:
+        """Stream every task of a project in id order.
+
+        Rows are fetched from the database in batches as the caller
+        iterates, so the project is never held in memory as a whole.
+        """
+
+    async def get_by_parent_id(
+        self,
+        parent_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Retrieve one page of the subtasks of a specific parent task.
+
+        Subtasks are ordered by id. Pass the previous page's
+        ``next_cursor`` to continue after it.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+
+    async def get_tree(
+        self,
+        task_id: UUID,
+        max_depth: int | None = None,
+    ) -> Task | None:
+        """Retrieve a task with its subtasks nested down to ``max_depth``.
+
+        A depth of 0 returns the task alone, 1 adds its direct subtasks and
+        so on; None loads the whole subtree. Subtasks are ordered by id.
+        """
+
+    async def get_descendants(
+        self,
+        task_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Retrieve one page of all tasks below a task, at any depth.
+
+        Descendants are ordered by id.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
 
-    def get_by_parent_id(self, parent_id: UUID) -> list[Task]:
-        """Retrieve all subtasks of a specific parent task."""
+    async def get_ancestors(self, task_id: UUID) -> list[Task]:
+        """Retrieve the ancestors of a task, from the root down to its parent."""
+
+    async def search(
+        self,
+        query: str,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Retrieve one page of the tasks whose name or description match.
+
+        Every word of ``query`` has to match. Tasks are ordered by
+        relevance, best first; a query without words matches nothing.
+
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
+
+    async def find(
+        self,
+        query: str,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Retrieve one page of the tasks matching a Kairo query.
+
+        ``query`` is a filter such as ``project = <id> AND parent IS
+        EMPTY``, optionally followed by ``ORDER BY created [ASC|DESC]``;
+        an empty query matches every task.
+
+        :raises InvalidQueryError: If the query is malformed or cannot be
+            answered from an index.
+        :raises InvalidCursorError: If the cursor or limit is invalid.
+        """
 
 
 class TaskWriter(Protocol):
     """TaskWriter defines the interface for writing task-related data."""
 
-    def create(self, task: Task) -> Task:
+    async def create(self, task: Task) -> Task:
         """Create a new task."""
 
-    def update(self, task: Task) -> Task:
-        """Update an existing task."""
+    async def create_many(self, tasks: Sequence[Task]) -> list[Task]:
+        """Create many tasks at once.
 
-    def delete(self, task: Task) -> None:
+        Parents may be existing tasks or tasks earlier in ``tasks``.
+        """
+
+    async def update(self, task: Task) -> Task:
+        """Update an existing task.
+
+        Changing ``parent_id`` moves the task together with its subtree.
+
+        :raises TaskValidationError: If the task would be moved under
+            itself or one of its own descendants.
+        """
+
+    async def delete(self, task: Task) -> None:
         """Delete a task by its unique identifier."""
 
+    async def delete_many(self, task_ids: Collection[UUID]) -> None:
+        """Delete the tasks with these identifiers, and their subtasks.
+
+        Unknown identifiers are ignored.
+        """
+
 
 class TaskGateway(TaskReader, TaskWriter, Protocol):
     """TaskGateway defines the interface for task-related operations."""
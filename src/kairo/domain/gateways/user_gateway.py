@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
     from uuid import UUID
 
     from kairo.domain.entities.user import User
@@ -20,15 +21,44 @@ class UserReader(Protocol):
     async def get_by_username(self, username: str) -> User | None:
         """Retrieve a user by their username."""
 
+    async def get_many_by_ids(self, user_ids: Collection[UUID]) -> dict[UUID, User]:
+        """Retrieve users by their identifiers, keyed by id.
+
+        Identifiers without a matching user are absent from the result.
+        """
+
+    async def get_many_by_emails(self, emails: Collection[str]) -> dict[str, User]:
+        """Retrieve users by their email addresses, keyed by email.
+
+        Emails without a matching user are absent from the result.
+        """
+
 
 class UserWriter(Protocol):
     """UserWriter defines the interface for writing user-related data."""
 
     async def save(self, user: User) -> User:
-        """Create a new user."""
+        """Create a new user.
+
+        :raises UserAlreadyExistsError: If the email or username is taken.
+        """
+
+    async def save_many(self, users: Sequence[User]) -> list[User]:
+        """Create many users at once, skipping the ones that conflict.
+
+        Users whose id, email or username is already taken are not created
+        and are absent from the result.
+        """
 
     async def update(self, user: User) -> User:
         """Update an existing user."""
 
     async def delete(self, user: User) -> None:
         """Delete a user by their unique identifier."""
+
+    async def delete_many(self, user_ids: Collection[UUID]) -> None:
+        """Delete the users with these identifiers; unknown ones are ignored."""
+
+
+class UserGateway(UserReader, UserWriter, Protocol):
+    """UserGateway defines the interface for user-related operations."""
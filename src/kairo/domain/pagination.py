@@ -0,0 +1,91 @@
+"""Keyset pagination primitives shared by the gateways.
+
+Every entity id is a uuid7, so ids sort in creation order and a page can
+be fetched with ``WHERE id > :after ORDER BY id LIMIT n`` instead of an
+offset. The cursor handed to clients is the last id of the previous page,
+encoded so that callers treat it as opaque. Listings ordered by a score,
+such as search results, also carry the last score in their cursor.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import struct
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from kairo.domain.exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+_SCORE = struct.Struct(">d")
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    Attributes
+    ----------
+        items (list[T]): Items of this page, ordered by id.
+        next_cursor (str | None): Cursor for the following page, or None
+            if this is the last one.
+
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(last_id: UUID) -> str:
+    """Encode the last id of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> UUID:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    :raises InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return UUID(bytes=raw)
+    except (binascii.Error, ValueError) as exc:
+        msg = "Invalid pagination cursor."
+        raise InvalidCursorError(msg) from exc
+
+
+def encode_ranked_cursor(last_score: float, last_id: UUID) -> str:
+    """Encode the score and id of the last item of a ranked page."""
+    raw = _SCORE.pack(last_score) + last_id.bytes
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_ranked_cursor(cursor: str) -> tuple[float, UUID]:
+    """Decode a cursor produced by ``encode_ranked_cursor``.
+
+    :raises InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        (score,) = _SCORE.unpack(raw[: _SCORE.size])
+        return score, UUID(bytes=raw[_SCORE.size :])
+    except (binascii.Error, struct.error, ValueError) as exc:
+        msg = "Invalid pagination cursor."
+        raise InvalidCursorError(msg) from exc
+
+
+def validate_limit(limit: int) -> int:
+    """Return ``limit`` if it is a valid page size.
+
+    :raises InvalidCursorError: If the limit is out of range.
+    """
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        msg = f"Page limit must be between 1 and {MAX_PAGE_LIMIT}."
+        raise InvalidCursorError(msg)
+    return limit
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from redis.asyncio import Redis
+
+from kairo.application.caching import UserCache
+from kairo.domain.entities.user import User
+from kairo.infrastructure.cache.memory import InMemoryCache
+from kairo.infrastructure.cache.redis_cache import RedisCache
+
+if TYPE_CHECKING:
+    from kairo.config import CacheConfig
+
+
+def create_user_cache(config: CacheConfig) -> UserCache | None:
+    """Build the application-wide user cache, or None if caching is off."""
+    if config.backend == "memory":
+        return UserCache(InMemoryCache(max_size=config.max_size, ttl=config.ttl))
+    if config.backend == "redis":
+        client = Redis.from_url(config.url)
+        return UserCache(RedisCache(client, User, ttl=config.ttl))
+    return None
@@ -0,0 +1,88 @@
+"""In-process cache with a size bound, LRU eviction and per-entry TTL."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from kairo.application.caching import CacheStats
+from kairo.application.interfaces import Cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+V = TypeVar("V")
+
+
+class InMemoryCache(Cache[V], Generic[V]):
+    """LRU cache bounded to ``max_size`` entries that expire after ``ttl``."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> V | None:
+        """Return the cached value, or None on a miss."""
+        return self._get(key)
+
+    async def get_many(self, keys: Collection[str]) -> dict[str, V]:
+        """Return the cached values for the keys that are present."""
+        found = {}
+        for key in keys:
+            value = self._get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        """Remove the given keys."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counters."""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            expirations=self._stats.expirations,
+        )
+
+    async def close(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def _get(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
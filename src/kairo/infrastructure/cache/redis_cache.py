@@ -0,0 +1,85 @@
+"""Redis-backed cache storing values as JSON."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from adaptix import Retort
+
+from kairo.application.caching import CacheStats
+from kairo.application.interfaces import Cache
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from redis.asyncio import Redis
+
+V = TypeVar("V")
+
+_retort = Retort()
+
+
+class RedisCache(Cache[V], Generic[V]):
+    """Cache backed by Redis, shared between processes.
+
+    Values are dumped to JSON with adaptix and loaded back into
+    ``value_type`` on read. Evictions are done by Redis itself under its
+    ``maxmemory`` policy, so only hits and misses are counted here.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        value_type: type[V],
+        ttl: float,
+        prefix: str = "kairo:",
+    ) -> None:
+        self.client = client
+        self.value_type = value_type
+        self.ttl = ttl
+        self.prefix = prefix
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> V | None:
+        """Return the cached value, or None on a miss."""
+        raw = await self.client.get(self.prefix + key)
+        return self._decode(raw)
+
+    async def get_many(self, keys: Collection[str]) -> dict[str, V]:
+        """Return the cached values for the keys that are present."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        raws = await self.client.mget([self.prefix + key for key in keys])
+        found = {}
+        for key, raw in zip(keys, raws, strict=True):
+            value = self._decode(raw)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: V) -> None:
+        """Store a value with the configured TTL."""
+        payload = json.dumps(_retort.dump(value, self.value_type))
+        await self.client.set(self.prefix + key, payload, px=int(self.ttl * 1000))
+
+    async def delete(self, *keys: str) -> None:
+        """Remove the given keys."""
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    def stats(self) -> CacheStats:
+        """Return hit and miss counters."""
+        return CacheStats(hits=self._stats.hits, misses=self._stats.misses)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.client.aclose()
+
+    def _decode(self, raw: Any) -> V | None:  # noqa: ANN401
+        if raw is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return _retort.load(json.loads(raw), self.value_type)
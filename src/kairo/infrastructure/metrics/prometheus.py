@@ -0,0 +1,247 @@
+"""Counters, gauges and histograms rendered in the Prometheus text format.
+
+A deliberately small subset of a Prometheus client: metrics are created on
+a ``Registry``, children are looked up by label values, and ``render``
+produces the text exposition format, version 0.0.4. Updates take no
+locks; they are meant to be made from the event loop thread only.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from math import inf
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds; suits request and query latencies.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+C = TypeVar("C")
+
+
+class CounterChild:
+    """A monotonically increasing value for one set of labels."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount``, which must not be negative."""
+        self.value += amount
+
+    def set(self, value: float) -> None:
+        """Replace the value with a total kept elsewhere, such as pool stats."""
+        self.value = value
+
+
+class GaugeChild:
+    """A value that goes up and down for one set of labels."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount``."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Subtract ``amount``."""
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """Replace the value."""
+        self.value = value
+
+
+class HistogramChild:
+    """Observation counts per bucket for one set of labels."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # One counter per bucket plus the +Inf one, not cumulative.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric(ABC, Generic[C]):
+    """A named metric family with one child per combination of label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._children: dict[tuple[str, ...], C] = {}
+
+    def labels(self, *values: str) -> C:
+        """Return the child for these label values, creating it if needed.
+
+        :raises ValueError: If the number of values does not match the labels.
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                msg = f"{self.name} takes labels {self.label_names}, got {values}."
+                raise ValueError(msg)
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> C:
+        """Create the child for a new combination of label values."""
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """Yield ``(name, labels, value)`` for every sample of the family."""
+
+    def _label_dict(self, values: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.label_names, values, strict=True))
+
+
+class Counter(Metric[CounterChild]):
+    """A family of counters, exposed with a ``_total`` suffix."""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """Yield the total of every child."""
+        for values, child in self._children.items():
+            yield f"{self.name}_total", self._label_dict(values), child.value
+
+
+class Gauge(Metric[GaugeChild]):
+    """A family of gauges."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """Yield the value of every child."""
+        for values, child in self._children.items():
+            yield self.name, self._label_dict(values), child.value
+
+
+class Histogram(Metric[HistogramChild]):
+    """A family of histograms with shared bucket bounds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """Yield the cumulative buckets, sum and count of every child."""
+        for values, child in self._children.items():
+            labels = self._label_dict(values)
+            cumulative = 0
+            for bound, observed in zip(
+                (*self.buckets, inf),
+                child.counts,
+                strict=True,
+            ):
+                cumulative += observed
+                yield (
+                    f"{self.name}_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    cumulative,
+                )
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, child.count
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class Registry:
+    """The metrics exposed together at one endpoint.
+
+    Attributes
+    ----------
+        constant_labels (dict[str, str]): Labels added to every sample,
+            ahead of the sample's own.
+
+    """
+
+    def __init__(self, constant_labels: Mapping[str, str] | None = None) -> None:
+        self.constant_labels = dict(constant_labels or {})
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """Add a metric and return it.
+
+        :raises ValueError: If a metric with the same name is registered.
+        """
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name} is already registered."
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, own_labels, value in metric.samples():
+                labels = {**self.constant_labels, **own_labels}
+                if labels:
+                    rendered = ",".join(
+                        f'{key}="{_escape_label(label)}"'
+                        for key, label in labels.items()
+                    )
+                    lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if value == inf:
+        return "+Inf"
+    if value == -inf:
+        return "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
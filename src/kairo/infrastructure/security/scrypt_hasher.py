@@ -0,0 +1,179 @@
+"""scrypt password hashing in a bounded pool of worker processes.
+
+A hash is stored as ``scrypt$<n>$<r>$<p>$<salt>$<key>`` with the salt and
+derived key in unpadded base64, so hashes made under older cost settings
+still verify after the settings change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import multiprocessing
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from kairo.application.exceptions import ServiceOverloadedError
+from kairo.application.interfaces import PasswordHasher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from kairo.config import PasswordHashConfig
+
+T = TypeVar("T")
+
+SCHEME = "scrypt"
+SALT_SIZE = 16
+KEY_SIZE = 32
+# Passwords hashed by one worker job in ``hash_many``.
+HASH_JOB_SIZE = 8
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _derive(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        # scrypt needs 128 * n * r bytes; leave headroom over the default cap.
+        maxmem=256 * n * r,
+        dklen=KEY_SIZE,
+    )
+
+
+def hash_password(password: str, n: int, r: int, p: int) -> str:
+    """Hash a password with a random salt. Runs in a worker process."""
+    salt = secrets.token_bytes(SALT_SIZE)
+    key = _derive(password, salt, n, r, p)
+    return f"{SCHEME}${n}${r}${p}${_b64encode(salt)}${_b64encode(key)}"
+
+
+def hash_passwords(passwords: Sequence[str], n: int, r: int, p: int) -> list[str]:
+    """Hash several passwords. Runs in a worker process."""
+    return [hash_password(password, n, r, p) for password in passwords]
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against a stored hash. Runs in a worker process."""
+    try:
+        scheme, n, r, p, salt, key = password_hash.split("$")
+        if scheme != SCHEME:
+            return False
+        expected = _b64decode(key)
+        actual = _derive(password, _b64decode(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+class ScryptPasswordHasher(PasswordHasher):
+    """Hashes passwords with scrypt in a pool of worker processes.
+
+    Hashing never runs on the event loop. At most ``max_pending`` jobs wait
+    for or occupy a worker; beyond that new work is rejected at once with
+    ``ServiceOverloadedError`` instead of queueing behind a login storm.
+    Bulk hashing is split into jobs of ``HASH_JOB_SIZE`` passwords that
+    are reserved a wave at a time, so it cannot hold the pool for longer.
+    """
+
+    def __init__(self, config: PasswordHashConfig) -> None:
+        self.config = config
+        # Workers are spawned rather than forked: the parent runs an event
+        # loop and driver threads that a fork would copy mid-flight.
+        self._executor = ProcessPoolExecutor(
+            max_workers=config.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._pending = 0
+        # Unknown users are checked against this, costing a real verify.
+        self._decoy = hash_password(
+            secrets.token_urlsafe(),
+            config.n,
+            config.r,
+            config.p,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently queued or running."""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with a fresh salt in a worker process."""
+        config = self.config
+        return await self._run(hash_password, password, config.n, config.r, config.p)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """Hash passwords in jobs of ``HASH_JOB_SIZE``, one wave at a time.
+
+        A wave is at most one job per worker, and each of its jobs counts
+        against ``max_pending``. Work queued meanwhile waits for one wave
+        at most, and the next wave is rejected if the pool has filled up.
+        """
+        config = self.config
+        jobs = [
+            passwords[i : i + HASH_JOB_SIZE]
+            for i in range(0, len(passwords), HASH_JOB_SIZE)
+        ]
+        loop = asyncio.get_running_loop()
+        hashes: list[str] = []
+        for start in range(0, len(jobs), config.workers):
+            wave = jobs[start : start + config.workers]
+            self._reserve(len(wave))
+            try:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            self._executor,
+                            hash_passwords,
+                            job,
+                            config.n,
+                            config.r,
+                            config.p,
+                        )
+                        for job in wave
+                    ),
+                )
+            finally:
+                self._pending -= len(wave)
+            for job_hashes in results:
+                hashes.extend(job_hashes)
+        return hashes
+
+    async def verify(self, password: str, password_hash: str | None) -> bool:
+        """Check a password in a worker process."""
+        if password_hash is None:
+            await self._run(verify_password, password, self._decoy)
+            return False
+        return await self._run(verify_password, password, password_hash)
+
+    def close(self) -> None:
+        """Stop the worker processes, letting running jobs finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _reserve(self, jobs: int) -> None:
+        if self._pending + jobs > self.config.max_pending:
+            msg = "Too many password hashing jobs are pending."
+            raise ServiceOverloadedError(msg)
+        self._pending += jobs
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        self._reserve(1)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
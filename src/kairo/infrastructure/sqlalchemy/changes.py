@@ -0,0 +1,50 @@
+"""Write the columns of many rows that changed, grouped by which changed."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import bindparam, func, update
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from uuid import UUID
+
+    from sqlalchemy import Table, Update
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def update_changed_many(
+    session: AsyncSession,
+    table: Table,
+    changes: Iterable[tuple[UUID, Mapping[str, Any]]],
+) -> None:
+    """Apply ``(id, {column: value})`` changes, also refreshing ``updated_at``.
+
+    Rows that changed the same columns share one executemany UPDATE, so a
+    batch costs one statement per distinct set of changed columns. Rows
+    without changes are skipped, and missing rows are ignored.
+    """
+    batches: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row_id, values in changes:
+        if not values:
+            continue
+        params = {f"b_{name}": value for name, value in values.items()}
+        params["b_id"] = row_id
+        batches.setdefault(tuple(values), []).append(params)
+    for columns, rows in batches.items():
+        await session.execute(_update_statement(table, columns), rows)
+
+
+@cache
+def _update_statement(table: Table, columns: tuple[str, ...]) -> Update:
+    # Bind names must differ from the column names in an executemany UPDATE.
+    return (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(
+            {name: bindparam(f"b_{name}") for name in columns},
+        )
+        .values(updated_at=func.current_timestamp())
+    )
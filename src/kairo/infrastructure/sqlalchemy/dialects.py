@@ -0,0 +1,26 @@
+"""Dialect-specific statement builders for PostgreSQL and SQLite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_name(session: AsyncSession) -> str:
+    """Return the name of the dialect the session is bound to."""
+    return session.get_bind().dialect.name
+
+
+def insert_ignoring_conflicts(session: AsyncSession, entity: Any) -> Any:  # noqa: ANN401
+    """Build ``INSERT ... ON CONFLICT DO NOTHING`` for the session's dialect."""
+    name = dialect_name(session)
+    if name == "postgresql":
+        return postgresql.insert(entity).on_conflict_do_nothing()
+    if name == "sqlite":
+        return sqlite.insert(entity).on_conflict_do_nothing()
+    msg = f"ON CONFLICT DO NOTHING is not supported for dialect {name!r}."
+    raise NotImplementedError(msg)
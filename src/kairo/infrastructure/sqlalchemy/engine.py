@@ -0,0 +1,184 @@
+"""Application-lifetime engine, session factory and pool instrumentation."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import event, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.interfaces import DBAPIConnection
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+    from kairo.config import DatabaseConfig
+
+
+@dataclass(slots=True)
+class PoolWaitStats:
+    """Counters describing how long callers waited for a pooled connection."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, wait: float, *, timed_out: bool = False) -> None:
+        """Record a checkout attempt that waited ``wait`` seconds."""
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolMetrics:
+    """Point-in-time snapshot of connection pool usage.
+
+    Attributes
+    ----------
+        size (int): Configured number of persistent connections.
+        max_overflow (int): Configured number of extra connections.
+        checked_out (int): Connections currently handed out.
+        overflow (int): Overflow connections currently open.
+        saturation (float): ``checked_out`` relative to the pool capacity.
+        checkouts (int): Total successful checkouts.
+        timeouts (int): Checkouts that gave up waiting for a connection.
+        total_wait (float): Cumulative checkout wait time in seconds.
+        max_wait (float): Longest single checkout wait in seconds.
+
+    """
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    saturation: float
+    checkouts: int
+    timeouts: int
+    total_wait: float
+    max_wait: float
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - started)
+        return entry
+
+    def recreate(self) -> InstrumentedAsyncAdaptedQueuePool:
+        """Recreate the pool, carrying the wait counters over."""
+        pool = cast("InstrumentedAsyncAdaptedQueuePool", super().recreate())
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+def _is_in_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in {
+        None,
+        "",
+        ":memory:",
+    }
+
+
+def _enable_sqlite_foreign_keys(
+    dbapi_connection: DBAPIConnection,
+    connection_record: ConnectionPoolEntry,
+) -> None:
+    # SQLite ignores foreign keys, ON DELETE CASCADE included, unless each
+    # connection turns them on.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def create_engine(config: DatabaseConfig) -> AsyncEngine:
+    """Create the application-wide engine with a configured connection pool.
+
+    On SQLite, every connection enforces foreign keys.
+    """
+    engine = _create_engine(config)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+    return engine
+
+
+def _create_engine(config: DatabaseConfig) -> AsyncEngine:
+    if _is_in_memory_sqlite(config.url):
+        # Every connection to ":memory:" is a separate database, so all
+        # sessions have to share the one connection.
+        return create_async_engine(
+            config.url,
+            echo=config.echo,
+            poolclass=StaticPool,
+        )
+    return create_async_engine(
+        config.url,
+        echo=config.echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+    )
+
+
+def create_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory used to open one session per request."""
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def get_pool_metrics(engine: AsyncEngine) -> PoolMetrics:
+    """Return a snapshot of the engine's pool usage."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return PoolMetrics(
+            size=1,
+            max_overflow=0,
+            checked_out=0,
+            overflow=0,
+            saturation=0.0,
+            checkouts=0,
+            timeouts=0,
+            total_wait=0.0,
+            max_wait=0.0,
+        )
+
+    capacity = pool.size() + max(pool._max_overflow, 0)  # noqa: SLF001
+    checked_out = pool.checkedout()
+    stats = pool.wait_stats
+    return PoolMetrics(
+        size=pool.size(),
+        max_overflow=pool._max_overflow,  # noqa: SLF001
+        checked_out=checked_out,
+        overflow=max(pool.overflow(), 0),
+        saturation=checked_out / capacity if capacity else 0.0,
+        checkouts=stats.checkouts,
+        timeouts=stats.timeouts,
+        total_wait=stats.total_wait,
+        max_wait=stats.max_wait,
+    )
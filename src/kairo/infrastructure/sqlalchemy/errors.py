@@ -0,0 +1,31 @@
+"""Helpers for translating database errors into domain terms."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kairo.infrastructure.sqlalchemy.base import metadata
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlalchemy.exc import IntegrityError
+
+
+def violated_unique_column(error: IntegrityError, table: Table) -> str | None:
+    """Return the unique column of ``table`` that ``error`` complains about.
+
+    PostgreSQL reports the constraint name, which follows the metadata naming
+    convention (``users_email_ukey``); SQLite reports ``table.column``.
+    """
+    message = str(error.orig)
+    template = metadata.naming_convention["uq"]
+    for column in table.columns:
+        if not column.unique:
+            continue
+        constraint_name = template % {  # type: ignore[operator]
+            "table_name": table.name,
+            "column_0_name": column.name,
+        }
+        if constraint_name in message or f"{table.name}.{column.name}" in message:
+            return column.name
+    return None
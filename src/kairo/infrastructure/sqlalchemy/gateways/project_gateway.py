@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import delete, func, insert, select, update
+
+from kairo.domain.entities.base import LazyEntityCollection
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.gateways.project_gateway import ProjectReader, ProjectWriter
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+from kairo.infrastructure.sqlalchemy.changes import update_changed_many
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.mappers.project_mapper import (
+    convert_project_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.mappers.user_mapper import (
+    convert_user_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.models.project import ProjectModel
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+from kairo.infrastructure.sqlalchemy.models.user import UserModel
+from kairo.infrastructure.sqlalchemy.pagination import make_page, paginate
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from uuid import UUID
+
+    from sqlalchemy import Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kairo.domain.entities.user import User
+    from kairo.domain.pagination import Page
+    from kairo.infrastructure.sqlalchemy.unit_of_work import UnitOfWork
+
+_PROJECTS = cast("Table", ProjectModel.__table__)
+
+
+class ProjectGateway(ProjectReader, ProjectWriter):
+    """ProjectGateway implementation for SQLAlchemy.
+
+    Projects are loaded together with their owner in one joined query.
+    Their tasks are not: ``Project.tasks`` is a lazy collection that pages
+    through the task gateway when iterated, and saving a project only
+    writes the tasks added or removed since it was loaded.
+
+    With a unit of work, loaded projects and owners go through its identity
+    map, and projects and added tasks are written at its flush.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        unit_of_work: UnitOfWork | None = None,
+    ):
+        self.session = session
+        self.unit_of_work = unit_of_work
+        self.task_gateway = TaskGateway(session, unit_of_work)
+
+    async def get_by_id(self, project_id: UUID) -> Project | None:
+        """Get a project by ID."""
+        result = await self.session.execute(
+            select(ProjectModel, UserModel)
+            .join(UserModel, ProjectModel.owner_id == UserModel.id)
+            .where(ProjectModel.id == project_id),
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        project, owner = row
+        return self._to_domain(project, self._owner_to_domain(owner))
+
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Project]:
+        """Get one page of a user's projects, seeking by id."""
+        result = await self.session.execute(
+            paginate(
+                select(ProjectModel, UserModel)
+                .join(UserModel, ProjectModel.owner_id == UserModel.id)
+                .where(ProjectModel.owner_id == user_id),
+                ProjectModel.id,
+                cursor,
+                limit,
+            ),
+        )
+        rows = result.all()
+        if not rows:
+            return make_page([], limit, lambda project: project.id)
+        # Every row carries the same owner; convert it once.
+        owner = self._owner_to_domain(rows[0][1])
+        projects = [self._to_domain(project, owner) for project, _ in rows]
+        return make_page(projects, limit, lambda project: project.id)
+
+    async def create(self, project: Project) -> Project:
+        """Create a new project together with the tasks added to it."""
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_new(project)
+            await self._save_task_changes(project)
+            return project
+        await self.session.execute(
+            insert(ProjectModel).values(
+                id=project.id,
+                name=project.name,
+                description=project.description,
+                owner_id=project.owner.id,
+            ),
+        )
+        project.mark_saved()
+        await self._save_task_changes(project)
+        return project
+
+    async def update(self, project: Project) -> Project:
+        """Write the fields and tasks changed since load.
+
+        The project row is only updated if its own fields changed.
+
+        :raises ValueError: If the project has changes but does not exist.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_dirty(project)
+            await self._save_task_changes(project)
+            return project
+        changes = _column_changes(project)
+        if changes:
+            result = await self.session.execute(
+                update(ProjectModel)
+                .where(ProjectModel.id == project.id)
+                .values(**changes, updated_at=func.current_timestamp()),
+            )
+            if not result.rowcount:
+                msg = f"Project with id {project.id} does not exist."
+                raise ValueError(msg)
+            project.mark_saved()
+        await self._save_task_changes(project)
+        return project
+
+    async def delete(self, project: Project) -> None:
+        """Delete a project and, through the foreign key, its tasks."""
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_removed(project)
+            return
+        await self.session.execute(
+            delete(ProjectModel).where(ProjectModel.id == project.id),
+        )
+
+    async def insert_many(self, projects: Sequence[Project]) -> None:
+        """Insert new projects, without their tasks, in one statement."""
+        await self.session.execute(
+            insert(ProjectModel).values(
+                [
+                    {
+                        "id": project.id,
+                        "name": project.name,
+                        "description": project.description,
+                        "owner_id": project.owner.id,
+                    }
+                    for project in projects
+                ],
+            ),
+        )
+        for project in projects:
+            project.mark_saved()
+
+    async def update_many(self, projects: Sequence[Project]) -> None:
+        """Write the fields projects changed, one executemany UPDATE per set."""
+        await update_changed_many(
+            self.session,
+            _PROJECTS,
+            ((project.id, _column_changes(project)) for project in projects),
+        )
+        for project in projects:
+            project.mark_saved()
+
+    async def delete_many(self, project_ids: Collection[UUID]) -> None:
+        """Delete the projects with these ids, and their tasks, in one statement.
+
+        With a unit of work they are deleted at its flush.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_removed_ids(Project, project_ids)
+            return
+        if project_ids:
+            await self.session.execute(
+                delete(ProjectModel).where(ProjectModel.id.in_(project_ids)),
+            )
+
+    def _to_domain(self, model: ProjectModel, owner: User) -> Project:
+        tasks: LazyEntityCollection[Task] = LazyEntityCollection(
+            loader=partial(self.task_gateway.get_by_project_id, model.id),
+        )
+        project = convert_project_model_to_domain(model, owner, tasks)
+        if self.unit_of_work is None:
+            return project
+        return self.unit_of_work.merge(project)
+
+    def _owner_to_domain(self, model: UserModel) -> User:
+        owner = convert_user_model_to_domain(model)
+        if self.unit_of_work is None:
+            return owner
+        return self.unit_of_work.merge(owner)
+
+    async def _save_task_changes(self, project: Project) -> None:
+        """Insert added tasks and delete removed ones, one statement each.
+
+        With a unit of work the added tasks are inserted at its flush, and
+        removed tasks it has not written yet are simply forgotten.
+        """
+        tasks = project.tasks
+        removed = tasks.removed
+        if self.unit_of_work is not None:
+            unit_of_work = self.unit_of_work
+            removed = [i for i in removed if not unit_of_work.forget(Task, i)]
+        if removed:
+            await self.session.execute(
+                delete(TaskModel).where(
+                    TaskModel.project_id == project.id,
+                    TaskModel.id.in_(removed),
+                ),
+            )
+        if self.unit_of_work is not None:
+            for task in tasks.added:
+                self.unit_of_work.register_new(task)
+        elif tasks.added:
+            await self.task_gateway.create_many(tasks.added)
+        tasks.mark_saved()
+
+
+def _column_changes(project: Project) -> dict[str, Any]:
+    """Return the project's changed fields keyed by column."""
+    changes = project.changed_fields()
+    if "owner" in changes:
+        changes["owner_id"] = changes.pop("owner").id
+    return changes
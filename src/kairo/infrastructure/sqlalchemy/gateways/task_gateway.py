@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.orm import aliased
+
+from kairo.domain.entities.task import Task
+from kairo.domain.exceptions import TaskValidationError
+from kairo.domain.gateways.task_gateway import TaskReader, TaskWriter
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT, validate_limit
+from kairo.infrastructure.sqlalchemy.changes import update_changed_many
+from kairo.infrastructure.sqlalchemy.dialects import dialect_name
+from kairo.infrastructure.sqlalchemy.hierarchy import (
+    ancestor_ids,
+    child_path,
+    compute_paths,
+    in_subtree,
+    path_segment,
+)
+from kairo.infrastructure.sqlalchemy.mappers.task_mapper import (
+    convert_task_model_to_domain,
+)
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+from kairo.infrastructure.sqlalchemy.pagination import (
+    make_page,
+    make_ranked_page,
+    paginate,
+    paginate_ranked,
+)
+from kairo.infrastructure.sqlalchemy.search import search_tasks
+from kairo.infrastructure.sqlalchemy.task_query import compile_task_query
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Collection, Sequence
+    from uuid import UUID
+
+    from sqlalchemy import ColumnElement, Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kairo.domain.pagination import Page
+    from kairo.infrastructure.sqlalchemy.unit_of_work import UnitOfWork
+
+
+# Rows fetched from the cursor per round trip while streaming.
+STREAM_BATCH_SIZE = 500
+
+_TASKS = cast("Table", TaskModel.__table__)
+
+
+class TaskGateway(TaskReader, TaskWriter):
+    """TaskGateway implementation for SQLAlchemy.
+
+    The gateway keeps the materialized ``path`` column in step with
+    ``parent_id`` on every write; see ``hierarchy`` for how it is used.
+
+    With a unit of work, loaded tasks go through its identity map, except
+    for streams and trees, and writes wait for its flush.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        unit_of_work: UnitOfWork | None = None,
+    ):
+        self.session = session
+        self.unit_of_work = unit_of_work
+
+    async def get_by_id(self, task_id: UUID) -> Task | None:
+        """Get a task by ID, without a query if the unit already has it."""
+        unit_of_work = self.unit_of_work
+        if unit_of_work is not None:
+            if unit_of_work.is_removed(Task, task_id):
+                return None
+            known = unit_of_work.get(Task, task_id)
+            if known is not None:
+                return known
+        result = await self.session.execute(
+            select(TaskModel).where(TaskModel.id == task_id),
+        )
+        task = result.scalar_one_or_none()
+        if not task:
+            return None
+        return self._to_domain(task)
+
+    async def get_by_project_id(
+        self,
+        project_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Get one page of a project's tasks, seeking by id."""
+        return await self._get_page(TaskModel.project_id == project_id, cursor, limit)
+
+    async def stream_by_project_id(self, project_id: UUID) -> AsyncIterator[Task]:
+        """Stream a project's tasks through a server-side cursor."""
+        result = await self.session.stream_scalars(
+            select(TaskModel)
+            .where(TaskModel.project_id == project_id)
+            .order_by(TaskModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE),
+        )
+        try:
+            async for model in result:
+                yield convert_task_model_to_domain(model)
+        finally:
+            await result.close()
+
+    async def get_by_parent_id(
+        self,
+        parent_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Get one page of a task's subtasks, seeking by id."""
+        return await self._get_page(TaskModel.parent_id == parent_id, cursor, limit)
+
+    async def get_tree(
+        self,
+        task_id: UUID,
+        max_depth: int | None = None,
+    ) -> Task | None:
+        """Get a task and its descendants with one recursive query.
+
+        Rows come back ordered by depth, so every parent is built before
+        its subtasks and the tree is assembled in a single pass.
+        """
+        tree = (
+            select(TaskModel, literal_column("0").label("depth"))
+            .where(TaskModel.id == task_id)
+            .cte("tree", recursive=True)
+        )
+        children = select(TaskModel, (tree.c.depth + 1).label("depth")).join(
+            tree,
+            TaskModel.parent_id == tree.c.id,
+        )
+        if max_depth is not None:
+            children = children.where(tree.c.depth < max_depth)
+        tree = tree.union_all(children)
+
+        node = aliased(TaskModel, tree)
+        result = await self.session.scalars(
+            select(node).order_by(tree.c.depth, tree.c.id),
+        )
+
+        root: Task | None = None
+        by_id: dict[UUID, Task] = {}
+        for model in result:
+            task = convert_task_model_to_domain(model)
+            by_id[task.id] = task
+            if root is None:
+                root = task
+            else:
+                # Rows are trusted, so skip the checks done by add_subtask.
+                by_id[task.parent_id].subtasks.add(task)  # type: ignore[index]
+        return root
+
+    async def get_descendants(
+        self,
+        task_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Get one page of a task's descendants with a path range scan."""
+        path = await self._get_path(task_id)
+        if path is None:
+            return make_page([], limit, lambda task: task.id)
+        return await self._get_page(in_subtree(path, include_root=False), cursor, limit)
+
+    async def get_ancestors(self, task_id: UUID) -> list[Task]:
+        """Get a task's ancestors by the ids stored in its path."""
+        path = await self._get_path(task_id)
+        ids = ancestor_ids(path) if path is not None else []
+        if not ids:
+            return []
+        result = await self.session.scalars(
+            select(TaskModel).where(TaskModel.id.in_(ids)),
+        )
+        by_id = {model.id: model for model in result}
+        return [self._to_domain(by_id[i]) for i in ids if i in by_id]
+
+    async def search(
+        self,
+        query: str,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Get one page of matching tasks from the full-text index."""
+        statement = search_tasks(dialect_name(self.session), query)
+        if statement is None:
+            return make_page([], validate_limit(limit), lambda task: task.id)
+        score = statement.selected_columns.score
+        result = await self.session.execute(
+            paginate_ranked(statement, score, TaskModel.id, cursor, limit),
+        )
+        rows = [(self._to_domain(model), rank) for model, rank in result.tuples()]
+        return make_ranked_page(rows, limit, lambda task: task.id)
+
+    async def find(
+        self,
+        query: str,
+        *,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> Page[Task]:
+        """Get one page of the tasks matching a query, in a single select."""
+        compiled, params = compile_task_query(query, dialect_name(self.session))
+        statement = paginate(
+            compiled.statement,
+            TaskModel.id,
+            cursor,
+            limit,
+            descending=compiled.descending,
+        )
+        result = await self.session.scalars(statement, params)
+        tasks = [self._to_domain(model) for model in result]
+        return make_page(tasks, limit, lambda task: task.id)
+
+    async def create(self, task: Task) -> Task:
+        """Create a new task, deriving its path from the parent's in SQL.
+
+        With a unit of work the task is inserted at its flush, together
+        with the other new tasks.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_new(task)
+            return task
+        path: object = path_segment(task.id)
+        if task.parent_id is not None:
+            parent = aliased(TaskModel)
+            parent_path = (
+                select(parent.path).where(parent.id == task.parent_id).scalar_subquery()
+            )
+            path = func.coalesce(parent_path, "") + path_segment(task.id)
+        await self.session.execute(
+            insert(TaskModel).values(
+                id=task.id,
+                name=task.name,
+                description=task.description,
+                project_id=task.project_id,
+                parent_id=task.parent_id,
+                path=path,
+            ),
+        )
+        task.mark_saved()
+        return task
+
+    async def create_many(self, tasks: Sequence[Task]) -> list[Task]:
+        """Create tasks with one executemany INSERT.
+
+        Paths are computed up front; parents that already exist cost one
+        extra query for all of them together.
+        """
+        if not tasks:
+            return []
+        batch = {task.id for task in tasks}
+        outside = {
+            task.parent_id
+            for task in tasks
+            if task.parent_id is not None and task.parent_id not in batch
+        }
+        known: dict[UUID, str] = {}
+        if outside:
+            result = await self.session.execute(
+                select(TaskModel.id, TaskModel.path).where(TaskModel.id.in_(outside)),
+            )
+            known = dict(result.tuples().all())
+        paths = compute_paths(((task.id, task.parent_id) for task in tasks), known)
+        # The foreign key is checked row by row: insert parents first.
+        ordered = sorted(tasks, key=lambda task: paths.get(task.id, "").count("/"))
+        rows = [
+            {
+                "id": task.id,
+                "name": task.name,
+                "description": task.description,
+                "project_id": task.project_id,
+                "parent_id": task.parent_id,
+                # Unknown parents are rejected by the foreign key.
+                "path": paths.get(task.id, path_segment(task.id)),
+            }
+            for task in ordered
+        ]
+        await self.session.execute(
+            # Keep root tasks, with a NULL parent, in the same batch as the rest.
+            insert(TaskModel).execution_options(render_nulls=True),
+            rows,
+        )
+        for task in tasks:
+            task.mark_saved()
+        return list(tasks)
+
+    async def update(self, task: Task) -> Task:
+        """Write the fields changed since load, moving the subtree if needed.
+
+        A task without changes is returned as is, without a statement.
+        With a unit of work the task is moved and written at its flush,
+        which is also when an invalid move is reported.
+
+        :raises TaskValidationError: If the task would be moved under
+            itself or one of its own descendants.
+        :raises ValueError: If the task has changes but does not exist.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_dirty(task)
+            return task
+        changes = task.changed_fields()
+        if not changes:
+            return task
+        if "parent_id" in changes:
+            await self._move_if_reparented(task)
+        result = await self.session.execute(
+            update(TaskModel)
+            .where(TaskModel.id == task.id)
+            .values(**changes, updated_at=func.current_timestamp()),
+        )
+        if not result.rowcount:
+            msg = f"Task with id {task.id} does not exist."
+            raise ValueError(msg)
+        task.mark_saved()
+        return task
+
+    async def delete(self, task: Task) -> None:
+        """Delete a task and, through the foreign key, its subtasks."""
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_removed(task)
+            return
+        await self.session.execute(delete(TaskModel).where(TaskModel.id == task.id))
+
+    async def insert_many(self, tasks: Sequence[Task]) -> None:
+        """Insert new tasks with one executemany INSERT."""
+        await self.create_many(tasks)
+
+    async def update_many(self, tasks: Sequence[Task]) -> None:
+        """Write the fields tasks changed, one executemany UPDATE per set.
+
+        Tasks whose parent changed are moved first, one subtree at a time.
+
+        :raises TaskValidationError: If a task would be moved under itself
+            or one of its own descendants.
+        """
+        changes = [(task, task.changed_fields()) for task in tasks]
+        for task, values in changes:
+            if "parent_id" in values:
+                await self._move_if_reparented(task)
+        await update_changed_many(
+            self.session,
+            _TASKS,
+            ((task.id, values) for task, values in changes),
+        )
+        for task in tasks:
+            task.mark_saved()
+
+    async def delete_many(self, task_ids: Collection[UUID]) -> None:
+        """Delete the tasks with these ids, and their subtasks, in one statement.
+
+        With a unit of work they are deleted at its flush.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_removed_ids(Task, task_ids)
+            return
+        if task_ids:
+            await self.session.execute(
+                delete(TaskModel).where(TaskModel.id.in_(task_ids)),
+            )
+
+    async def _get_path(self, task_id: UUID) -> str | None:
+        result = await self.session.execute(
+            select(TaskModel.path).where(TaskModel.id == task_id),
+        )
+        return result.scalar_one_or_none()
+
+    async def _move_if_reparented(self, task: Task) -> None:
+        ids = {task.id} if task.parent_id is None else {task.id, task.parent_id}
+        result = await self.session.execute(
+            select(TaskModel.id, TaskModel.parent_id, TaskModel.path).where(
+                TaskModel.id.in_(ids),
+            ),
+        )
+        rows = {row.id: row for row in result}
+        current = rows.get(task.id)
+        if current is None or current.parent_id == task.parent_id:
+            return
+
+        parent_path = None
+        if task.parent_id is not None:
+            if task.parent_id not in rows:
+                msg = f"Parent task with id {task.parent_id} does not exist."
+                raise ValueError(msg)
+            parent_path = rows[task.parent_id].path
+            if parent_path.startswith(current.path):
+                msg = "A task cannot be moved under itself or its own subtasks."
+                raise TaskValidationError(msg)
+
+        # Rewrite the path prefix of the whole subtree in one statement.
+        old_path, new_path = current.path, child_path(parent_path, task.id)
+        await self.session.execute(
+            update(TaskModel)
+            .where(in_subtree(old_path))
+            .values(
+                path=literal(new_path) + func.substr(TaskModel.path, len(old_path) + 1),
+            )
+            .execution_options(synchronize_session=False),
+        )
+
+    async def _get_page(
+        self,
+        criterion: ColumnElement[bool],
+        cursor: str | None,
+        limit: int,
+    ) -> Page[Task]:
+        result = await self.session.scalars(
+            paginate(select(TaskModel).where(criterion), TaskModel.id, cursor, limit),
+        )
+        tasks = [self._to_domain(model) for model in result]
+        return make_page(tasks, limit, lambda task: task.id)
+
+    def _to_domain(self, model: TaskModel) -> Task:
+        task = convert_task_model_to_domain(model)
+        if self.unit_of_work is None:
+            return task
+        return self.unit_of_work.merge(task)
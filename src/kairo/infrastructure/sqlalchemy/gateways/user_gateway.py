@@ -1,37 +1,64 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
 from kairo.domain.entities.user import User
+from kairo.domain.exceptions import UserAlreadyExistsError
 from kairo.domain.gateways.user_gateway import UserReader, UserWriter
+from kairo.infrastructure.sqlalchemy.dialects import insert_ignoring_conflicts
+from kairo.infrastructure.sqlalchemy.errors import violated_unique_column
 from kairo.infrastructure.sqlalchemy.mappers.user_mapper import (
-    convert_domain_to_user_model,
     convert_user_model_to_domain,
 )
 from kairo.infrastructure.sqlalchemy.models.user import UserModel
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+    from sqlalchemy import Table
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from kairo.infrastructure.sqlalchemy.unit_of_work import UnitOfWork
+
+
+SAVE_MANY_BATCH_SIZE = 1000
+
 
 class UserGateway(UserReader, UserWriter):
-    """UserGateway implementation for SQLAlchemy."""
+    """UserGateway implementation for SQLAlchemy.
+
+    With a unit of work, loaded users go through its identity map, and
+    updates and deletes wait for its flush.
+    """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        unit_of_work: UnitOfWork | None = None,
+    ):
         self.session = session
+        self.unit_of_work = unit_of_work
 
     async def get_by_id(self, user_id: UUID) -> User | None:
-        """Get a user by ID."""
+        """Get a user by ID, without a query if the unit already has it."""
+        unit_of_work = self.unit_of_work
+        if unit_of_work is not None:
+            if unit_of_work.is_removed(User, user_id):
+                return None
+            known = unit_of_work.get(User, user_id)
+            if known is not None:
+                return known
         result = await self.session.execute(
             select(UserModel).where(UserModel.id == user_id),
         )
         user = result.scalar_one_or_none()
         if not user:
             return None
-        return convert_user_model_to_domain(user)
+        return self._to_domain(user)
 
     async def get_by_email(self, email: str) -> User | None:
         """Get a user by email."""
@@ -41,7 +68,7 @@ class UserGateway(UserReader, UserWriter):
         user = result.scalar_one_or_none()
         if not user:
             return None
-        return convert_user_model_to_domain(user)
+        return self._to_domain(user)
 
     async def get_by_username(self, username: str) -> User | None:
         """Get a user by username."""
@@ -51,35 +78,159 @@ class UserGateway(UserReader, UserWriter):
         user = result.scalar_one_or_none()
         if not user:
             return None
-        return convert_user_model_to_domain(user)
+        return self._to_domain(user)
+
+    async def get_many_by_ids(self, user_ids: Collection[UUID]) -> dict[UUID, User]:
+        """Get users by IDs with a single query for the ones not yet loaded."""
+        found: dict[UUID, User] = {}
+        missing = set(user_ids)
+        unit_of_work = self.unit_of_work
+        if unit_of_work is not None:
+            for user_id in user_ids:
+                known = unit_of_work.get(User, user_id)
+                if known is not None:
+                    found[user_id] = known
+                if known is not None or unit_of_work.is_removed(User, user_id):
+                    missing.discard(user_id)
+        if not missing:
+            return found
+        result = await self.session.scalars(
+            select(UserModel).where(UserModel.id.in_(missing)),
+        )
+        found.update((model.id, self._to_domain(model)) for model in result)
+        return found
+
+    async def get_many_by_emails(self, emails: Collection[str]) -> dict[str, User]:
+        """Get users by emails with a single query."""
+        if not emails:
+            return {}
+        result = await self.session.scalars(
+            select(UserModel).where(UserModel.email.in_(set(emails))),
+        )
+        return {model.email: self._to_domain(model) for model in result}
 
     async def save(self, user: User) -> User:
-        """Create a new user."""
-        user_model = convert_domain_to_user_model(user)
-        self.session.add(user_model)
-        await self.session.flush()
-        return convert_user_model_to_domain(user_model)
+        """Create a new user with a single INSERT ... RETURNING statement.
+
+        Uniqueness is enforced by the database, so concurrent signups with
+        the same email or username cannot both succeed.
+
+        :raises UserAlreadyExistsError: If the email or username is taken.
+        """
+        try:
+            result = await self.session.scalars(
+                insert(UserModel)
+                .values(
+                    id=user.id,
+                    email=user.email,
+                    username=user.username,
+                    password=user.password,
+                    created_at=user.created_at,
+                    updated_at=user.updated_at,
+                )
+                .returning(UserModel),
+            )
+        except IntegrityError as exc:
+            column = violated_unique_column(exc, cast("Table", UserModel.__table__))
+            if column is None:
+                raise
+            raise UserAlreadyExistsError(column, getattr(user, column)) from exc
+        return self._to_domain(result.one())
+
+    async def save_many(self, users: Sequence[User]) -> list[User]:
+        """Create users with multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Rows are sent in batches of ``SAVE_MANY_BATCH_SIZE`` to stay within
+        the bind parameter limits of PostgreSQL and SQLite.
+        """
+        created: list[User] = []
+        for start in range(0, len(users), SAVE_MANY_BATCH_SIZE):
+            batch = users[start : start + SAVE_MANY_BATCH_SIZE]
+            result = await self.session.scalars(
+                insert_ignoring_conflicts(self.session, UserModel)
+                .values(
+                    [
+                        {
+                            "id": user.id,
+                            "email": user.email,
+                            "username": user.username,
+                            "password": user.password,
+                            "created_at": user.created_at,
+                            "updated_at": user.updated_at,
+                        }
+                        for user in batch
+                    ],
+                )
+                .returning(UserModel),
+            )
+            created.extend(self._to_domain(model) for model in result)
+        return created
 
     async def update(self, user: User) -> User:
-        """Update an existing user."""
+        """Write the fields changed since load with one UPDATE ... RETURNING.
+
+        A user without changes is returned as is, without a statement.
+        With a unit of work the user is written at its flush, which is
+        also when a missing user is reported.
+
+        :raises ValueError: If the user has changes but does not exist.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_dirty(user)
+            return user
+        await self._write_changes(user)
+        return user
+
+    async def delete(self, user: User) -> None:
+        """Delete a user by id with one statement, without loading it."""
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_removed(user)
+            return
+        await self.session.execute(delete(UserModel).where(UserModel.id == user.id))
+
+    async def update_many(self, users: Sequence[User]) -> None:
+        """Write the fields each user changed with one UPDATE ... RETURNING.
+
+        Unlike an executemany UPDATE, this refreshes every ``updated_at``
+        and notices users that no longer exist.
+
+        :raises ValueError: If a user has changes but does not exist.
+        """
+        for user in users:
+            await self._write_changes(user)
+
+    async def delete_many(self, user_ids: Collection[UUID]) -> None:
+        """Delete the users with these ids in one statement.
+
+        With a unit of work they are deleted at its flush.
+        """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_removed_ids(User, user_ids)
+            return
+        if user_ids:
+            await self.session.execute(
+                delete(UserModel).where(UserModel.id.in_(user_ids)),
+            )
+
+    async def _write_changes(self, user: User) -> None:
+        changes = user.changed_fields()
+        if not changes:
+            return
         result = await self.session.execute(
-            select(UserModel).where(UserModel.id == user.id),
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(**changes, updated_at=func.current_timestamp())
+            .returning(UserModel.updated_at),
         )
-        user_model = result.scalar_one_or_none()
-        if not user_model:
+        updated_at = result.scalar_one_or_none()
+        if updated_at is None:
             msg = f"User with id {user.id} does not exist."
             raise ValueError(msg)
-        # Update fields from domain entity
-        user_model.email = user.email
-        user_model.username = user.username
-        user_model.password = user.password
-        # Flush changes
-        await self.session.flush()
-        return convert_user_model_to_domain(user_model)
+        user.updated_at = updated_at
+        user.mark_saved()
 
-    async def delete(self, user: User) -> None:
-        """Delete a user by their unique identifier."""
-        user_model = await self.get_by_id(user.id)
-        if user_model:
-            await self.session.delete(user_model)
-            await self.session.flush()
+    def _to_domain(self, model: UserModel) -> User:
+        user = convert_user_model_to_domain(model)
+        if self.unit_of_work is None:
+            return user
+        return self.unit_of_work.merge(user)
@@ -0,0 +1,145 @@
+"""Materialized-path index over the task hierarchy.
+
+Every task row stores ``path``: the hex ids of its ancestors and itself,
+each followed by ``/``. The descendants of a task are then the rows whose
+path lies in ``[path, upper_bound(path))``, a single range scan on the
+path index, and its ancestors can be read straight from the path. Moving a
+subtree rewrites the path prefix of every row in that range with one
+UPDATE.
+
+The path is maintained by the task gateway. ``check_task_paths`` and
+``repair_task_paths`` verify and rebuild it from ``parent_id``, which
+stays the source of truth.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import aliased
+
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from sqlalchemy import ColumnElement, Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+SEPARATOR = "/"
+SEGMENT_LENGTH = 33
+# "0" sorts right after the separator, so it bounds every longer path.
+_AFTER_SEPARATOR = "0"
+
+
+def path_segment(task_id: UUID) -> str:
+    """Return the path segment of a single task."""
+    return task_id.hex + SEPARATOR
+
+
+def child_path(parent_path: str | None, task_id: UUID) -> str:
+    """Return the path of ``task_id`` under a parent with ``parent_path``."""
+    return (parent_path or "") + path_segment(task_id)
+
+
+def upper_bound(path: str) -> str:
+    """Return the smallest string greater than every path under ``path``."""
+    return path[: -len(SEPARATOR)] + _AFTER_SEPARATOR
+
+
+def ancestor_ids(path: str) -> list[UUID]:
+    """Return the ids of the ancestors encoded in ``path``, root first."""
+    return [UUID(hex=segment) for segment in path.split(SEPARATOR)[:-2]]
+
+
+def depth(path: str) -> int:
+    """Return how many ancestors the task with ``path`` has."""
+    return len(path) // SEGMENT_LENGTH - 1
+
+
+def in_subtree(path: str, *, include_root: bool = True) -> ColumnElement[bool]:
+    """Match the rows under ``path`` with a range the path index can serve."""
+    lower = TaskModel.path >= path if include_root else TaskModel.path > path
+    return lower & (TaskModel.path < upper_bound(path))
+
+
+def compute_paths(
+    edges: Iterable[tuple[UUID, UUID | None]],
+    known: Mapping[UUID, str] | None = None,
+) -> dict[UUID, str]:
+    """Compute the path of every task in ``(id, parent_id)`` pairs.
+
+    Parents outside ``edges`` are looked up in ``known``. Tasks whose
+    parent chain reaches neither a root nor a known path, such as members
+    of a cycle, are left out.
+    """
+    parents = dict(edges)
+    paths: dict[UUID, str] = dict(known or {})
+    for task_id in parents:
+        chain: list[UUID] = []
+        current: UUID | None = task_id
+        seen: set[UUID] = set()
+        while current is not None and current not in paths:
+            if current in seen or current not in parents:
+                break
+            seen.add(current)
+            chain.append(current)
+            current = parents[current]
+        else:
+            prefix = paths[current] if current is not None else ""
+            for node in reversed(chain):
+                prefix = child_path(prefix, node)
+                paths[node] = prefix
+    return {task_id: paths[task_id] for task_id in parents if task_id in paths}
+
+
+@dataclass(frozen=True, slots=True)
+class PathMismatch:
+    """A task whose stored path disagrees with its parent's."""
+
+    task_id: UUID
+    stored: str
+    expected: str
+
+
+async def check_task_paths(session: AsyncSession) -> list[PathMismatch]:
+    """Compare every stored path with its parent's path, streaming rows."""
+    parent = aliased(TaskModel)
+    result = await session.stream(
+        select(TaskModel.id, TaskModel.path, parent.path).outerjoin(
+            parent,
+            TaskModel.parent_id == parent.id,
+        ),
+    )
+    return [
+        PathMismatch(task_id, stored, expected)
+        async for task_id, stored, parent_path in result
+        if stored != (expected := child_path(parent_path, task_id))
+    ]
+
+
+async def repair_task_paths(session: AsyncSession) -> int:
+    """Rebuild every path from ``parent_id``; return how many changed."""
+    result = await session.execute(
+        select(TaskModel.id, TaskModel.parent_id, TaskModel.path),
+    )
+    rows = result.all()
+    stored = {task_id: path for task_id, _, path in rows}
+    paths = compute_paths((task_id, parent_id) for task_id, parent_id, _ in rows)
+    changed = [
+        {"task_id": task_id, "new_path": path}
+        for task_id, path in paths.items()
+        if stored[task_id] != path
+    ]
+    if changed:
+        tasks = cast("Table", TaskModel.__table__)
+        await session.execute(
+            update(tasks)
+            .where(tasks.c.id == bindparam("task_id"))
+            .values(path=bindparam("new_path")),
+            changed,
+        )
+    return len(changed)
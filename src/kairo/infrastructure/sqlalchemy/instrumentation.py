@@ -0,0 +1,206 @@
+"""Count statements and the time spent on them, per engine and per request.
+
+``instrument_engine`` hooks the engine's cursor events once, at startup.
+Every statement is added to the engine-wide totals it returns and, when
+it runs inside ``track_queries``, to that block's tally as well. The
+tally lives in a context variable, so it follows the request's task
+through SQLAlchemy's greenlets and into the threads it hands work to.
+
+Statements slower than the engine's threshold are logged with the route
+and the interactor they ran for. ``expect_queries`` turns a tally into a
+test assertion: a query budget for a block and no statement repeated
+with different parameters, the signature of an N+1 loop.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+
+from kairo.application.interactors.base import current_interactor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from sqlalchemy import Connection
+    from sqlalchemy.engine import ExceptionContext, ExecutionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_STARTED = "kairo_query_started"
+
+
+@dataclass(slots=True)
+class QueryTally:
+    """Statements executed within a block and their total duration in seconds.
+
+    Attributes
+    ----------
+        count (int): Statements executed.
+        duration (float): Seconds spent executing them.
+        statements (Counter[str] | None): Executions per SQL text, if the
+            block records statements.
+        route (Callable[[], str | None] | None): Returns the route the
+            block is handling, for the slow-query log.
+        parent (QueryTally | None): Tally of the enclosing block, which
+            counts the statements of this one too.
+
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] | None = None
+    route: Callable[[], str | None] | None = field(default=None, repr=False)
+    parent: QueryTally | None = field(default=None, repr=False)
+
+    def add(self, statement: str, duration: float) -> None:
+        """Record one statement here and in every enclosing tally."""
+        tally: QueryTally | None = self
+        while tally is not None:
+            tally.count += 1
+            tally.duration += duration
+            if tally.statements is not None:
+                tally.statements[statement] += 1
+            tally = tally.parent
+
+    def repeated(self) -> dict[str, int]:
+        """Return the statements executed more than once, with their counts."""
+        if self.statements is None:
+            return {}
+        return {sql: n for sql, n in self.statements.items() if n > 1}
+
+    def current_route(self) -> str | None:
+        """Return the route of the nearest block that knows it."""
+        tally: QueryTally | None = self
+        while tally is not None:
+            if tally.route is not None:
+                return tally.route()
+            tally = tally.parent
+        return None
+
+
+class QueryBudgetError(AssertionError):
+    """A block ran more statements than it was allowed, or repeated one."""
+
+
+_current_tally: ContextVar[QueryTally | None] = ContextVar(
+    "kairo_query_tally",
+    default=None,
+)
+
+
+@contextmanager
+def track_queries(
+    *,
+    record_statements: bool = False,
+    route: Callable[[], str | None] | None = None,
+) -> Iterator[QueryTally]:
+    """Tally the statements executed by the current task within the block.
+
+    :param record_statements: Also count executions per SQL text.
+    :param route: Returns the route being handled, for the slow-query log.
+    """
+    tally = QueryTally(
+        statements=Counter() if record_statements else None,
+        route=route,
+        parent=_current_tally.get(),
+    )
+    token = _current_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _current_tally.reset(token)
+
+
+@contextmanager
+def expect_queries(
+    max_count: int,
+    *,
+    allow_repeated: bool = False,
+) -> Iterator[QueryTally]:
+    """Fail if the block runs more than ``max_count`` statements.
+
+    Unless ``allow_repeated`` is set, it also fails if any statement runs
+    more than once, which usually means rows are being loaded one at a
+    time in a loop. Only engines passed to ``instrument_engine`` are seen.
+
+    :raises QueryBudgetError: When either check fails.
+    """
+    with track_queries(record_statements=True) as tally:
+        yield tally
+    problems = []
+    if tally.count > max_count:
+        problems.append(f"{tally.count} statements ran, at most {max_count} expected.")
+    repeated = {} if allow_repeated else tally.repeated()
+    if repeated:
+        problems.append("Statements repeated with different parameters:")
+        problems.extend(f"  {n}x {sql}" for sql, n in repeated.items())
+    if problems:
+        executed = [f"  {n}x {sql}" for sql, n in (tally.statements or {}).items()]
+        raise QueryBudgetError("\n".join([*problems, "Executed:", *executed]))
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    slow_query_threshold: float | None = None,
+) -> QueryTally:
+    """Time every statement run on ``engine`` and return the running totals.
+
+    :param slow_query_threshold: Log statements that take at least this
+        many seconds; None disables the log.
+    """
+    totals = QueryTally()
+
+    def record(conn: Connection, statement: str) -> None:
+        duration = time.perf_counter() - conn.info[_STARTED].pop()
+        totals.add(statement, duration)
+        tally = _current_tally.get()
+        if tally is not None:
+            tally.add(statement, duration)
+        if slow_query_threshold is not None and duration >= slow_query_threshold:
+            logger.warning(
+                "Slow query took %.1f ms (route %s, interactor %s): %s",
+                duration * 1000,
+                (tally.current_route() if tally is not None else None) or "-",
+                current_interactor.get() or "-",
+                statement,
+            )
+
+    def before_cursor_execute(  # noqa: PLR0913
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+    def after_cursor_execute(  # noqa: PLR0913
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        record(conn, statement)
+
+    def handle_error(context: ExceptionContext) -> None:
+        # Failed statements count too, and must not leave their start behind.
+        if context.connection is not None and context.connection.info.get(_STARTED):
+            record(context.connection, context.statement or "")
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
+    return totals
@@ -0,0 +1,34 @@
+"""Project mapper for converting between Project entity and ProjectModel."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kairo.domain.entities.base import trusted_constructor
+from kairo.domain.entities.project import Project
+
+if TYPE_CHECKING:
+    from kairo.domain.entities.base import LazyEntityCollection
+    from kairo.domain.entities.task import Task
+    from kairo.domain.entities.user import User
+    from kairo.infrastructure.sqlalchemy.models.project import ProjectModel
+
+_restore_project = trusted_constructor(Project)
+
+
+def convert_project_model_to_domain(
+    model: ProjectModel,
+    owner: User,
+    tasks: LazyEntityCollection[Task],
+) -> Project:
+    """Restore a project from its row, its loaded owner and its task collection.
+
+    Tasks are loaded through the task reader, not with the project row.
+    """
+    return _restore_project(
+        id=model.id,
+        name=model.name,
+        description=model.description,
+        owner=owner,
+        tasks=tasks,
+    )
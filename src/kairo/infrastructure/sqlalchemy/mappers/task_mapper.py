@@ -0,0 +1,23 @@
+"""Task mapper for converting between Task entity and TaskModel."""
+
+from __future__ import annotations
+
+from kairo.domain.entities.base import trusted_constructor
+from kairo.domain.entities.task import Task
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+
+_restore_task = trusted_constructor(Task)
+
+
+def convert_task_model_to_domain(model: TaskModel) -> Task:
+    """Restore a Task from its row without re-running its validation.
+
+    Subtasks are separate rows; callers that need them load them explicitly.
+    """
+    return _restore_task(
+        id=model.id,
+        name=model.name,
+        description=model.description,
+        project_id=model.project_id,
+        parent_id=model.parent_id,
+    )
@@ -1,11 +1,21 @@
-"""User mapper for converting between User entity and UserModel."""
+"""User mapper for restoring User entities from UserModel rows."""
 
 from __future__ import annotations
 
-from adaptix.conversion import get_converter
-
+from kairo.domain.entities.base import trusted_constructor
 from kairo.domain.entities.user import User
 from kairo.infrastructure.sqlalchemy.models.user import UserModel
 
-convert_user_model_to_domain = get_converter(UserModel, User)
-convert_domain_to_user_model = get_converter(User, UserModel)
+_restore_user = trusted_constructor(User)
+
+
+def convert_user_model_to_domain(model: UserModel) -> User:
+    """Restore a User from its row without re-running its validation."""
+    return _restore_user(
+        id=model.id,
+        username=model.username,
+        email=model.email,
+        password=model.password,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
@@ -0,0 +1,15 @@
+from .engine import (
+    Migration,
+    MigrationEngine,
+    MigrationError,
+    SchemaOutdatedError,
+)
+from .versions import MIGRATIONS
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "MigrationEngine",
+    "MigrationError",
+    "SchemaOutdatedError",
+]
@@ -0,0 +1,167 @@
+"""Versioned schema migrations built on the declarative ``metadata``.
+
+A database without any Kairo tables is created directly from ``metadata``
+(tables, indexes and naming convention included) and stamped with the
+latest version. A database that is already versioned is brought forward by
+applying the pending migrations one by one, each in its own transaction.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Table,
+    func,
+    insert,
+    inspect,
+    select,
+)
+
+from kairo.infrastructure.sqlalchemy import models  # noqa: F401
+from kairo.infrastructure.sqlalchemy.base import metadata
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+schema_version_table = Table(
+    "schema_version",
+    metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String, nullable=False),
+    Column(
+        "applied_at",
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        nullable=False,
+    ),
+)
+
+
+class MigrationError(Exception):
+    """Raised when the schema cannot be migrated."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+class SchemaOutdatedError(MigrationError):
+    """Raised when the database schema is behind the application."""
+
+    def __init__(self, current: int | None, head: int) -> None:
+        super().__init__(
+            f"Database schema is at version {current}, expected {head}. "
+            "Run 'kairo migrate' before starting the application.",
+        )
+        self.current = current
+        self.head = head
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """A single schema change.
+
+    Attributes
+    ----------
+        version (int): Sequential version number, starting at 1.
+        description (str): Short human-readable summary of the change.
+        upgrade (Callable[[Connection], None]): Applies the change.
+
+    """
+
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def _current_version(connection: Connection) -> int | None:
+    if not inspect(connection).has_table(schema_version_table.name):
+        return None
+    return connection.execute(
+        select(func.max(schema_version_table.c.version)),
+    ).scalar_one_or_none()
+
+
+def _stamp(connection: Connection, migration: Migration) -> None:
+    connection.execute(
+        insert(schema_version_table).values(
+            version=migration.version,
+            description=migration.description,
+        ),
+    )
+
+
+def _create_schema(connection: Connection, migrations: Sequence[Migration]) -> None:
+    existing = set(inspect(connection).get_table_names())
+    if existing & set(metadata.tables):
+        msg = (
+            "Database contains Kairo tables but no schema version. "
+            "Recreate it or stamp it manually before migrating."
+        )
+        raise MigrationError(msg)
+    metadata.create_all(connection)
+    for migration in migrations:
+        _stamp(connection, migration)
+
+
+class MigrationEngine:
+    """Apply and verify schema migrations against an async engine."""
+
+    def __init__(self, engine: AsyncEngine, migrations: Sequence[Migration]) -> None:
+        self.engine = engine
+        self.migrations = sorted(migrations, key=lambda m: m.version)
+
+    @property
+    def head(self) -> int:
+        """Return the latest known schema version."""
+        return self.migrations[-1].version if self.migrations else 0
+
+    async def current_version(self) -> int | None:
+        """Return the applied schema version, or None if unversioned."""
+        async with self.engine.connect() as connection:
+            return await connection.run_sync(_current_version)
+
+    async def pending(self) -> list[Migration]:
+        """Return the migrations that have not been applied yet."""
+        current = await self.current_version()
+        if current is None:
+            return list(self.migrations)
+        return [m for m in self.migrations if m.version > current]
+
+    async def upgrade(self) -> list[Migration]:
+        """Bring the schema up to the latest version.
+
+        :return: The migrations that were applied.
+        """
+        current = await self.current_version()
+        if current is None:
+            async with self.engine.begin() as connection:
+                await connection.run_sync(_create_schema, self.migrations)
+            return list(self.migrations)
+
+        applied = []
+        for migration in self.migrations:
+            if migration.version <= current:
+                continue
+            async with self.engine.begin() as connection:
+                await connection.run_sync(migration.upgrade)
+                await connection.run_sync(_stamp, migration)
+            applied.append(migration)
+        return applied
+
+    async def check(self) -> None:
+        """Ensure the schema is at the latest version.
+
+        :raises SchemaOutdatedError: If any migration is still pending.
+        """
+        current = await self.current_version()
+        if current is None or current < self.head:
+            raise SchemaOutdatedError(current, self.head)
@@ -0,0 +1,90 @@
+"""Ordered list of schema migrations.
+
+Append new migrations at the end with the next version number. Fresh
+databases are created straight from ``metadata``, so ``upgrade`` only has
+to move an existing database from the previous version to this one.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import bindparam, inspect, select, text
+
+from kairo.infrastructure.sqlalchemy.base import metadata
+from kairo.infrastructure.sqlalchemy.hierarchy import compute_paths
+from kairo.infrastructure.sqlalchemy.migrations.engine import Migration
+from kairo.infrastructure.sqlalchemy.search import rebuild_task_search
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+
+def _initial_schema(connection: Connection) -> None:
+    for name in ("users", "projects", "tasks"):
+        metadata.tables[name].create(connection, checkfirst=True)
+
+
+def _keyset_indexes(connection: Connection) -> None:
+    # The single-column indexes keep their names but gain ``id`` as a
+    # second column, so listings can seek and stay ordered by id.
+    for table, column in (
+        ("tasks", "project_id"),
+        ("tasks", "parent_id"),
+        ("projects", "owner_id"),
+    ):
+        name = f"{table}_{column}_idx"
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        index = next(ix for ix in metadata.tables[table].indexes if ix.name == name)
+        index.create(connection)
+
+
+def _task_paths(connection: Connection) -> None:
+    tasks = metadata.tables["tasks"]
+    # Databases created by version 1 of this code already have the column.
+    if "path" not in {c["name"] for c in inspect(connection).get_columns("tasks")}:
+        collation = ' COLLATE "C"' if connection.dialect.name == "postgresql" else ""
+        connection.execute(
+            text(
+                f"ALTER TABLE tasks ADD COLUMN path VARCHAR{collation} "
+                "NOT NULL DEFAULT ''",
+            ),
+        )
+    edges = connection.execute(select(tasks.c.id, tasks.c.parent_id)).tuples().all()
+    rows = [
+        {"task_id": task_id, "new_path": path}
+        for task_id, path in compute_paths(edges).items()
+    ]
+    if rows:
+        connection.execute(
+            tasks.update()
+            .where(tasks.c.id == bindparam("task_id"))
+            .values(path=bindparam("new_path")),
+            rows,
+        )
+    index = next(ix for ix in tasks.indexes if ix.name == "tasks_path_idx")
+    index.create(connection, checkfirst=True)
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="Create users, projects and tasks with lookup indexes",
+        upgrade=_initial_schema,
+    ),
+    Migration(
+        version=2,
+        description="Add id to project, parent and owner indexes for keyset paging",
+        upgrade=_keyset_indexes,
+    ),
+    Migration(
+        version=3,
+        description="Add materialized task paths for subtree queries and moves",
+        upgrade=_task_paths,
+    ),
+    Migration(
+        version=4,
+        description="Add full-text search over task names and descriptions",
+        upgrade=rebuild_task_search,
+    ),
+]
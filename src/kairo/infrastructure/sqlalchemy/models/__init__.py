@@ -0,0 +1,5 @@
+from .project import ProjectModel
+from .task import TaskModel
+from .user import UserModel
+
+__all__ = ["ProjectModel", "TaskModel", "UserModel"]
@@ -0,0 +1,25 @@
+import uuid
+
+from sqlalchemy import UUID, ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from kairo.infrastructure.sqlalchemy.base import Base, DateTimeMixin
+
+
+class ProjectModel(Base, DateTimeMixin):
+    """Project model."""
+
+    __tablename__ = "projects"
+    __table_args__ = (Index(None, "owner_id", "id"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("uuidv7()"),
+    )
+    name: Mapped[str]
+    description: Mapped[str]
+    owner_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+    )
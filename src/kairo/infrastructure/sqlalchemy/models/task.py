@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import UUID, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from kairo.infrastructure.sqlalchemy.base import Base, DateTimeMixin
+
+
+class TaskModel(Base, DateTimeMixin):
+    """Task model."""
+
+    __tablename__ = "tasks"
+    # Lookups by project or parent page through ids in order, so both
+    # indexes carry ``id`` as their second column.
+    __table_args__ = (
+        Index(None, "project_id", "id"),
+        Index(None, "parent_id", "id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("uuidv7()"),
+    )
+    name: Mapped[str]
+    description: Mapped[str]
+    project_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+    )
+    parent_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+    )
+    # Materialized path of ancestor ids, see infrastructure.sqlalchemy.hierarchy.
+    # Byte-wise collation on PostgreSQL keeps prefix ranges index-friendly.
+    path: Mapped[str] = mapped_column(
+        String().with_variant(String(collation="C"), "postgresql"),
+        index=True,
+    )
@@ -0,0 +1,99 @@
+"""Keyset pagination over uuid7 primary keys and ranked results."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from sqlalchemy import and_, or_
+
+from kairo.domain.pagination import (
+    Page,
+    decode_cursor,
+    decode_ranked_cursor,
+    encode_cursor,
+    encode_ranked_cursor,
+    validate_limit,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from uuid import UUID
+
+    from sqlalchemy import ColumnElement, Select
+    from sqlalchemy.orm import InstrumentedAttribute
+
+S = TypeVar("S", bound="Select[Any]")
+T = TypeVar("T")
+
+
+def paginate(
+    statement: S,
+    id_column: InstrumentedAttribute[UUID],
+    cursor: str | None,
+    limit: int,
+    *,
+    descending: bool = False,
+) -> S:
+    """Restrict ``statement`` to the page after ``cursor``.
+
+    Adds ``WHERE id > :cursor ORDER BY id LIMIT :limit + 1``; the extra row
+    tells ``make_page`` whether another page follows without a COUNT.
+    With ``descending`` the ids run the other way.
+
+    :raises InvalidCursorError: If the cursor or limit is invalid.
+    """
+    limit = validate_limit(limit)
+    if cursor is not None:
+        last_id = decode_cursor(cursor)
+        statement = statement.where(
+            id_column < last_id if descending else id_column > last_id,
+        )
+    order = id_column.desc() if descending else id_column
+    return statement.order_by(order).limit(limit + 1)
+
+
+def make_page(items: Sequence[T], limit: int, key: Callable[[T], UUID]) -> Page[T]:
+    """Build a page from the rows fetched by a ``paginate`` statement."""
+    if len(items) <= limit:
+        return Page(items=list(items))
+    page = list(items[:limit])
+    return Page(items=page, next_cursor=encode_cursor(key(page[-1])))
+
+
+def paginate_ranked(
+    statement: S,
+    score: ColumnElement[float],
+    id_column: InstrumentedAttribute[UUID],
+    cursor: str | None,
+    limit: int,
+) -> S:
+    """Restrict ``statement`` to the page after ``cursor``, best score first.
+
+    Rows are ordered by ``score`` descending and then by id, so ties keep a
+    stable order across pages.
+
+    :raises InvalidCursorError: If the cursor or limit is invalid.
+    """
+    limit = validate_limit(limit)
+    if cursor is not None:
+        last_score, last_id = decode_ranked_cursor(cursor)
+        statement = statement.where(
+            or_(
+                score < last_score,
+                and_(score == last_score, id_column > last_id),
+            ),
+        )
+    return statement.order_by(score.desc(), id_column).limit(limit + 1)
+
+
+def make_ranked_page(
+    rows: Sequence[tuple[T, float]],
+    limit: int,
+    key: Callable[[T], UUID],
+) -> Page[T]:
+    """Build a page from ``(item, score)`` rows of a ``paginate_ranked`` query."""
+    items = [item for item, _ in rows[:limit]]
+    if len(rows) <= limit:
+        return Page(items=items)
+    last, last_score = rows[limit - 1]
+    return Page(items=items, next_cursor=encode_ranked_cursor(last_score, key(last)))
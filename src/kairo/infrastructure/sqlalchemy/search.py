@@ -0,0 +1,219 @@
+"""Full-text search over task names and descriptions.
+
+On PostgreSQL every task row carries ``search_vector``, a stored generated
+``tsvector`` with the name weighted above the description, behind a GIN
+index. On SQLite an external-content FTS5 table, ``tasks_fts``, indexes
+the same columns and is kept current by triggers. Either way the index
+follows every insert, update and delete in the same transaction, whether
+it comes from the gateway, a bulk statement or a cascade.
+
+Neither object is part of the ORM model, so both are created here: when
+the ``tasks`` table is created and by the migration that introduced them.
+``rebuild_task_search`` recreates and repopulates them; run it through
+``kairo reindex-search`` after restoring a dump or, on SQLite, after a
+``VACUUM``, which may renumber the rowids the FTS5 table points at.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import ColumnElement, event, func, literal_column, select, table, text
+
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+
+if TYPE_CHECKING:
+    from sqlalchemy import BindParameter, Connection, Select
+
+TEXT_SEARCH_CONFIG = "english"
+# Relative weights of a match in the name and in the description.
+NAME_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+_WORD = re.compile(r"\w+")
+
+_POSTGRES_DDL = (
+    f"""
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', name), 'A')
+        || setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', description), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS tasks_search_vector_idx
+    ON tasks USING gin (search_vector)
+    """,
+)
+_SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        name, description,
+        content='tasks', content_rowid='rowid', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update
+    AFTER UPDATE OF name, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+        INSERT INTO tasks_fts (rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END
+    """,
+)
+
+
+def install_task_search(connection: Connection) -> None:
+    """Create the search column or table, its index and triggers if missing.
+
+    Dialects other than PostgreSQL and SQLite are left without search.
+    """
+    name = connection.dialect.name
+    statements = {"postgresql": _POSTGRES_DDL, "sqlite": _SQLITE_DDL}.get(name, ())
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def rebuild_task_search(connection: Connection) -> None:
+    """Install the search index if needed and rebuild it from ``tasks``."""
+    install_task_search(connection)
+    name = connection.dialect.name
+    if name == "postgresql":
+        # The generated column cannot drift; only the index may bloat.
+        connection.execute(text("REINDEX INDEX tasks_search_vector_idx"))
+    elif name == "sqlite":
+        connection.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"))
+
+
+@event.listens_for(TaskModel.__table__, "after_create")
+def _install_on_create(target: Any, connection: Connection, **kw: Any) -> None:  # noqa: ANN401
+    install_task_search(connection)
+
+
+@event.listens_for(TaskModel.__table__, "before_drop")
+def _drop_before_table(target: Any, connection: Connection, **kw: Any) -> None:  # noqa: ANN401
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS tasks_fts"))
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a user query into the words that are searched for."""
+    return _WORD.findall(query)
+
+
+def prepare_text_query(dialect: str, query: str) -> str | None:
+    """Turn user input into the dialect's full-text query string.
+
+    Returns None when the input has no words to search for.
+
+    :raises NotImplementedError: If the dialect has no search support.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return None
+    if dialect == "postgresql":
+        return " ".join(terms)
+    if dialect == "sqlite":
+        # Quoting every word keeps FTS5 query syntax out of user input.
+        return " ".join(f'"{term}"' for term in terms)
+    msg = f"Full-text search is not supported for dialect {dialect!r}."
+    raise NotImplementedError(msg)
+
+
+def text_matches(
+    dialect: str,
+    prepared: str | BindParameter[str],
+) -> ColumnElement[bool]:
+    """Match the tasks whose text matches a ``prepare_text_query`` string.
+
+    :raises NotImplementedError: If the dialect has no search support.
+    """
+    if dialect == "postgresql":
+        return _VECTOR.op("@@")(_ts_query(prepared))
+    if dialect == "sqlite":
+        matching: Select[tuple[Any]] = (
+            select(literal_column("rowid"))
+            .select_from(table("tasks_fts"))
+            .where(_FTS.op("MATCH")(prepared))
+        )
+        return literal_column("tasks.rowid").in_(matching)
+    msg = f"Full-text search is not supported for dialect {dialect!r}."
+    raise NotImplementedError(msg)
+
+
+def search_tasks(dialect: str, query: str) -> Select[tuple[TaskModel, float]] | None:
+    """Build a select of the tasks matching every word of ``query``.
+
+    Each row is a task with its relevance as ``score``, where higher is
+    better. The statement is unordered; page it with ``paginate_ranked``.
+    Returns None when the query has no words to search for.
+
+    :raises NotImplementedError: If the dialect has no search support.
+    """
+    prepared = prepare_text_query(dialect, query)
+    if prepared is None:
+        return None
+    if dialect == "postgresql":
+        return _search_postgresql(prepared)
+    return _search_sqlite(prepared)
+
+
+# The configuration is inlined so the planner matches the generated
+# column's expression and the bound query stays a plain string.
+_CONFIG: ColumnElement[Any] = literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+_VECTOR: ColumnElement[Any] = literal_column("tasks.search_vector")
+_FTS: ColumnElement[Any] = literal_column("tasks_fts")
+
+
+def _ts_query(prepared: str | BindParameter[str]) -> ColumnElement[Any]:
+    return func.plainto_tsquery(_CONFIG, prepared)
+
+
+def _search_postgresql(prepared: str) -> Select[tuple[TaskModel, float]]:
+    ts_query = _ts_query(prepared)
+    hits = (
+        select(
+            TaskModel.id.label("task_id"),
+            func.ts_rank(
+                literal_column(
+                    f"'{{0, 0, {DESCRIPTION_WEIGHT / NAME_WEIGHT}, 1}}'::float4[]",
+                ),
+                _VECTOR,
+                ts_query,
+            ).label("score"),
+        )
+        .where(_VECTOR.op("@@")(ts_query))
+        .subquery("hits")
+    )
+    return select(TaskModel, hits.c.score).join(hits, TaskModel.id == hits.c.task_id)
+
+
+def _search_sqlite(prepared: str) -> Select[tuple[TaskModel, float]]:
+    hits = (
+        select(
+            literal_column("rowid").label("task_rowid"),
+            # bm25 is lower for better matches.
+            (-func.bm25(_FTS, NAME_WEIGHT, DESCRIPTION_WEIGHT)).label("score"),
+        )
+        .select_from(table("tasks_fts"))
+        .where(_FTS.op("MATCH")(prepared))
+        .subquery("hits")
+    )
+    return select(TaskModel, hits.c.score).join(
+        hits,
+        literal_column("tasks.rowid") == hits.c.task_rowid,
+    )
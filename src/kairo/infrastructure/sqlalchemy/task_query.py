@@ -0,0 +1,676 @@
+"""Kairo query language: task filters compiled to indexed SQL.
+
+A query is an optional filter followed by an optional ordering::
+
+    project = 0199f6e0-... AND parent IS EMPTY AND text ~ "login"
+    ORDER BY created DESC
+
+Conditions compare a field with a value (``=``, ``!=``, ``~``, ``<``,
+``<=``, ``>``, ``>=``), test it with ``IS [NOT] EMPTY`` or against a list
+with ``[NOT] IN (...)``, and combine with ``AND``, ``OR``, ``NOT`` and
+parentheses. Keywords and field names are case-insensitive; values are
+bare words or quoted strings.
+
+Fields
+------
+    id, parent (uuid): The task's own id or its parent's.
+    project (uuid or name): The task's project, by id or, with ``=`` and
+        ``!=``, by exact name.
+    owner (uuid): The owner of the task's project.
+    ancestor (uuid): Any task above this one; a range on the path index.
+    text (words): Full-text match on name and description, see ``search``.
+    created (date or datetime): Creation time, read from the uuid7 id.
+    name, description (string): Exact (``=``) or substring (``~``) match.
+
+The whole query becomes one ``select`` over tasks, with projects joined
+in through subqueries; nothing is filtered in Python. Ordering is by
+``created`` or ``id``, both of which are the primary key order, so pages
+are fetched with the usual keyset cursor.
+
+Compilation is cached by the query's normalized shape: keywords
+upper-cased, whitespace collapsed and every value replaced by a typed
+placeholder. Queries that differ only in their values share one compiled
+statement and are bound to their own values on execution.
+
+A filter that no index can narrow down is rejected. A condition that
+cannot use an index but is combined with ``AND`` with one that can is
+allowed, and reported once per query shape through the module's logger.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, NoReturn
+from uuid import UUID
+
+from sqlalchemy import and_, bindparam, func, not_, or_, select
+from uuid_extensions import uuid7
+
+from kairo.domain.exceptions import InvalidQueryError
+from kairo.infrastructure.sqlalchemy.models.project import ProjectModel
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+from kairo.infrastructure.sqlalchemy.search import prepare_text_query, text_matches
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import BindParameter, ColumnElement, Select
+    from sqlalchemy.orm import InstrumentedAttribute
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+COMPILE_CACHE_SIZE = 256
+MAX_QUERY_LENGTH = 2048
+
+KEYWORDS = frozenset(
+    {"AND", "OR", "NOT", "IS", "EMPTY", "NULL", "IN", "ORDER", "BY", "ASC", "DESC"},
+)
+COMPARISONS = ("!=", "<=", ">=", "=", "<", ">", "~")
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+    | (?P<op>!=|<=|>=|=|<|>|~)
+    | (?P<punct>[(),])
+    | (?P<word>[^\s()=!<>~,"']+)
+    """,
+    re.VERBOSE,
+)
+_ESCAPE = re.compile(r"\\(.)")
+_UUID = re.compile(r"[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}")
+
+
+class Token(NamedTuple):
+    """One token of a query's shape.
+
+    Values are not part of the shape: a value token's ``text`` is ``?``
+    followed by its kind, ``uuid`` for a bare uuid and ``text`` otherwise.
+    """
+
+    kind: str
+    text: str
+
+
+def tokenize(query: str) -> tuple[tuple[Token, ...], list[str]]:
+    """Split ``query`` into its shape and the values it holds, in order.
+
+    A bare word is a value right after a comparison or inside an ``IN``
+    list and a keyword or field name anywhere else.
+
+    :raises InvalidQueryError: If the query is too long or cannot be
+        tokenized.
+    """
+    if len(query) > MAX_QUERY_LENGTH:
+        msg = f"Query is longer than {MAX_QUERY_LENGTH} characters."
+        raise InvalidQueryError(msg)
+    shape: list[Token] = []
+    values: list[str] = []
+    in_list = False
+    position = 0
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None:
+            msg = f"Unterminated string at position {position}."
+            raise InvalidQueryError(msg)
+        position = match.end()
+        kind, text = match.lastgroup, match.group()
+        previous = shape[-1] if shape else None
+        expects_value = in_list or (previous is not None and previous.kind == "op")
+        if kind == "space":
+            continue
+        if kind == "string":
+            values.append(_ESCAPE.sub(r"\1", text[1:-1]))
+            shape.append(Token("value", "?text"))
+        elif kind == "word" and expects_value:
+            values.append(text)
+            value_kind = "uuid" if _UUID.fullmatch(text) else "text"
+            shape.append(Token("value", f"?{value_kind}"))
+        elif kind == "word":
+            shape.append(_name_token(text))
+        else:
+            if text == "(" and previous == Token("keyword", "IN"):
+                in_list = True
+            elif text == ")":
+                in_list = False
+            shape.append(Token(kind or "", text))
+    return tuple(shape), values
+
+
+def _name_token(word: str) -> Token:
+    upper = word.upper()
+    if upper in KEYWORDS:
+        return Token("keyword", upper)
+    return Token("field", word.lower())
+
+
+def normalize(shape: Sequence[Token]) -> str:
+    """Render a query shape as the text it is cached under."""
+    return " ".join(token.text for token in shape)
+
+
+# Abstract syntax tree ------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class Value:
+    """A placeholder for the ``index``-th value of a query."""
+
+    index: int
+    kind: str
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """``field op value``."""
+
+    field: str
+    op: str
+    value: Value
+
+
+@dataclass(frozen=True, slots=True)
+class IsEmpty:
+    """``field IS [NOT] EMPTY``."""
+
+    field: str
+    negated: bool
+
+
+@dataclass(frozen=True, slots=True)
+class InList:
+    """``field [NOT] IN (values)``."""
+
+    field: str
+    values: tuple[Value, ...]
+    negated: bool
+
+
+@dataclass(frozen=True, slots=True)
+class BoolOp:
+    """``AND`` or ``OR`` over two or more conditions."""
+
+    op: str
+    children: tuple[Condition, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Not:
+    """``NOT condition``."""
+
+    child: Condition
+
+
+Condition = Comparison | IsEmpty | InList | BoolOp | Not
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedQuery:
+    """A parsed query: its filter, if any, and its ordering."""
+
+    condition: Condition | None
+    order_by: str = "created"
+    descending: bool = False
+
+
+class _Parser:
+    """Recursive-descent parser over a query shape."""
+
+    def __init__(self, shape: Sequence[Token]) -> None:
+        self.shape = shape
+        self.position = 0
+        self.values = 0
+
+    def parse(self) -> ParsedQuery:
+        condition = None
+        if self._peek() not in {None, Token("keyword", "ORDER")}:
+            condition = self._or()
+        order_by, descending = "created", False
+        if self._accept(Token("keyword", "ORDER")):
+            self._expect(Token("keyword", "BY"))
+            order_by = self._field()
+            if self._accept(Token("keyword", "DESC")):
+                descending = True
+            else:
+                self._accept(Token("keyword", "ASC"))
+            if self._peek() == Token("punct", ","):
+                msg = "Only one ORDER BY field is supported."
+                raise InvalidQueryError(msg)
+        if self._peek() is not None:
+            self._unexpected()
+        return ParsedQuery(condition, order_by, descending)
+
+    def _or(self) -> Condition:
+        children = [self._and()]
+        while self._accept(Token("keyword", "OR")):
+            children.append(self._and())
+        return children[0] if len(children) == 1 else BoolOp("OR", tuple(children))
+
+    def _and(self) -> Condition:
+        children = [self._not()]
+        while self._accept(Token("keyword", "AND")):
+            children.append(self._not())
+        return children[0] if len(children) == 1 else BoolOp("AND", tuple(children))
+
+    def _not(self) -> Condition:
+        if self._accept(Token("keyword", "NOT")):
+            return Not(self._not())
+        if self._accept(Token("punct", "(")):
+            condition = self._or()
+            self._expect(Token("punct", ")"))
+            return condition
+        return self._predicate()
+
+    def _predicate(self) -> Condition:
+        field = self._field()
+        token = self._peek()
+        if token is not None and token.kind == "op":
+            self.position += 1
+            return Comparison(field, token.text, self._value())
+        if self._accept(Token("keyword", "IS")):
+            negated = self._accept(Token("keyword", "NOT"))
+            if not (
+                self._accept(Token("keyword", "EMPTY"))
+                or self._accept(Token("keyword", "NULL"))
+            ):
+                self._unexpected()
+            return IsEmpty(field, negated)
+        negated = self._accept(Token("keyword", "NOT"))
+        self._expect(Token("keyword", "IN"))
+        self._expect(Token("punct", "("))
+        values = [self._value()]
+        while self._accept(Token("punct", ",")):
+            values.append(self._value())
+        self._expect(Token("punct", ")"))
+        return InList(field, tuple(values), negated)
+
+    def _field(self) -> str:
+        token = self._peek()
+        if token is None or token.kind != "field":
+            self._unexpected()
+        self.position += 1
+        return token.text
+
+    def _value(self) -> Value:
+        token = self._peek()
+        if token is None or token.kind != "value":
+            self._unexpected()
+        self.position += 1
+        value = Value(self.values, token.text[1:])
+        self.values += 1
+        return value
+
+    def _peek(self) -> Token | None:
+        return self.shape[self.position] if self.position < len(self.shape) else None
+
+    def _accept(self, token: Token) -> bool:
+        if self._peek() == token:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, token: Token) -> None:
+        if not self._accept(token):
+            self._unexpected(expected=token.text)
+
+    def _unexpected(self, expected: str | None = None) -> NoReturn:
+        token = self._peek()
+        found = "end of query" if token is None else repr(token.text)
+        where = normalize(self.shape[: self.position]) or "the start"
+        msg = f"Unexpected {found} after {where!r}."
+        if expected is not None:
+            msg = f"Expected {expected!r} but found {found} after {where!r}."
+        raise InvalidQueryError(msg)
+
+
+def parse(shape: Sequence[Token]) -> ParsedQuery:
+    """Parse a query shape produced by ``tokenize``.
+
+    :raises InvalidQueryError: If the query is not well-formed.
+    """
+    return _Parser(shape).parse()
+
+
+def render(condition: Condition) -> str:
+    """Render a condition back as normalized query text."""
+    if isinstance(condition, Comparison):
+        return f"{condition.field} {condition.op} ?"
+    if isinstance(condition, IsEmpty):
+        return f"{condition.field} IS {'NOT ' if condition.negated else ''}EMPTY"
+    if isinstance(condition, InList):
+        values = ", ".join("?" for _ in condition.values)
+        return f"{condition.field} {'NOT ' if condition.negated else ''}IN ({values})"
+    if isinstance(condition, Not):
+        return f"NOT {render(condition.child)}"
+    return f" {condition.op} ".join(
+        f"({render(child)})" for child in condition.children
+    )
+
+
+# Compilation ---------------------------------------------------------------
+
+Converter = Callable[[str], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Bind:
+    """How to fill one bind parameter from the query's values."""
+
+    name: str
+    value_index: int
+    convert: Converter
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledQuery:
+    """A query shape compiled into a reusable select of tasks.
+
+    Attributes
+    ----------
+        normalized (str): The shape the query is cached under.
+        statement (Select): Unordered select of ``TaskModel`` rows.
+        binds (tuple[Bind, ...]): Parameters to fill from the values.
+        descending (bool): Whether pages run from the newest task.
+        warnings (tuple[str, ...]): Conditions evaluated without an index.
+
+    """
+
+    normalized: str
+    statement: Select[tuple[TaskModel]]
+    binds: tuple[Bind, ...]
+    descending: bool
+    warnings: tuple[str, ...]
+
+    def bind(self, values: Sequence[str]) -> dict[str, Any]:
+        """Convert a query's values into bind parameters.
+
+        :raises InvalidQueryError: If a value has the wrong type.
+        """
+        return {
+            bind.name: bind.convert(values[bind.value_index]) for bind in self.binds
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _Compiled:
+    clause: ColumnElement[bool]
+    indexed: bool
+    warnings: tuple[str, ...] = ()
+
+
+def _to_uuid(value: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        msg = f"{value!r} is not a valid id."
+        raise InvalidQueryError(msg) from None
+
+
+def _lowest_uuid7(instant: datetime) -> UUID:
+    # Task ids come from uuid7, whose top 64 bits hold the creation time;
+    # clearing the counter and random bits gives the smallest id at it.
+    nanoseconds = (instant - _EPOCH) // timedelta(microseconds=1) * 1000
+    time_bits = uuid7(ns=nanoseconds, as_type="int") >> 64
+    return UUID(int=time_bits << 64)
+
+
+def _to_time_range(value: str) -> tuple[UUID, UUID]:
+    """Return the smallest uuid7 of a date or instant and of the next one.
+
+    Times without an offset are taken as UTC.
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        msg = f"{value!r} is not a valid date or datetime."
+        raise InvalidQueryError(msg) from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    is_date = len(value) == len("YYYY-MM-DD")
+    step = timedelta(days=1) if is_date else timedelta(milliseconds=1)
+    return _lowest_uuid7(moment), _lowest_uuid7(moment + step)
+
+
+def _contains_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class _Compiler:
+    """Compile a parsed query into SQL conditions on ``TaskModel``."""
+
+    def __init__(self, dialect: str) -> None:
+        self.dialect = dialect
+        self.binds: list[Bind] = []
+
+    def param(
+        self,
+        value: Value,
+        convert: Converter,
+        column: InstrumentedAttribute[Any],
+        suffix: str = "",
+    ) -> BindParameter[Any]:
+        name = f"p{value.index}{suffix}"
+        self.binds.append(Bind(name, value.index, convert))
+        return bindparam(name, type_=column.type)
+
+    def compile(self, condition: Condition) -> _Compiled:
+        if isinstance(condition, BoolOp):
+            return self._bool_op(condition)
+        if isinstance(condition, Not):
+            child = self.compile(condition.child)
+            return _Compiled(not_(child.clause), indexed=False)
+        field = condition.field
+        handler = getattr(self, f"_field_{field}", None)
+        if handler is None:
+            msg = f"Unknown field {field!r}."
+            raise InvalidQueryError(msg)
+        compiled: _Compiled = handler(condition)
+        return compiled
+
+    def _bool_op(self, condition: BoolOp) -> _Compiled:
+        children = [self.compile(child) for child in condition.children]
+        clauses = [child.clause for child in children]
+        warnings = [warning for child in children for warning in child.warnings]
+        if condition.op == "OR":
+            indexed = all(child.indexed for child in children)
+            return _Compiled(or_(*clauses), indexed=indexed, warnings=tuple(warnings))
+        indexed = any(child.indexed for child in children)
+        if indexed:
+            # The indexed conditions narrow the rows; these only filter them.
+            warnings.extend(
+                render(node)
+                for node, child in zip(condition.children, children, strict=True)
+                if not child.indexed
+            )
+        return _Compiled(and_(*clauses), indexed=indexed, warnings=tuple(warnings))
+
+    def _uuid_field(
+        self,
+        condition: Condition,
+        column: InstrumentedAttribute[Any],
+        *,
+        nullable: bool,
+    ) -> _Compiled:
+        # Only the positive forms can seek; negations match most rows.
+        clause: ColumnElement[bool]
+        if isinstance(condition, IsEmpty) and nullable:
+            clause = column.is_not(None) if condition.negated else column.is_(None)
+            return _Compiled(clause, indexed=not condition.negated)
+        if isinstance(condition, InList):
+            values = [self.param(value, _to_uuid, column) for value in condition.values]
+            clause = column.not_in(values) if condition.negated else column.in_(values)
+            return _Compiled(clause, indexed=not condition.negated)
+        if isinstance(condition, Comparison) and condition.op in {"=", "!="}:
+            value = self.param(condition.value, _to_uuid, column)
+            negated = condition.op == "!="
+            clause = column != value if negated else column == value
+            return _Compiled(clause, indexed=not negated)
+        return self._unsupported(condition)
+
+    def _field_id(self, condition: Condition) -> _Compiled:
+        return self._uuid_field(condition, TaskModel.id, nullable=False)
+
+    def _field_parent(self, condition: Condition) -> _Compiled:
+        return self._uuid_field(condition, TaskModel.parent_id, nullable=True)
+
+    def _field_project(self, condition: Condition) -> _Compiled:
+        if isinstance(condition, Comparison) and condition.value.kind != "uuid":
+            # A project name: resolve it to ids inside the same statement.
+            name = self.param(condition.value, str, ProjectModel.name)
+            by_name = select(ProjectModel.id).where(ProjectModel.name == name)
+            if condition.op == "=":
+                return _Compiled(TaskModel.project_id.in_(by_name), indexed=True)
+            if condition.op == "!=":
+                return _Compiled(TaskModel.project_id.not_in(by_name), indexed=False)
+        return self._uuid_field(condition, TaskModel.project_id, nullable=True)
+
+    def _field_owner(self, condition: Condition) -> _Compiled:
+        if isinstance(condition, Comparison) and condition.op == "=":
+            owners = [self.param(condition.value, _to_uuid, ProjectModel.owner_id)]
+        elif isinstance(condition, InList) and not condition.negated:
+            owners = [
+                self.param(value, _to_uuid, ProjectModel.owner_id)
+                for value in condition.values
+            ]
+        else:
+            return self._unsupported(condition)
+        projects = select(ProjectModel.id).where(ProjectModel.owner_id.in_(owners))
+        return _Compiled(TaskModel.project_id.in_(projects), indexed=True)
+
+    def _field_ancestor(self, condition: Condition) -> _Compiled:
+        if not (isinstance(condition, Comparison) and condition.op == "="):
+            return self._unsupported(condition)
+        ancestor = (
+            select(TaskModel.path)
+            .where(TaskModel.id == self.param(condition.value, _to_uuid, TaskModel.id))
+            .scalar_subquery()
+        )
+        # The SQL form of hierarchy.in_subtree, for a path read in the query.
+        upper = func.substr(ancestor, 1, func.length(ancestor) - 1) + "0"
+        return _Compiled(
+            and_(TaskModel.path > ancestor, TaskModel.path < upper),
+            indexed=True,
+        )
+
+    def _field_text(self, condition: Condition) -> _Compiled:
+        if not (isinstance(condition, Comparison) and condition.op == "~"):
+            return self._unsupported(condition)
+
+        def prepare(value: str) -> str:
+            prepared = prepare_text_query(self.dialect, value)
+            if prepared is None:
+                msg = "text ~ needs at least one word to search for."
+                raise InvalidQueryError(msg)
+            return prepared
+
+        value = self.param(condition.value, prepare, TaskModel.name)
+        return _Compiled(text_matches(self.dialect, value), indexed=True)
+
+    def _field_created(self, condition: Condition) -> _Compiled:
+        if not isinstance(condition, Comparison) or condition.op in {"!=", "~"}:
+            return self._unsupported(condition)
+        # A date or instant covers [lower, upper) in id order.
+        lower = self.param(
+            condition.value,
+            lambda v: _to_time_range(v)[0],
+            TaskModel.id,
+            "_lo",
+        )
+        upper = self.param(
+            condition.value,
+            lambda v: _to_time_range(v)[1],
+            TaskModel.id,
+            "_hi",
+        )
+        clause = {
+            "=": and_(TaskModel.id >= lower, TaskModel.id < upper),
+            "<": TaskModel.id < lower,
+            "<=": TaskModel.id < upper,
+            ">": TaskModel.id >= upper,
+            ">=": TaskModel.id >= lower,
+        }[condition.op]
+        return _Compiled(clause, indexed=True)
+
+    def _text_field(
+        self,
+        condition: Condition,
+        column: InstrumentedAttribute[str],
+    ) -> _Compiled:
+        if isinstance(condition, Comparison) and condition.op in {"=", "!="}:
+            value = self.param(condition.value, str, column)
+            clause = column == value if condition.op == "=" else column != value
+            return _Compiled(clause, indexed=False)
+        if isinstance(condition, Comparison) and condition.op == "~":
+            pattern = self.param(condition.value, _contains_pattern, column)
+            return _Compiled(column.ilike(pattern, escape="\\"), indexed=False)
+        return self._unsupported(condition)
+
+    def _field_name(self, condition: Condition) -> _Compiled:
+        return self._text_field(condition, TaskModel.name)
+
+    def _field_description(self, condition: Condition) -> _Compiled:
+        return self._text_field(condition, TaskModel.description)
+
+    def _unsupported(self, condition: Condition) -> NoReturn:
+        msg = f"Unsupported condition: {render(condition)}."
+        raise InvalidQueryError(msg)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_shape(shape: tuple[Token, ...], dialect: str) -> CompiledQuery:
+    """Parse and compile a query shape for ``dialect``; cached.
+
+    :raises InvalidQueryError: If the query is malformed or no index can
+        narrow down its filter.
+    """
+    parsed = parse(shape)
+    if parsed.order_by not in {"created", "id"}:
+        msg = "Tasks can only be ordered by created or id."
+        raise InvalidQueryError(msg)
+    compiler = _Compiler(dialect)
+    statement = select(TaskModel)
+    warnings: tuple[str, ...] = ()
+    if parsed.condition is not None:
+        compiled = compiler.compile(parsed.condition)
+        if not compiled.indexed:
+            msg = (
+                f"Query cannot use an index: {render(parsed.condition)}. "
+                "Combine it with AND and a condition on id, project, owner, "
+                "parent, ancestor, text or created."
+            )
+            raise InvalidQueryError(msg)
+        statement = statement.where(compiled.clause)
+        warnings = compiled.warnings
+    normalized = normalize(shape)
+    for warning in warnings:
+        logger.warning("Query %r filters %s without an index.", normalized, warning)
+    return CompiledQuery(
+        normalized=normalized,
+        statement=statement,
+        binds=tuple(compiler.binds),
+        descending=parsed.descending,
+        warnings=warnings,
+    )
+
+
+def compile_task_query(
+    query: str,
+    dialect: str,
+) -> tuple[CompiledQuery, dict[str, Any]]:
+    """Compile ``query`` for ``dialect`` and bind its values.
+
+    :return: The cached compiled query and its bind parameters.
+    :raises InvalidQueryError: If the query is malformed, has values of
+        the wrong type or cannot use an index.
+    """
+    shape, values = tokenize(query)
+    compiled = compile_shape(shape, dialect)
+    return compiled, compiled.bind(values)
@@ -0,0 +1,188 @@
+"""Unit of Work: an identity map and writes deferred to one batched flush.
+
+Gateways given a ``UnitOfWork`` pass every entity they load through its
+identity map, so an id loaded twice in one unit is one object and, when
+looked up by id, one query. Instead of writing each ``update``, ``delete``
+and task or project ``create`` immediately, they register the entity as
+dirty, removed or new. ``flush`` then writes each group with one
+statement per entity type and operation: a multi-row INSERT, an
+executemany UPDATE of the changed columns (one per set of them) and a
+single ``DELETE ... WHERE id IN``. It inserts and updates parents before
+children and deletes children before parents. Users are the exception
+for updates: each is written with its own UPDATE ... RETURNING, so that
+``updated_at`` is refreshed and a missing user is reported.
+
+User inserts are not deferred. ``UserWriter.save`` reports a taken email
+or username itself, and only the INSERT can tell. Neither are the task
+removals of a saved project, which are deleted by id *and* project so
+that an id from another project cannot delete its task.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from kairo.application.interfaces import DBSession, IdentityMap
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Sequence
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kairo.domain.entities.base import Identified
+
+E = TypeVar("E", bound="Identified")
+E_contra = TypeVar("E_contra", contravariant=True)
+
+# Parents first; foreign keys point from later types to earlier ones.
+FLUSH_ORDER: tuple[type, ...] = (User, Project, Task)
+
+
+class BatchWriter(Protocol[E_contra]):
+    """Writes many entities of one type, one statement per call."""
+
+    async def update_many(self, entities: Sequence[E_contra]) -> None:
+        """Write the current state of existing entities."""
+
+    async def delete_many(self, ids: Collection[UUID]) -> None:
+        """Delete the entities with these ids."""
+
+
+class BatchInserter(BatchWriter[E_contra], Protocol[E_contra]):
+    """A ``BatchWriter`` for the types whose inserts are deferred too."""
+
+    async def insert_many(self, entities: Sequence[E_contra]) -> None:
+        """Insert new entities."""
+
+
+class UnitOfWork(DBSession, IdentityMap):
+    """A ``DBSession`` that defers writes to ``flush`` and maps identities.
+
+    Entities stay pending until ``flush`` or ``commit``. A failed flush
+    leaves them pending, and only ``rollback`` discards them. Both
+    ``commit`` and ``rollback`` empty the identity map, so a request that
+    commits in chunks only holds on to the current chunk.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._identity_map: dict[tuple[type, UUID], Any] = {}
+        self._new: dict[type, dict[UUID, Any]] = {t: {} for t in FLUSH_ORDER}
+        self._dirty: dict[type, dict[UUID, Any]] = {t: {} for t in FLUSH_ORDER}
+        self._removed: dict[type, set[UUID]] = {t: set() for t in FLUSH_ORDER}
+        # Without a unit of work of their own, these write immediately.
+        projects = ProjectGateway(session)
+        tasks = TaskGateway(session)
+        self._writers: dict[type, BatchWriter[Any]] = {
+            User: UserGateway(session),
+            Project: projects,
+            Task: tasks,
+        }
+        # In FLUSH_ORDER; users are inserted by ``UserWriter.save`` only.
+        self._inserters: dict[type, BatchInserter[Any]] = {
+            Project: projects,
+            Task: tasks,
+        }
+
+    def get(self, entity_type: type[E], entity_id: UUID) -> E | None:
+        """Return the entity already loaded in this unit, if any."""
+        return self._identity_map.get((entity_type, entity_id))
+
+    def is_removed(self, entity_type: type, entity_id: UUID) -> bool:
+        """Tell whether the entity was deleted in this unit."""
+        return entity_id in self._removed[entity_type]
+
+    def merge(self, entity: E) -> E:
+        """Return the mapped entity with this id, mapping ``entity`` if new.
+
+        The object already in the map wins, so changes made to it and not
+        yet flushed are not overwritten by a later load.
+        """
+        key = (type(entity), entity.id)
+        mapped = self._identity_map.get(key)
+        if mapped is None:
+            self._identity_map[key] = mapped = entity
+        return mapped
+
+    def merge_all(self, entities: Iterable[E]) -> list[E]:
+        """Merge every entity, keeping their order."""
+        return [self.merge(entity) for entity in entities]
+
+    def register_new(self, entity: Project | Task) -> None:
+        """Insert the entity at the next flush."""
+        self._new[type(entity)][entity.id] = self.merge(entity)
+
+    def register_dirty(self, entity: Identified) -> None:
+        """Write the entity's state at the next flush."""
+        entity_type = type(entity)
+        self.merge(entity)
+        # A new entity is inserted with its latest state anyway, and a
+        # dirty one only writes the fields it changed.
+        if entity.id not in self._new[entity_type]:
+            self._dirty[entity_type][entity.id] = entity
+
+    def register_removed(self, entity: Identified) -> None:
+        """Delete the entity at the next flush."""
+        self.register_removed_ids(type(entity), [entity.id])
+
+    def register_removed_ids(
+        self,
+        entity_type: type,
+        entity_ids: Iterable[UUID],
+    ) -> None:
+        """Delete the entities of this type with these ids at the next flush."""
+        removed = self._removed[entity_type]
+        for entity_id in entity_ids:
+            # Never written, so nothing to delete.
+            if not self.forget(entity_type, entity_id):
+                removed.add(entity_id)
+
+    def forget(self, entity_type: type, entity_id: UUID) -> bool:
+        """Drop the entity from the map and its pending insert or update.
+
+        :returns: Whether the entity was new, that is never written.
+        """
+        self._dirty[entity_type].pop(entity_id, None)
+        self._identity_map.pop((entity_type, entity_id), None)
+        return self._new[entity_type].pop(entity_id, None) is not None
+
+    async def flush(self) -> None:
+        """Write the pending entities, one statement per type and operation."""
+        for entity_type, inserter in self._inserters.items():
+            if new := self._new[entity_type]:
+                await inserter.insert_many(list(new.values()))
+                new.clear()
+        writers = self._writers
+        for entity_type in FLUSH_ORDER:
+            if dirty := self._dirty[entity_type]:
+                await writers[entity_type].update_many(list(dirty.values()))
+                dirty.clear()
+        for entity_type in reversed(FLUSH_ORDER):
+            if removed := self._removed[entity_type]:
+                await writers[entity_type].delete_many(list(removed))
+                removed.clear()
+        await self.session.flush()
+
+    async def commit(self) -> None:
+        """Flush the pending entities, commit and empty the identity map."""
+        await self.flush()
+        await self.session.commit()
+        self._clear()
+
+    async def rollback(self) -> None:
+        """Discard the pending entities and the identity map, then roll back."""
+        self._clear()
+        await self.session.rollback()
+
+    def _clear(self) -> None:
+        for pending in (self._new, self._dirty, self._removed):
+            for entities in pending.values():
+                entities.clear()
+        self._identity_map.clear()
@@ -0,0 +1,675 @@
+"""Dependency injection container with APP, REQUEST and ACTION scopes.
+
+Providers are registered on a ``Registry`` with the scope of the objects
+they make, and their dependencies are read from their type annotations.
+``Registry.build`` checks the whole graph once, at startup: every
+dependency has a provider, nothing depends on an object that lives
+shorter than itself and nothing depends on itself. It then computes, for
+every key, the ordered steps that create it and whatever it needs, so
+resolving an object walks a precomputed tuple instead of the graph.
+
+A ``Container`` holds the objects of one scope and caches them for the
+scope's lifetime. Entering the APP container creates every APP object
+up front, so requests never race to create a singleton; the scopes below
+it create objects on first use. Leaving a scope finalizes what it
+created, last created first: providers written as generators run the
+code after their ``yield``, which is where sessions are closed.
+
+The second half of the module registers Kairo's own graph.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Literal, Self, TypeVar, cast, get_args, get_type_hints
+
+from sqlalchemy.ext.asyncio import (  # noqa: TC002
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from kairo.application.caching import (
+    CacheInvalidatingSession,
+    CachingUserGateway,
+    UserCache,
+)
+from kairo.application.interactors.project import GetUserProjectsUseCase
+from kairo.application.interactors.task import (
+    ExportProjectTasksUseCase,
+    FindTasksUseCase,
+    GetProjectTasksUseCase,
+    GetSubtasksUseCase,
+    SearchTasksUseCase,
+)
+from kairo.application.interactors.user import (
+    CreateUsersBulkUseCase,
+    CreateUserUseCase,
+    GetUserByIdUseCase,
+    VerifyCredentialsUseCase,
+)
+from kairo.application.interfaces import DBSession, GatewayFactory, PasswordHasher
+from kairo.application.loaders import BatchedUserReader
+from kairo.config import Settings
+from kairo.domain.gateways.project_gateway import ProjectGateway
+from kairo.domain.gateways.task_gateway import TaskGateway, TaskReader
+from kairo.domain.gateways.user_gateway import UserGateway, UserReader
+from kairo.infrastructure.cache.factory import create_user_cache
+from kairo.infrastructure.security.scrypt_hasher import ScryptPasswordHasher
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import (
+    ProjectGateway as SQLAlchemyProjectGateway,
+)
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import (
+    TaskGateway as SQLAlchemyTaskGateway,
+)
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import (
+    UserGateway as SQLAlchemyUserGateway,
+)
+from kairo.infrastructure.sqlalchemy.instrumentation import (
+    QueryTally,
+    instrument_engine,
+)
+from kairo.infrastructure.sqlalchemy.unit_of_work import UnitOfWork
+
+T = TypeVar("T")
+
+Kind = Literal["call", "await", "context", "async_context", "value"]
+
+
+class Scope(IntEnum):
+    """Lifetimes of provided objects, longest first."""
+
+    APP = 0
+    REQUEST = 1
+    ACTION = 2
+
+
+class ContainerError(Exception):
+    """Raised when the graph is invalid or an object cannot be resolved."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+@dataclass(frozen=True, slots=True)
+class Provider:
+    """How the object registered under ``key`` is made.
+
+    Attributes
+    ----------
+        key (Any): Type the object is looked up by.
+        scope (Scope): Scope whose lifetime the object shares.
+        factory (Callable[..., Any] | None): Makes the object from its
+            dependencies; None for values passed in when the scope is
+            entered.
+        dependencies (tuple[Any, ...]): Keys of the factory's arguments.
+        kind (Kind): Whether the factory returns the object, a coroutine,
+            or a context manager that finalizes it.
+
+    """
+
+    key: Any
+    scope: Scope
+    factory: Callable[..., Any] | None
+    dependencies: tuple[Any, ...]
+    kind: Kind
+
+
+@dataclass(frozen=True, slots=True)
+class _Step:
+    key: Any
+    scope: Scope
+    factory: Callable[..., Any]
+    kind: Kind
+    # (scope, key) of every argument, so it is read from the right cache.
+    arguments: tuple[tuple[Scope, Any], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Plan:
+    scope: Scope
+    steps: tuple[_Step, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Graph:
+    plans: dict[Any, _Plan]
+    app_steps: tuple[_Step, ...]
+    context_keys: dict[Scope, tuple[Any, ...]] = field(default_factory=dict)
+
+
+class Registry:
+    """The providers of a container, checked and compiled by ``build``."""
+
+    def __init__(self) -> None:
+        self._providers: dict[Any, Provider] = {}
+        self._aliases: dict[Any, Any] = {}
+
+    def provide(
+        self,
+        factory: Callable[..., Any],
+        *,
+        scope: Scope,
+        provides: Any = None,  # noqa: ANN401
+    ) -> None:
+        """Register a class or function that makes an object.
+
+        Generator functions are entered as context managers and finalized
+        with their scope. The object is registered under ``provides``, or
+        else under the class or the function's return annotation.
+
+        :raises ContainerError: If an annotation is missing or unresolvable,
+            or the key already has a provider.
+        """
+        if inspect.isclass(factory):
+            hints = _type_hints(factory.__init__, factory)
+            produced: Any = factory
+        else:
+            hints = _type_hints(factory, factory)
+            produced = hints.get("return")
+        dependencies = []
+        for name, parameter in inspect.signature(factory).parameters.items():
+            if parameter.default is not inspect.Parameter.empty:
+                continue
+            if name not in hints:
+                msg = f"{factory.__qualname__}: parameter {name!r} has no annotation."
+                raise ContainerError(msg)
+            dependencies.append(hints[name])
+
+        kind: Kind = "call"
+        if inspect.isasyncgenfunction(factory):
+            kind, factory = "async_context", asynccontextmanager(factory)
+            produced = get_args(produced)[0] if produced is not None else None
+        elif inspect.isgeneratorfunction(factory):
+            kind, factory = "context", contextmanager(factory)
+            produced = get_args(produced)[0] if produced is not None else None
+        elif inspect.iscoroutinefunction(factory):
+            kind = "await"
+
+        key = produced if provides is None else provides
+        if key is None:
+            msg = f"{factory.__qualname__}: no return annotation and no provides."
+            raise ContainerError(msg)
+        self._add(Provider(key, scope, factory, tuple(dependencies), kind))
+
+    def context(self, key: Any, *, scope: Scope) -> None:  # noqa: ANN401
+        """Declare an object passed in when ``scope`` is entered.
+
+        :raises ContainerError: If the key already has a provider.
+        """
+        self._add(Provider(key, scope, None, (), "value"))
+
+    def alias(self, key: Any, *, to: Any) -> None:  # noqa: ANN401
+        """Provide the object registered under ``to`` under ``key`` as well.
+
+        :raises ContainerError: If the key already has a provider.
+        """
+        if key in self._providers or key in self._aliases:
+            msg = f"{_name(key)} is already provided."
+            raise ContainerError(msg)
+        self._aliases[key] = to
+
+    def build(self, context: Mapping[Any, Any] | None = None) -> Container:
+        """Check the graph and return the APP container, ready to be entered.
+
+        Also precomputes the steps that resolve every key.
+
+        :param context: The values declared with ``Registry.context`` for
+            the APP scope.
+        :raises ContainerError: If a dependency has no provider, depends on
+            a shorter-lived scope or on itself.
+        """
+        providers = dict(self._providers)
+        for key, target in self._aliases.items():
+            source = providers.get(target)
+            if source is None:
+                msg = f"{_name(key)} aliases {_name(target)}, which has no provider."
+                raise ContainerError(msg)
+            providers[key] = Provider(key, source.scope, _same, (target,), "call")
+
+        for provider in providers.values():
+            for dependency in provider.dependencies:
+                needed = providers.get(dependency)
+                if needed is None:
+                    msg = (
+                        f"{_name(provider.key)} needs {_name(dependency)}, "
+                        "which has no provider."
+                    )
+                    raise ContainerError(msg)
+                if needed.scope > provider.scope:
+                    msg = (
+                        f"{_name(provider.key)} ({provider.scope.name}) cannot depend "
+                        f"on {_name(dependency)} ({needed.scope.name})."
+                    )
+                    raise ContainerError(msg)
+
+        orders = {key: _creation_order(providers, key) for key in providers}
+        plans = {
+            key: _Plan(
+                providers[key].scope,
+                tuple(
+                    _step(providers, needed)
+                    for needed in order
+                    if providers[needed].scope is not Scope.APP
+                    and providers[needed].kind != "value"
+                ),
+            )
+            for key, order in orders.items()
+        }
+        app_steps = {
+            needed: _step(providers, needed)
+            for key, provider in providers.items()
+            if provider.scope is Scope.APP
+            for needed in orders[key]
+            if providers[needed].kind != "value"
+        }
+        context_keys: dict[Scope, tuple[Any, ...]] = {
+            scope: tuple(
+                key
+                for key, provider in providers.items()
+                if provider.scope is scope and provider.kind == "value"
+            )
+            for scope in Scope
+        }
+        return Container(
+            _Graph(plans, tuple(app_steps.values()), context_keys),
+            Scope.APP,
+            context=context,
+        )
+
+    def _add(self, provider: Provider) -> None:
+        if provider.key in self._providers or provider.key in self._aliases:
+            msg = f"{_name(provider.key)} is already provided."
+            raise ContainerError(msg)
+        self._providers[provider.key] = provider
+
+
+class Container:
+    """The objects of one scope, and the way into the scopes below it.
+
+    A container is used by one task at a time, the one handling its
+    request or action.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_caches",
+        "_context",
+        "_graph",
+        "_stack",
+        "_stacks",
+        "scope",
+    )
+
+    def __init__(
+        self,
+        graph: _Graph,
+        scope: Scope,
+        parent: Container | None = None,
+        context: Mapping[Any, Any] | None = None,
+    ) -> None:
+        self.scope = scope
+        self._graph = graph
+        self._context = context or {}
+        self._cache: dict[Any, Any] = {}
+        self._stack = AsyncExitStack()
+        # The caches and exit stacks of the open scopes, indexed by scope.
+        self._caches: tuple[dict[Any, Any], ...] = (self._cache,)
+        self._stacks: tuple[AsyncExitStack, ...] = (self._stack,)
+        if parent is not None:
+            self._caches = (*parent._caches, self._cache)  # noqa: SLF001
+            self._stacks = (*parent._stacks, self._stack)  # noqa: SLF001
+
+    def enter(self, context: Mapping[Any, Any] | None = None) -> Container:
+        """Return a container for the next scope, to be used with ``async with``.
+
+        :param context: The values declared with ``Registry.context`` for
+            that scope.
+        :raises ContainerError: If this is the innermost scope.
+        """
+        if self.scope is Scope.ACTION:
+            msg = "ACTION is the innermost scope."
+            raise ContainerError(msg)
+        return Container(self._graph, Scope(self.scope + 1), self, context)
+
+    async def get(self, key: type[T]) -> T:
+        """Return the object registered under ``key``, creating it if needed.
+
+        :raises ContainerError: If the key has no provider or lives in a
+            scope that is not open here.
+        """
+        cache = self._cache
+        if key in cache:
+            return cast("T", cache[key])
+        plan = self._graph.plans.get(key)
+        if plan is None:
+            msg = f"{_name(key)} has no provider."
+            raise ContainerError(msg)
+        if plan.scope > self.scope:
+            msg = f"{_name(key)} lives in the {plan.scope.name} scope, not open here."
+            raise ContainerError(msg)
+        caches = self._caches
+        for step in plan.steps:
+            owner = caches[step.scope]
+            if step.key not in owner:
+                owner[step.key] = await self._create(step)
+        return cast("T", caches[plan.scope][key])
+
+    async def __aenter__(self) -> Self:
+        missing = [
+            key
+            for key in self._graph.context_keys[self.scope]
+            if key not in self._context
+        ]
+        if missing:
+            names = ", ".join(_name(key) for key in missing)
+            msg = f"Entering {self.scope.name} needs values for {names}."
+            raise ContainerError(msg)
+        self._cache.update(self._context)
+        if self.scope is Scope.APP:
+            try:
+                for step in self._graph.app_steps:
+                    self._cache[step.key] = await self._create(step)
+            except BaseException:
+                await self._stack.aclose()
+                raise
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        try:
+            await self._stack.__aexit__(*exc_info)  # type: ignore[arg-type]
+        finally:
+            self._cache.clear()
+
+    async def _create(self, step: _Step) -> Any:  # noqa: ANN401
+        caches = self._caches
+        arguments = [caches[scope][key] for scope, key in step.arguments]
+        if step.kind == "call":
+            return step.factory(*arguments)
+        if step.kind == "await":
+            return await step.factory(*arguments)
+        # Finalized with the scope the object belongs to, not this one.
+        stack = self._stacks[step.scope]
+        if step.kind == "context":
+            return stack.enter_context(step.factory(*arguments))
+        return await stack.enter_async_context(step.factory(*arguments))
+
+
+def _type_hints(function: Callable[..., Any], owner: object) -> dict[str, Any]:
+    try:
+        return get_type_hints(function)
+    except NameError as exc:
+        name = getattr(owner, "__qualname__", owner)
+        msg = f"{name}: cannot resolve annotation {exc.name!r} at runtime."
+        raise ContainerError(msg) from exc
+
+
+def _creation_order(providers: dict[Any, Provider], key: Any) -> list[Any]:  # noqa: ANN401
+    """Return ``key`` and everything it needs, dependencies first."""
+    order: list[Any] = []
+    visiting: list[Any] = []
+
+    def visit(current: Any) -> None:  # noqa: ANN401
+        if current in order:
+            return
+        if current in visiting:
+            cycle = " -> ".join(_name(k) for k in [*visiting, current])
+            msg = f"Dependency cycle: {cycle}."
+            raise ContainerError(msg)
+        visiting.append(current)
+        for dependency in providers[current].dependencies:
+            visit(dependency)
+        visiting.pop()
+        order.append(current)
+
+    visit(key)
+    return order
+
+
+def _step(providers: dict[Any, Provider], key: Any) -> _Step:  # noqa: ANN401
+    provider = providers[key]
+    return _Step(
+        key,
+        provider.scope,
+        cast("Callable[..., Any]", provider.factory),
+        provider.kind,
+        tuple((providers[d].scope, d) for d in provider.dependencies),
+    )
+
+
+def _same(value: T) -> T:
+    return value
+
+
+def _name(key: Any) -> str:  # noqa: ANN401
+    return getattr(key, "__qualname__", None) or repr(key)
+
+
+# Kairo's providers.
+
+
+async def provide_engine(settings: Settings) -> AsyncIterator[AsyncEngine]:
+    """Create the application-wide engine and dispose of it on shutdown."""
+    engine = create_engine(settings.database)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def provide_query_totals(engine: AsyncEngine, settings: Settings) -> QueryTally:
+    """Count the statements run on the engine, logging the slow ones."""
+    return instrument_engine(engine, settings.database.slow_query_threshold or None)
+
+
+def provide_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory bound to the engine."""
+    return create_session_maker(engine)
+
+
+async def provide_user_cache(settings: Settings) -> AsyncIterator[UserCache | None]:
+    """Create the user cache, if caching is enabled, and close it on shutdown."""
+    user_cache = create_user_cache(settings.cache)
+    try:
+        yield user_cache
+    finally:
+        if user_cache is not None:
+            await user_cache.backend.close()
+
+
+def provide_password_hasher(settings: Settings) -> Iterator[PasswordHasher]:
+    """Start the password hashing pool and stop it on shutdown."""
+    password_hasher = ScryptPasswordHasher(settings.password)
+    try:
+        yield password_hasher
+    finally:
+        password_hasher.close()
+
+
+def provide_task_reader_factory(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> GatewayFactory[TaskReader]:
+    """Open task readers with sessions of their own, for streamed bodies."""
+
+    @asynccontextmanager
+    async def open_task_reader() -> AsyncIterator[TaskReader]:
+        async with session_maker() as session:
+            yield SQLAlchemyTaskGateway(session)
+
+    return open_task_reader
+
+
+async def provide_session(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[AsyncSession]:
+    """Open one session per request and close it with the request."""
+    async with session_maker() as session:
+        yield session
+
+
+def provide_unit_of_work(session: AsyncSession) -> UnitOfWork:
+    """Create the request's unit of work over its session."""
+    return UnitOfWork(session)
+
+
+def provide_user_gateway(
+    session: AsyncSession,
+    unit_of_work: UnitOfWork,
+    user_cache: UserCache | None,
+) -> UserGateway:
+    """Create the user gateway, cached by id when a user cache is configured."""
+    user_gateway = SQLAlchemyUserGateway(session, unit_of_work)
+    if user_cache is None:
+        return user_gateway
+    return CachingUserGateway(user_gateway, user_cache, unit_of_work)
+
+
+def provide_db_session(
+    unit_of_work: UnitOfWork,
+    user_gateway: UserGateway,
+) -> DBSession:
+    """Expose the request's unit of work as the application-level DBSession.
+
+    When users are cached, the session evicts written users after commit.
+    """
+    if isinstance(user_gateway, CachingUserGateway):
+        return CacheInvalidatingSession(unit_of_work, user_gateway)
+    return unit_of_work
+
+
+def provide_user_reader(user_gateway: UserGateway) -> UserReader:
+    """Create the request's user reader, which batches lookups by id."""
+    return BatchedUserReader(user_gateway)
+
+
+def provide_task_gateway(
+    session: AsyncSession,
+    unit_of_work: UnitOfWork,
+) -> TaskGateway:
+    """Create the task gateway."""
+    return SQLAlchemyTaskGateway(session, unit_of_work)
+
+
+def provide_project_gateway(
+    session: AsyncSession,
+    unit_of_work: UnitOfWork,
+) -> ProjectGateway:
+    """Create the project gateway."""
+    return SQLAlchemyProjectGateway(session, unit_of_work)
+
+
+def provide_create_user(
+    db_session: DBSession,
+    user_gateway: UserGateway,
+    password_hasher: PasswordHasher,
+) -> CreateUserUseCase:
+    """Create the user create use case."""
+    return CreateUserUseCase(db_session, user_gateway, password_hasher)
+
+
+def provide_create_users_bulk(
+    db_session: DBSession,
+    user_gateway: UserGateway,
+    password_hasher: PasswordHasher,
+) -> CreateUsersBulkUseCase:
+    """Create the bulk user create use case."""
+    return CreateUsersBulkUseCase(
+        db_session,
+        user_gateway,
+        user_gateway,
+        password_hasher,
+    )
+
+
+def provide_get_user_by_id(user_reader: UserReader) -> GetUserByIdUseCase:
+    """Create the user by ID use case."""
+    return GetUserByIdUseCase(user_reader)
+
+
+def provide_verify_credentials(
+    user_reader: UserReader,
+    password_hasher: PasswordHasher,
+) -> VerifyCredentialsUseCase:
+    """Create the credentials check use case."""
+    return VerifyCredentialsUseCase(user_reader, password_hasher)
+
+
+def provide_user_projects(project_gateway: ProjectGateway) -> GetUserProjectsUseCase:
+    """Create the user projects use case."""
+    return GetUserProjectsUseCase(project_gateway)
+
+
+def provide_project_tasks(task_gateway: TaskGateway) -> GetProjectTasksUseCase:
+    """Create the project tasks use case."""
+    return GetProjectTasksUseCase(task_gateway)
+
+
+def provide_export_project_tasks(
+    open_task_reader: GatewayFactory[TaskReader],
+) -> ExportProjectTasksUseCase:
+    """Create the project task export use case."""
+    return ExportProjectTasksUseCase(open_task_reader)
+
+
+def provide_subtasks(task_gateway: TaskGateway) -> GetSubtasksUseCase:
+    """Create the subtasks use case."""
+    return GetSubtasksUseCase(task_gateway)
+
+
+def provide_find_tasks(task_gateway: TaskGateway) -> FindTasksUseCase:
+    """Create the task query use case."""
+    return FindTasksUseCase(task_gateway)
+
+
+def provide_search_tasks(task_gateway: TaskGateway) -> SearchTasksUseCase:
+    """Create the task search use case."""
+    return SearchTasksUseCase(task_gateway)
+
+
+def kairo_registry() -> Registry:
+    """Register every Kairo provider; ``Settings`` is passed in at APP scope."""
+    registry = Registry()
+    registry.context(Settings, scope=Scope.APP)
+    app_providers: list[Callable[..., Any]] = [
+        provide_engine,
+        provide_query_totals,
+        provide_session_maker,
+        provide_user_cache,
+        provide_password_hasher,
+        provide_task_reader_factory,
+    ]
+    request_providers: list[Callable[..., Any]] = [
+        provide_session,
+        provide_unit_of_work,
+        provide_user_gateway,
+        provide_db_session,
+        provide_user_reader,
+        provide_task_gateway,
+        provide_project_gateway,
+        provide_create_user,
+        provide_create_users_bulk,
+        provide_get_user_by_id,
+        provide_verify_credentials,
+        provide_user_projects,
+        provide_project_tasks,
+        provide_export_project_tasks,
+        provide_subtasks,
+        provide_find_tasks,
+        provide_search_tasks,
+    ]
+    for provider in app_providers:
+        registry.provide(provider, scope=Scope.APP)
+    for provider in request_providers:
+        registry.provide(provider, scope=Scope.REQUEST)
+    return registry
+
+
+def create_container(settings: Settings) -> Container:
+    """Build Kairo's APP container, to be entered for the app's lifetime."""
+    return kairo_registry().build({Settings: settings})
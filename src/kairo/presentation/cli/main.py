@@ -0,0 +1,285 @@
+"""Command line interface for the ``kairo`` executable."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Sequence
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from kairo.config import DatabaseConfig, ServerConfig, Settings
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.hierarchy import (
+    check_task_paths,
+    repair_task_paths,
+)
+from kairo.infrastructure.sqlalchemy.migrations import (
+    MIGRATIONS,
+    MigrationEngine,
+    MigrationError,
+)
+from kairo.infrastructure.sqlalchemy.search import rebuild_task_search
+from kairo.presentation.loadtest.runner import (
+    LoadOptions,
+    LoadTestError,
+    format_report,
+    in_process_client,
+    remote_client,
+    run_scenario,
+)
+from kairo.presentation.loadtest.scenarios import SCENARIOS, load_scenarios
+
+
+async def _migrate(*, check_only: bool) -> int:
+    engine = create_engine(DatabaseConfig.from_env())
+    migration_engine = MigrationEngine(engine, MIGRATIONS)
+    try:
+        if check_only:
+            await migration_engine.check()
+            head = migration_engine.head
+            sys.stdout.write(f"Schema is up to date (version {head}).\n")
+            return 0
+
+        applied = await migration_engine.upgrade()
+    except MigrationError as exc:
+        sys.stderr.write(f"{exc.message}\n")
+        return 1
+    finally:
+        await engine.dispose()
+
+    for migration in applied:
+        sys.stdout.write(f"Applied {migration.version}: {migration.description}\n")
+    sys.stdout.write(f"Schema is at version {migration_engine.head}.\n")
+    return 0
+
+
+def _run_migrate(args: argparse.Namespace) -> int:
+    return asyncio.run(_migrate(check_only=args.check))
+
+
+async def _check_hierarchy(*, repair: bool) -> int:
+    engine = create_engine(DatabaseConfig.from_env())
+    try:
+        async with create_session_maker(engine)() as session:
+            mismatches = await check_task_paths(session)
+            if not mismatches:
+                sys.stdout.write("Task hierarchy is consistent.\n")
+                return 0
+            if repair:
+                repaired = await repair_task_paths(session)
+                await session.commit()
+                sys.stdout.write(f"Repaired {repaired} task paths.\n")
+                return 0
+    finally:
+        await engine.dispose()
+
+    for mismatch in mismatches:
+        sys.stderr.write(
+            f"Task {mismatch.task_id}: path {mismatch.stored!r}, "
+            f"expected {mismatch.expected!r}\n",
+        )
+    sys.stderr.write(
+        f"Found {len(mismatches)} inconsistent task paths; "
+        "run with --repair to rebuild them.\n",
+    )
+    return 1
+
+
+def _run_check_hierarchy(args: argparse.Namespace) -> int:
+    return asyncio.run(_check_hierarchy(repair=args.repair))
+
+
+async def _reindex_search() -> int:
+    engine = create_engine(DatabaseConfig.from_env())
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(rebuild_task_search)
+    finally:
+        await engine.dispose()
+    sys.stdout.write("Rebuilt the task search index.\n")
+    return 0
+
+
+def _run_reindex_search(args: argparse.Namespace) -> int:
+    return asyncio.run(_reindex_search())
+
+
+async def _loadtest(args: argparse.Namespace) -> int:
+    scenarios = dict(SCENARIOS)
+    if args.scenario_file is not None:
+        scenarios.update(load_scenarios(args.scenario_file))
+    if args.list:
+        for name, listed in scenarios.items():
+            sys.stdout.write(f"{name:<20} {listed.description}\n")
+        return 0
+    scenario = scenarios.get(args.scenario)
+    if scenario is None:
+        sys.stderr.write(f"Unknown scenario {args.scenario!r}; see --list.\n")
+        return 1
+    if args.users is not None:
+        scenario = replace(scenario, users=args.users)
+    options = LoadOptions(
+        concurrency=args.concurrency,
+        duration=args.duration,
+        seed=args.seed,
+    )
+    if args.url is None:
+        client = in_process_client(args.database_url)
+        target = "in-process app"
+    else:
+        client = remote_client(args.url, args.concurrency)
+        target = args.url
+    try:
+        async with client as http:
+            report = await run_scenario(http, scenario, options, target)
+    except LoadTestError as exc:
+        sys.stderr.write(f"{exc.message}\n")
+        return 1
+    sys.stdout.write(format_report(report))
+    if args.output is not None:
+        document = {**asdict(report), "throughput": report.throughput}
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    return 0
+
+
+def _run_loadtest(args: argparse.Namespace) -> int:
+    return asyncio.run(_loadtest(args))
+
+
+def _server_config(args: argparse.Namespace) -> ServerConfig:
+    config = ServerConfig.from_env()
+    overrides = {
+        name: getattr(args, name)
+        for name in ["host", "port", "workers"]
+        if getattr(args, name, None) is not None
+    }
+    return replace(config, **overrides)
+
+
+def _run_serve(args: argparse.Namespace) -> int:
+    from kairo.presentation.http.server import serve  # noqa: PLC0415
+
+    try:
+        # Reject bad settings here rather than in every worker.
+        Settings.from_env()
+        config = _server_config(args)
+    except ValueError as exc:
+        sys.stderr.write(f"Invalid configuration: {exc}\n")
+        return 1
+    serve(config)
+    return 0
+
+
+def _run_dev(args: argparse.Namespace) -> int:
+    from kairo.presentation.http.server import serve_dev  # noqa: PLC0415
+
+    serve_dev(_server_config(args))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands."""
+    parser = argparse.ArgumentParser(prog="kairo")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subcommands.add_parser(
+        "migrate",
+        help="apply pending database schema migrations",
+    )
+    migrate.add_argument(
+        "--check",
+        action="store_true",
+        help="only verify that the schema is up to date",
+    )
+    migrate.set_defaults(handler=_run_migrate)
+
+    check_hierarchy = subcommands.add_parser(
+        "check-hierarchy",
+        help="verify task paths against parent_id",
+    )
+    check_hierarchy.add_argument(
+        "--repair",
+        action="store_true",
+        help="rebuild inconsistent paths instead of only reporting them",
+    )
+    check_hierarchy.set_defaults(handler=_run_check_hierarchy)
+
+    reindex_search = subcommands.add_parser(
+        "reindex-search",
+        help="rebuild the full-text task search index",
+    )
+    reindex_search.set_defaults(handler=_run_reindex_search)
+
+    loadtest = subcommands.add_parser(
+        "loadtest",
+        help="drive a request mix against the HTTP API and report latencies",
+    )
+    loadtest.add_argument(
+        "scenario",
+        nargs="?",
+        default="users-read",
+        help="name of the scenario to run (default: %(default)s)",
+    )
+    loadtest.add_argument(
+        "--list",
+        action="store_true",
+        help="list the available scenarios and exit",
+    )
+    loadtest.add_argument(
+        "--scenario-file",
+        type=Path,
+        help="TOML file with additional scenarios",
+    )
+    loadtest.add_argument(
+        "--url",
+        help="test a running server at this URL instead of the app in-process",
+    )
+    loadtest.add_argument(
+        "--database-url",
+        help="database of the in-process app (default: a temporary SQLite file)",
+    )
+    loadtest.add_argument("--concurrency", type=int, default=LoadOptions().concurrency)
+    loadtest.add_argument(
+        "--duration",
+        type=float,
+        default=LoadOptions().duration,
+        help="seconds to send requests for",
+    )
+    loadtest.add_argument(
+        "--users",
+        type=int,
+        help="override the number of users the scenario creates first",
+    )
+    loadtest.add_argument("--seed", type=int, help="seed of the request mix")
+    loadtest.add_argument(
+        "--output",
+        type=Path,
+        help="also write the report to this file as JSON",
+    )
+    loadtest.set_defaults(handler=_run_loadtest)
+
+    serve = subcommands.add_parser(
+        "serve",
+        help="run the production server with several worker processes",
+    )
+    dev = subcommands.add_parser(
+        "dev",
+        help="run the development server, reloading on code changes",
+    )
+    for server in [serve, dev]:
+        server.add_argument("--host", help="interface to listen on")
+        server.add_argument("--port", type=int, help="port to listen on")
+    serve.add_argument("--workers", type=int, help="number of worker processes")
+    serve.set_defaults(handler=_run_serve)
+    dev.set_defaults(handler=_run_dev)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Parse arguments and dispatch to the selected subcommand."""
+    args = build_parser().parse_args(argv)
+    sys.exit(args.handler(args))
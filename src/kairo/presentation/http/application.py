@@ -1,30 +1,79 @@
 from __future__ import annotations
 
-from typing import Annotated
+from dataclasses import asdict
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-import uvicorn
-from fastapi import APIRouter, FastAPI, Request
-from fastapi.params import Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, FastAPI, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from kairo.application.caching import UserCache
+from kairo.application.dto.project import GetUserProjectsQuery
+from kairo.application.dto.task import (
+    ExportProjectTasksQuery,
+    FindTasksQuery,
+    GetProjectTasksQuery,
+    GetSubtasksQuery,
+    SearchTasksQuery,
+)
 from kairo.application.dto.user import (
     CreateUserDTO,
     GetUserByIdQuery,
+    VerifyCredentialsDTO,
+)
+from kairo.application.exceptions import ServiceOverloadedError
+from kairo.application.interactors.project import GetUserProjectsUseCase
+from kairo.application.interactors.task import (
+    ExportProjectTasksUseCase,
+    FindTasksUseCase,
+    GetProjectTasksUseCase,
+    GetSubtasksUseCase,
+    SearchTasksUseCase,
 )
 from kairo.application.interactors.user import (
+    CreateUsersBulkUseCase,
     CreateUserUseCase,
     GetUserByIdUseCase,
+    VerifyCredentialsUseCase,
+)
+from kairo.config import ServerConfig
+from kairo.domain.exceptions import DomainError, InvalidCredentialsError
+from kairo.domain.pagination import DEFAULT_PAGE_LIMIT
+from kairo.infrastructure.sqlalchemy.engine import get_pool_metrics
+from kairo.infrastructure.sqlalchemy.task_query import MAX_QUERY_LENGTH
+from kairo.presentation.http.bulk import (
+    BULK_CHUNK_SIZE,
+    MAX_BULK_LINE_LENGTH,
+    iter_results,
+    provision_users,
+)
+from kairo.presentation.http.deps import ContainerMiddleware, inject, lifespan
+from kairo.presentation.http.metrics import (
+    HttpMetrics,
+    MetricsMiddleware,
+    read_metrics,
+)
+from kairo.presentation.http.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson_lines
+from kairo.presentation.http.pagination import Cursor, Limit, page_response
+from kairo.presentation.http.schemas import (
+    PageResponse,
+    ProjectResponse,
+    TaskResponse,
+    UserResponse,
 )
-from kairo.domain.entities.user import User
-from kairo.domain.exceptions import DomainError
-from kairo.presentation.http.deps import (
-    get_user_by_id_use_case,
-    get_user_create_use_case,
+from kairo.presentation.http.serialization import EntityJSONResponse, to_response
+from kairo.presentation.http.server import serve_dev
+from kairo.presentation.http.streaming import (
+    JSON_MEDIA_TYPE,
+    json_array_stream,
+    ndjson_stream,
 )
 
 router = APIRouter(prefix="/api/v1")
 
+MAX_SEARCH_LENGTH = 256
+
 
 @router.get("/")
 def read_root() -> dict[str, str]:
@@ -32,28 +81,174 @@ def read_root() -> dict[str, str]:
     return {"Hello": "World"}
 
 
-@router.post("/users")
+@router.get("/health/db")
+def read_db_health(
+    engine: Annotated[AsyncEngine, inject(AsyncEngine)],
+) -> dict[str, Any]:
+    """Report connection pool usage and checkout wait times."""
+    return asdict(get_pool_metrics(engine))
+
+
+@router.get("/health/cache")
+def read_cache_health(
+    user_cache: Annotated[UserCache | None, inject(UserCache | None)],
+) -> dict[str, Any]:
+    """Report user cache hit, miss and eviction counters."""
+    if user_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **asdict(user_cache.backend.stats())}
+
+
+@router.post("/users", response_model=UserResponse)
 async def create_user(
     user: CreateUserDTO,
-    use_case: Annotated[CreateUserUseCase, Depends(get_user_create_use_case)],
-) -> User:
+    use_case: Annotated[CreateUserUseCase, inject(CreateUserUseCase)],
+) -> EntityJSONResponse:
     """Create a new user."""
-    return await use_case(user)
+    return EntityJSONResponse(to_response(await use_case(user)))
+
+
+@router.post("/users:bulk")
+async def create_users_bulk(
+    request: Request,
+    use_case: Annotated[
+        CreateUsersBulkUseCase,
+        inject(CreateUsersBulkUseCase),
+    ],
+    chunk_size: Annotated[int, Query(ge=1, le=5000)] = BULK_CHUNK_SIZE,
+) -> StreamingResponse:
+    """Create users from an NDJSON body with one user object per line.
+
+    The body is read and committed in chunks, and the response holds one
+    NDJSON result per input line: ``{"line": n, "id": ...}`` on success or
+    ``{"line": n, "error": ...}`` on failure.
+    """
+    lines = iter_ndjson_lines(request.stream(), MAX_BULK_LINE_LENGTH)
+    results = await provision_users(lines, use_case, chunk_size)
+    return StreamingResponse(iter_results(results), media_type=NDJSON_MEDIA_TYPE)
 
 
-@router.get("/users/{user_id}")
+@router.post("/auth/login", response_model=UserResponse)
+async def login(
+    credentials: VerifyCredentialsDTO,
+    use_case: Annotated[
+        VerifyCredentialsUseCase,
+        inject(VerifyCredentialsUseCase),
+    ],
+) -> EntityJSONResponse:
+    """Check an email and password and return the user they belong to."""
+    return EntityJSONResponse(to_response(await use_case(credentials)))
+
+
+@router.get("/users/{user_id}", response_model=UserResponse | None)
 async def get_user(
     user_id: UUID,
-    use_case: Annotated[GetUserByIdUseCase, Depends(get_user_by_id_use_case)],
-) -> User | None:
+    use_case: Annotated[GetUserByIdUseCase, inject(GetUserByIdUseCase)],
+) -> EntityJSONResponse:
     """Get a user by ID."""
-    return await use_case(GetUserByIdQuery(user_id=user_id))
+    user = await use_case(GetUserByIdQuery(user_id=user_id))
+    return EntityJSONResponse(to_response(user))
+
+
+@router.get("/users/{user_id}/projects", response_model=PageResponse[ProjectResponse])
+async def list_user_projects(
+    request: Request,
+    user_id: UUID,
+    use_case: Annotated[GetUserProjectsUseCase, inject(GetUserProjectsUseCase)],
+    cursor: Cursor = None,
+    limit: Limit = DEFAULT_PAGE_LIMIT,
+) -> EntityJSONResponse:
+    """List a user's projects, one page at a time."""
+    page = await use_case(GetUserProjectsQuery(user_id, cursor, limit))
+    return page_response(request, page)
+
+
+@router.get("/projects/{project_id}/tasks", response_model=PageResponse[TaskResponse])
+async def list_project_tasks(
+    request: Request,
+    project_id: UUID,
+    use_case: Annotated[GetProjectTasksUseCase, inject(GetProjectTasksUseCase)],
+    cursor: Cursor = None,
+    limit: Limit = DEFAULT_PAGE_LIMIT,
+) -> EntityJSONResponse:
+    """List a project's tasks, one page at a time."""
+    page = await use_case(GetProjectTasksQuery(project_id, cursor, limit))
+    return page_response(request, page)
+
+
+@router.get("/projects/{project_id}/tasks:export")
+async def export_project_tasks(
+    project_id: UUID,
+    use_case: Annotated[
+        ExportProjectTasksUseCase,
+        inject(ExportProjectTasksUseCase),
+    ],
+    format: Literal["ndjson", "json"] = "ndjson",  # noqa: A002
+) -> StreamingResponse:
+    """Stream all of a project's tasks in id order.
+
+    Rows are read from a server-side cursor and written as they arrive,
+    as NDJSON or as one JSON array.
+    """
+    tasks = use_case(ExportProjectTasksQuery(project_id))
+    if format == "json":
+        return StreamingResponse(json_array_stream(tasks), media_type=JSON_MEDIA_TYPE)
+    return StreamingResponse(ndjson_stream(tasks), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get("/tasks", response_model=PageResponse[TaskResponse])
+async def find_tasks(
+    request: Request,
+    use_case: Annotated[FindTasksUseCase, inject(FindTasksUseCase)],
+    q: Annotated[
+        str,
+        Query(
+            max_length=MAX_QUERY_LENGTH,
+            description='Filter such as project = <id> AND text ~ "login".',
+        ),
+    ] = "",
+    cursor: Cursor = None,
+    limit: Limit = DEFAULT_PAGE_LIMIT,
+) -> EntityJSONResponse:
+    """List the tasks matching a Kairo query, one page at a time."""
+    page = await use_case(FindTasksQuery(q, cursor, limit))
+    return page_response(request, page)
+
+
+@router.get("/tasks:search", response_model=PageResponse[TaskResponse])
+async def search_tasks(
+    request: Request,
+    q: Annotated[str, Query(min_length=1, max_length=MAX_SEARCH_LENGTH)],
+    use_case: Annotated[SearchTasksUseCase, inject(SearchTasksUseCase)],
+    cursor: Cursor = None,
+    limit: Limit = DEFAULT_PAGE_LIMIT,
+) -> EntityJSONResponse:
+    """Search task names and descriptions, best matches first."""
+    page = await use_case(SearchTasksQuery(q, cursor, limit))
+    return page_response(request, page)
+
+
+@router.get("/tasks/{task_id}/subtasks", response_model=PageResponse[TaskResponse])
+async def list_subtasks(
+    request: Request,
+    task_id: UUID,
+    use_case: Annotated[GetSubtasksUseCase, inject(GetSubtasksUseCase)],
+    cursor: Cursor = None,
+    limit: Limit = DEFAULT_PAGE_LIMIT,
+) -> EntityJSONResponse:
+    """List a task's subtasks, one page at a time."""
+    page = await use_case(GetSubtasksQuery(task_id, cursor, limit))
+    return page_response(request, page)
 
 
 def get_production_app() -> FastAPI:
     """Get the production FastAPI application."""
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(router)
+    app.state.metrics = metrics = HttpMetrics()
+    app.add_middleware(ContainerMiddleware)
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    app.add_api_route("/metrics", read_metrics, include_in_schema=False)
 
     @app.exception_handler(DomainError)
     async def domain_error_handler(request: Request, exc: DomainError) -> JSONResponse:
@@ -63,16 +258,29 @@ def get_production_app() -> FastAPI:
             content={"detail": exc.message},
         )
 
+    @app.exception_handler(InvalidCredentialsError)
+    async def invalid_credentials_handler(
+        request: Request,
+        exc: InvalidCredentialsError,
+    ) -> JSONResponse:
+        """Reject failed logins as unauthorized."""
+        return JSONResponse(status_code=401, content={"detail": exc.message})
+
+    @app.exception_handler(ServiceOverloadedError)
+    async def overloaded_handler(
+        request: Request,
+        exc: ServiceOverloadedError,
+    ) -> JSONResponse:
+        """Shed load with a retryable 503."""
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": "1"},
+        )
+
     return app
 
 
 def main() -> None:
-    """Entry point for the application."""
-    uvicorn.run(
-        "kairo.presentation.http.application:get_production_app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        reload_dirs=["src/kairo"],
-        factory=True,
-    )
+    """Entry point for the development server."""
+    serve_dev(ServerConfig.from_env())
@@ -0,0 +1,88 @@
+"""Chunked processing of bulk NDJSON imports."""
+
+from __future__ import annotations
+
+import json
+from tempfile import SpooledTemporaryFile
+from typing import IO, TYPE_CHECKING
+
+from pydantic import TypeAdapter, ValidationError
+
+from kairo.application.dto.user import CreateUserDTO
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterator
+
+    from kairo.application.interactors.user import CreateUsersBulkUseCase
+
+BULK_CHUNK_SIZE = 500
+MAX_BULK_LINE_LENGTH = 64 * 1024
+# Results beyond this size are spooled to disk instead of kept in memory.
+RESULTS_SPOOL_SIZE = 1024 * 1024
+
+_create_user_adapter = TypeAdapter(CreateUserDTO)
+
+
+def _parse_row(line: bytes | None) -> CreateUserDTO | str:
+    if line is None:
+        return f"Line is longer than {MAX_BULK_LINE_LENGTH} bytes."
+    try:
+        return _create_user_adapter.validate_json(line)
+    except ValidationError as exc:
+        return f"Invalid row: {exc.errors()[0]['msg']}"
+
+
+def _write_result(results: IO[bytes], line: int, result: dict[str, object]) -> None:
+    results.write(json.dumps({"line": line, **result}).encode())
+    results.write(b"\n")
+
+
+async def provision_users(
+    lines: AsyncIterable[bytes | None],
+    use_case: CreateUsersBulkUseCase,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> IO[bytes]:
+    """Create users from NDJSON lines, ``chunk_size`` lines at a time.
+
+    Each chunk is committed on its own, and invalid lines count towards
+    it. Per-line results are written as NDJSON to a spooled temporary
+    file, returned rewound, so memory stays bounded however large the
+    import is.
+    """
+    results: IO[bytes] = SpooledTemporaryFile(max_size=RESULTS_SPOOL_SIZE)  # noqa: SIM115
+    pending: list[tuple[int, CreateUserDTO | str]] = []
+
+    async def flush() -> None:
+        dtos = [row for _, row in pending if isinstance(row, CreateUserDTO)]
+        created = iter(await use_case(dtos) if dtos else [])
+        for line, row in pending:
+            if isinstance(row, str):
+                _write_result(results, line, {"error": row})
+                continue
+            outcome = next(created)
+            if outcome.user_id is not None:
+                _write_result(results, line, {"id": str(outcome.user_id)})
+            else:
+                _write_result(results, line, {"error": outcome.error})
+        pending.clear()
+
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if line is not None and not line.strip():
+            continue
+        row = _parse_row(line)
+        pending.append((line_number, row))
+        # Count invalid lines too, or a body of them would all be buffered.
+        if len(pending) >= chunk_size:
+            await flush()
+    await flush()
+
+    results.seek(0)
+    return results
+
+
+def iter_results(results: IO[bytes]) -> Iterator[bytes]:
+    """Stream spooled results line by line and close the file afterwards."""
+    with results:
+        yield from results
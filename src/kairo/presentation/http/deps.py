@@ -1,55 +1,76 @@
-import sqlite3
-from sqlite3 import Connection
-from typing import Annotated
-
-from fastapi import Depends
-
-from kairo.application.interactors.user import CreateUserUseCase, GetUserByIdUseCase
-from kairo.domain.gateways.user_gateway import UserGateway
-from kairo.infrastructure.user_gateway_sqlite import UserGatewaySqlite
-
-
-def init_db() -> None:
-    """Initialize the database."""
-    conn = sqlite3.connect("database.db")
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            id UUID PRIMARY KEY,
-            email TEXT NOT NULL UNIQUE,
-            username TEXT NOT NULL,
-            password TEXT NOT NULL
-        )
-        """,
-    )
-    conn.commit()
-    conn.close()
-
-
-def get_sqlite3_connection() -> Connection:
-    """Get a SQLite3 database connection."""
-    conn = sqlite3.connect("database.db")
-    init_db()
-    return conn
-
-
-def get_user_gateway(
-    connection: Annotated[Connection, Depends(get_sqlite3_connection)],
-) -> UserGateway:
-    """Get the user gateway."""
-    return UserGatewaySqlite(connection)
-
-
-def get_user_create_use_case(
-    user_gateway: Annotated[UserGateway, Depends(get_user_gateway)],
-) -> CreateUserUseCase:
-    """Get the user create use case."""
-    return CreateUserUseCase(user_gateway)
-
-
-def get_user_by_id_use_case(
-    user_gateway: Annotated[UserGateway, Depends(get_user_gateway)],
-) -> GetUserByIdUseCase:
-    """Get the user by ID use case."""
-    return GetUserByIdUseCase(user_gateway)
+"""Resolve endpoint dependencies from the application's IoC container.
+
+The lifespan enters the APP container, which builds the engine, caches
+and hasher once. ``ContainerMiddleware`` opens a REQUEST scope around
+every HTTP request, response body included, and closes it, and with it
+the request's session, once the response is complete. An endpoint asks
+for an object with ``inject``, which is a single FastAPI dependency per
+parameter whatever the object itself depends on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from fastapi import Depends, FastAPI, Request
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from kairo.application.caching import UserCache
+from kairo.config import Settings
+from kairo.infrastructure.sqlalchemy.instrumentation import QueryTally
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+from kairo.ioc import Container, create_container
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+CONTAINER_SCOPE_KEY = "kairo.container"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the APP scope once per application and close it on shutdown.
+
+    Refuses to start serving if the database schema has pending migrations.
+    """
+    async with create_container(Settings.from_env()) as container:
+        engine = await container.get(AsyncEngine)
+        await MigrationEngine(engine, MIGRATIONS).check()
+        app.state.container = container
+        # Read by the metrics endpoint on every scrape.
+        app.state.engine = engine
+        app.state.query_totals = await container.get(QueryTally)
+        app.state.user_cache = await container.get(UserCache | None)  # type: ignore[arg-type]
+        yield
+
+
+class ContainerMiddleware:
+    """Open a REQUEST scope for every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request inside a scope closed after its response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        container: Container = scope["app"].state.container
+        async with container.enter() as request_container:
+            scope[CONTAINER_SCOPE_KEY] = request_container
+            await self.app(scope, receive, send)
+
+
+def inject(key: Any) -> Any:  # noqa: ANN401
+    """Return a dependency that resolves ``key`` in the request's scope."""
+    return Depends(_resolver(key))
+
+
+def _resolver(key: Any) -> Callable[[Request], Any]:  # noqa: ANN401
+    async def resolve(request: Request) -> Any:  # noqa: ANN401
+        container: Container = request.scope[CONTAINER_SCOPE_KEY]
+        return await container.get(key)
+
+    return resolve
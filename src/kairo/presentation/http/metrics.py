@@ -0,0 +1,197 @@
+"""Request, database, pool and cache metrics served at ``/metrics``.
+
+``MetricsMiddleware`` is plain ASGI, so it adds no task or body copy per
+request. It times each request up to the end of its response body,
+streamed ones included, and labels it with the route template rather
+than the concrete path to keep label cardinality bounded. Statements are
+attributed to the request that ran them through ``track_queries``. Pool
+and cache counters are kept by their owners and copied in on scrape.
+
+Metrics live in the process that records them, and ``kairo serve`` runs
+several worker processes, each answering some of the scrapes. Every
+sample is therefore labelled with the worker's ``pid``, so that each
+worker is a series of its own whose counters only go up; aggregate them
+with ``sum without (pid) (rate(...))``. A replaced worker starts new
+series under its new pid.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+from fastapi import Request, Response
+
+from kairo.infrastructure.metrics.prometheus import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+)
+from kairo.infrastructure.sqlalchemy.engine import get_pool_metrics
+from kairo.infrastructure.sqlalchemy.instrumentation import track_queries
+
+if TYPE_CHECKING:
+    from starlette.datastructures import State
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+    from kairo.infrastructure.sqlalchemy.instrumentation import QueryTally
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class HttpMetrics:
+    """The metrics of one worker process and the registry that renders them.
+
+    Create it in the worker, not before the fork, for its ``pid`` label.
+    """
+
+    def __init__(self) -> None:
+        self.registry = registry = Registry({"pid": str(os.getpid())})
+        route = ("method", "route")
+        self.requests = registry.register(
+            Counter(
+                "kairo_http_requests",
+                "HTTP requests handled.",
+                (*route, "status"),
+            ),
+        )
+        self.request_duration = registry.register(
+            Histogram(
+                "kairo_http_request_duration_seconds",
+                "Time to handle a request, up to the end of its body.",
+                route,
+            ),
+        )
+        self.in_flight = registry.register(
+            Gauge("kairo_http_requests_in_flight", "Requests being handled."),
+        ).labels()
+        self.request_queries = registry.register(
+            Histogram(
+                "kairo_http_request_db_queries",
+                "SQL statements executed per request.",
+                route,
+                buckets=QUERY_COUNT_BUCKETS,
+            ),
+        )
+        self.request_query_duration = registry.register(
+            Histogram(
+                "kairo_http_request_db_duration_seconds",
+                "Time spent in SQL statements per request.",
+                route,
+            ),
+        )
+        self.queries = registry.register(
+            Counter("kairo_db_queries", "SQL statements executed."),
+        ).labels()
+        self.query_duration = registry.register(
+            Counter(
+                "kairo_db_query_duration_seconds",
+                "Time spent executing SQL statements.",
+            ),
+        ).labels()
+        self._pool_gauges = {
+            name: registry.register(Gauge(f"kairo_db_pool_{name}", documentation))
+            for name, documentation in [
+                ("size", "Connections the pool keeps open."),
+                ("max_overflow", "Connections allowed above the pool size."),
+                ("checked_out", "Connections currently handed out."),
+                ("overflow", "Overflow connections currently open."),
+                ("saturation", "Checked out connections relative to capacity."),
+                ("max_wait_seconds", "Longest wait for a connection."),
+            ]
+        }
+        self._pool_counters = {
+            name: registry.register(Counter(f"kairo_db_pool_{metric}", documentation))
+            for name, metric, documentation in [
+                ("checkouts", "checkouts", "Connections handed out."),
+                ("timeouts", "timeouts", "Checkouts that gave up waiting."),
+                ("total_wait", "wait_seconds", "Time spent waiting for connections."),
+            ]
+        }
+        self._cache_counters = {
+            name: registry.register(
+                Counter(f"kairo_user_cache_{name}", f"User cache {name}."),
+            )
+            for name in ["hits", "misses", "evictions", "expirations"]
+        }
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        queries: QueryTally,
+    ) -> None:
+        """Record one finished request and the statements it ran."""
+        self.requests.labels(method, route, str(status)).inc()
+        self.request_duration.labels(method, route).observe(duration)
+        self.request_queries.labels(method, route).observe(queries.count)
+        self.request_query_duration.labels(method, route).observe(queries.duration)
+
+    def render(self, state: State) -> str:
+        """Copy in the counters kept elsewhere and render every metric."""
+        totals: QueryTally | None = getattr(state, "query_totals", None)
+        if totals is not None:
+            self.queries.set(totals.count)
+            self.query_duration.set(totals.duration)
+        engine = getattr(state, "engine", None)
+        if engine is not None:
+            pool = asdict(get_pool_metrics(engine))
+            for name, gauge in self._pool_gauges.items():
+                gauge.labels().set(pool[name.removesuffix("_seconds")])
+            for name, counter in self._pool_counters.items():
+                counter.labels().set(pool[name])
+        user_cache = getattr(state, "user_cache", None)
+        if user_cache is not None:
+            stats = user_cache.backend.stats()
+            for name, counter in self._cache_counters.items():
+                counter.labels().set(getattr(stats, name))
+        return self.registry.render()
+
+
+class MetricsMiddleware:
+    """Record latency, status and statement counts of every HTTP request."""
+
+    def __init__(self, app: ASGIApp, metrics: HttpMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request and record it once its response is complete."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        def route() -> str:
+            # The router stores the matched route in the scope.
+            return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+        self.metrics.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            with track_queries(route=route) as queries:
+                await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            self.metrics.in_flight.dec()
+            self.metrics.observe(scope["method"], route(), status, duration, queries)
+
+
+def read_metrics(request: Request) -> Response:
+    """Expose the application's metrics in the Prometheus text format."""
+    metrics: HttpMetrics = request.app.state.metrics
+    return Response(metrics.render(request.app.state), media_type=CONTENT_TYPE)
@@ -0,0 +1,46 @@
+"""Helpers for newline-delimited JSON request bodies."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_length: int,
+) -> AsyncIterator[bytes | None]:
+    """Split a streamed body into lines without buffering the whole body.
+
+    Yields each line without its trailing newline. A line longer than
+    ``max_line_length`` is dropped and yielded as None, so memory stays
+    bounded by the longest accepted line.
+    """
+    buffer = bytearray()
+    overflow = False
+    async for chunk in chunks:
+        *complete, rest = chunk.split(b"\n")
+        for piece in complete:
+            if overflow or len(buffer) + len(piece) > max_line_length:
+                yield None
+            else:
+                buffer += piece
+                yield bytes(buffer)
+            buffer.clear()
+            overflow = False
+        if overflow:
+            continue
+        if len(buffer) + len(rest) > max_line_length:
+            overflow = True
+            buffer.clear()
+        else:
+            buffer += rest
+
+    if overflow:
+        yield None
+    elif buffer:
+        yield bytes(buffer)
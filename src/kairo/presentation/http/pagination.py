@@ -0,0 +1,35 @@
+"""Pagination parameters and response envelopes for list endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import Query
+
+from kairo.domain.pagination import MAX_PAGE_LIMIT
+from kairo.presentation.http.serialization import EntityJSONResponse, to_response
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+    from kairo.domain.pagination import Page
+
+Cursor = Annotated[
+    str | None,
+    Query(description="Opaque cursor returned as next_cursor by the previous page."),
+]
+Limit = Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)]
+
+
+def page_response(request: Request, page: Page[Any]) -> EntityJSONResponse:
+    """Wrap a page with its next cursor and a ready-made link to it."""
+    next_url = None
+    if page.next_cursor is not None:
+        next_url = str(request.url.include_query_params(cursor=page.next_cursor))
+    return EntityJSONResponse(
+        {
+            "items": [to_response(item) for item in page.items],
+            "next_cursor": page.next_cursor,
+            "links": {"next": next_url},
+        },
+    )
@@ -0,0 +1,64 @@
+"""Public response schemas.
+
+These are the shapes clients see. They are written out by hand rather
+than derived from the domain entities, so a field added to an entity,
+such as a password hash, never reaches a response by accident.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True, kw_only=True)
+class UserResponse:
+    """A user, without credentials."""
+
+    id: UUID
+    username: str
+    email: str
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class TaskResponse:
+    """A task with whichever of its subtasks were loaded."""
+
+    id: UUID
+    name: str
+    description: str
+    project_id: UUID | None = None
+    parent_id: UUID | None = None
+    subtasks: list[TaskResponse] = field(default_factory=list)
+
+
+@dataclass(slots=True, kw_only=True)
+class ProjectResponse:
+    """A project and its owner; tasks are listed by their own endpoints."""
+
+    id: UUID
+    name: str
+    description: str
+    owner: UserResponse
+
+
+@dataclass(slots=True)
+class PageLinks:
+    """Links to neighbouring pages."""
+
+    next: str | None
+
+
+@dataclass(slots=True)
+class PageResponse(Generic[T]):
+    """One page of a listing with its next cursor."""
+
+    items: list[T]
+    next_cursor: str | None
+    links: PageLinks
@@ -0,0 +1,70 @@
+"""Response serializers compiled once, at import time.
+
+Each domain entity is converted to its public schema by an adaptix
+converter generated for that pair of types, and the schema objects are
+encoded by pydantic-core's JSON encoder, which writes dataclasses, UUIDs
+and datetimes natively. ``EntityJSONResponse`` renders content this way,
+so FastAPI neither re-validates an entity against a generated model nor
+walks it again with ``jsonable_encoder``. Endpoints still declare their
+schema with ``response_model`` for the OpenAPI docs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from adaptix.conversion import coercer, get_converter
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+from kairo.domain.entities.base import EntityCollection
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.presentation.http.schemas import (
+    ProjectResponse,
+    TaskResponse,
+    UserResponse,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _convert_subtasks(subtasks: EntityCollection[Task]) -> list[TaskResponse]:
+    return [convert_task(subtask) for subtask in subtasks]
+
+
+convert_user = get_converter(User, UserResponse)
+convert_task = get_converter(
+    Task,
+    TaskResponse,
+    recipe=[coercer(EntityCollection[Task], list[TaskResponse], _convert_subtasks)],
+)
+convert_project = get_converter(Project, ProjectResponse)
+
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    User: convert_user,
+    Task: convert_task,
+    Project: convert_project,
+}
+
+
+def to_response(entity: User | Task | Project | None) -> Any:  # noqa: ANN401
+    """Convert an entity to its public response schema."""
+    if entity is None:
+        return None
+    return _CONVERTERS[type(entity)](entity)
+
+
+def encode(content: Any) -> bytes:  # noqa: ANN401
+    """Encode response schemas, or containers of them, as compact JSON."""
+    return to_json(content)
+
+
+class EntityJSONResponse(JSONResponse):
+    """JSON response for content already converted to response schemas."""
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Encode the content without validating or walking it first."""
+        return encode(content)
@@ -0,0 +1,60 @@
+"""Run the HTTP application under uvicorn, for production or development.
+
+``serve`` always runs the application in worker processes under uvicorn's
+supervisor, even with a single worker, because that is what replaces a
+worker that exits: one that crashed, or one that reached
+``max_requests`` and stopped to release whatever memory it had grown.
+Workers use uvloop and the httptools parser. On SIGINT or SIGTERM each
+worker stops accepting connections, lets in-flight requests finish for
+up to ``graceful_timeout`` seconds and then runs the application's
+shutdown, which disposes of the engine.
+
+``serve_dev`` is a single process that reloads on source changes.
+"""
+
+from __future__ import annotations
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from kairo.config import ServerConfig
+
+APP = "kairo.presentation.http.application:get_production_app"
+
+
+def production_config(config: ServerConfig) -> uvicorn.Config:
+    """Return the uvicorn configuration ``serve`` runs with."""
+    return uvicorn.Config(
+        APP,
+        factory=True,
+        host=config.host,
+        port=config.port,
+        workers=config.workers,
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=config.keep_alive,
+        limit_max_requests=config.max_requests or None,
+        timeout_graceful_shutdown=config.graceful_timeout,
+        backlog=config.backlog,
+        access_log=config.access_log,
+    )
+
+
+def serve(config: ServerConfig) -> None:
+    """Serve the application with ``config.workers`` worker processes."""
+    uvicorn_config = production_config(config)
+    server = uvicorn.Server(uvicorn_config)
+    sockets = [uvicorn_config.bind_socket()]
+    Multiprocess(uvicorn_config, target=server.run, sockets=sockets).run()
+
+
+def serve_dev(config: ServerConfig) -> None:
+    """Serve the application in one process that reloads on code changes."""
+    uvicorn.run(
+        APP,
+        factory=True,
+        host=config.host,
+        port=config.port,
+        reload=True,
+        reload_dirs=["src/kairo"],
+    )
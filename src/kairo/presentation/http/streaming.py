@@ -0,0 +1,67 @@
+"""Streamed JSON response bodies.
+
+Items are serialized one at a time as the source yields them and written
+out in chunks of about ``STREAM_CHUNK_SIZE`` bytes, so memory stays flat
+however many items there are. The ASGI server awaits each chunk's send
+before asking for the next, so a slow client stops the source from being
+pulled, and with it the database cursor behind it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from kairo.presentation.http.serialization import encode, to_response
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+JSON_MEDIA_TYPE = "application/json"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def dump_item(item: Any) -> bytes:  # noqa: ANN401
+    """Serialize an entity as compact JSON through its public schema."""
+    return encode(to_response(item))
+
+
+async def _chunked(pieces: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for piece in pieces:
+        buffer += piece
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def ndjson_stream(
+    items: AsyncIterable[Any],
+    serialize: Callable[[Any], bytes] = dump_item,
+) -> AsyncIterator[bytes]:
+    """Stream items as newline-delimited JSON, one item per line."""
+
+    async def pieces() -> AsyncIterator[bytes]:
+        async for item in items:
+            yield serialize(item) + b"\n"
+
+    async for chunk in _chunked(pieces()):
+        yield chunk
+
+
+async def json_array_stream(
+    items: AsyncIterable[Any],
+    serialize: Callable[[Any], bytes] = dump_item,
+) -> AsyncIterator[bytes]:
+    """Stream items as a single JSON array."""
+
+    async def pieces() -> AsyncIterator[bytes]:
+        separator = b"["
+        async for item in items:
+            yield separator + serialize(item)
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+    async for chunk in _chunked(pieces()):
+        yield chunk
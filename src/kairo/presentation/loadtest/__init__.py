@@ -0,0 +1 @@
+"""Load testing of the HTTP API, run through ``kairo loadtest``."""
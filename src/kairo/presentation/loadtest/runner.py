@@ -0,0 +1,423 @@
+"""Drive a scenario against the HTTP API and summarize the latencies.
+
+The target is either the production application served in-process
+through an ASGI transport, which needs no server and measures the app
+alone, or a running server such as uvicorn reached over HTTP. A fixed
+number of workers send requests back to back until the duration is up,
+so concurrency, not request rate, is what the run controls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from itertools import accumulate, count
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import httpx
+
+from kairo.config import DatabaseConfig
+from kairo.infrastructure.sqlalchemy.engine import create_engine
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+from kairo.presentation.loadtest.scenarios import (
+    NEW_USER,
+    RequestTemplate,
+    Scenario,
+    render,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
+# Upper bounds of the latency histogram buckets, from 1 ms doubling to ~16 s.
+HISTOGRAM_BOUNDS = tuple(0.001 * 2**i for i in range(15))
+HISTOGRAM_WIDTH = 40
+SEED_CHUNK_SIZE = 1000
+
+
+class LoadTestError(Exception):
+    """The load test could not be set up."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoadOptions:
+    """How hard and how long to drive a scenario.
+
+    Attributes
+    ----------
+        concurrency (int): Workers sending requests back to back.
+        duration (float): Seconds to keep sending requests.
+        seed (int | None): Seed of the request mix, for repeatable runs.
+
+    """
+
+    concurrency: int = 50
+    duration: float = 10.0
+    seed: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySummary:
+    """Request count, failures and latency percentiles in seconds."""
+
+    count: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True, slots=True)
+class PoolWait:
+    """Connection pool checkouts made during the run and how long they waited.
+
+    ``max_wait`` is the longest wait since the server started, not only
+    during the run.
+    """
+
+    checkouts: int
+    timeouts: int
+    total_wait: float
+    max_wait: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoadReport:
+    """The outcome of one load test run.
+
+    Attributes
+    ----------
+        scenario (str): Name of the scenario that ran.
+        target (str): What was tested, an URL or ``in-process``.
+        concurrency (int): Number of workers.
+        elapsed (float): Seconds from the first request to the last response.
+        total (LatencySummary): Every request together.
+        requests (dict[str, LatencySummary]): Requests by template name.
+        statuses (dict[str, int]): Responses by status code, and transport
+            errors by exception name.
+        histogram (list[tuple[float | None, int]]): Request count per
+            latency bucket, keyed by the bucket's upper bound in seconds,
+            with None for the last, unbounded bucket.
+        pool (PoolWait | None): Pool waits, if the target reports them.
+
+    """
+
+    scenario: str
+    target: str
+    concurrency: int
+    elapsed: float
+    total: LatencySummary
+    requests: dict[str, LatencySummary]
+    statuses: dict[str, int]
+    histogram: list[tuple[float | None, int]]
+    pool: PoolWait | None
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return self.total.count / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass(slots=True)
+class _Recorder:
+    latencies: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list),
+    )
+    errors: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[str] = field(default_factory=Counter)
+
+    def record(self, name: str, latency: float, status: str, *, ok: bool) -> None:
+        self.latencies[name].append(latency)
+        self.statuses[status] += 1
+        if not ok:
+            self.errors[name] += 1
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of already sorted samples."""
+    if not ordered:
+        return 0.0
+    rank = max(int(len(ordered) * fraction + 0.999999) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies: Sequence[float], errors: int) -> LatencySummary:
+    """Summarize one set of latency samples."""
+    ordered = sorted(latencies)
+    return LatencySummary(
+        count=len(ordered),
+        errors=errors,
+        p50=percentile(ordered, 0.50),
+        p95=percentile(ordered, 0.95),
+        p99=percentile(ordered, 0.99),
+        max=ordered[-1] if ordered else 0.0,
+    )
+
+
+def histogram(latencies: Sequence[float]) -> list[tuple[float | None, int]]:
+    """Count latencies per bucket of ``HISTOGRAM_BOUNDS``, plus an overflow one."""
+    counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+    for latency in latencies:
+        counts[bisect_left(HISTOGRAM_BOUNDS, latency)] += 1
+    return list(zip((*HISTOGRAM_BOUNDS, None), counts, strict=True))
+
+
+def _picker(
+    templates: Sequence[RequestTemplate],
+    rng: random.Random,
+) -> Callable[[], RequestTemplate]:
+    weights = list(accumulate(template.weight for template in templates))
+
+    def pick() -> RequestTemplate:
+        return rng.choices(templates, cum_weights=weights)[0]
+
+    return pick
+
+
+async def seed_users(
+    client: httpx.AsyncClient,
+    users: int,
+    run: str,
+    serial: count[int],
+) -> list[str]:
+    """Create ``users`` users through the bulk endpoint and return their ids.
+
+    :raises LoadTestError: If any of them could not be created.
+    """
+    ids: list[str] = []
+    while len(ids) < users:
+        lines = [
+            json.dumps(render(NEW_USER, {"run": run, "n": str(next(serial))}))
+            for _ in range(min(SEED_CHUNK_SIZE, users - len(ids)))
+        ]
+        response = await client.post(
+            "/api/v1/users:bulk",
+            content="\n".join(lines).encode(),
+        )
+        if response.status_code != httpx.codes.OK:
+            msg = f"Seeding users failed with status {response.status_code}."
+            raise LoadTestError(msg)
+        for line in response.text.splitlines():
+            result = json.loads(line)
+            if "id" not in result:
+                msg = f"Seeding users failed: {result.get('error')}"
+                raise LoadTestError(msg)
+            ids.append(result["id"])
+    return ids
+
+
+async def _pool_counters(client: httpx.AsyncClient) -> dict[str, Any] | None:
+    try:
+        response = await client.get("/api/v1/health/db")
+    except httpx.HTTPError:
+        return None
+    if response.status_code != httpx.codes.OK:
+        return None
+    counters: dict[str, Any] = response.json()
+    return counters
+
+
+def _pool_wait(
+    before: dict[str, Any] | None,
+    after: dict[str, Any] | None,
+) -> PoolWait | None:
+    if before is None or after is None:
+        return None
+    return PoolWait(
+        checkouts=after["checkouts"] - before["checkouts"],
+        timeouts=after["timeouts"] - before["timeouts"],
+        total_wait=after["total_wait"] - before["total_wait"],
+        max_wait=after["max_wait"],
+    )
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    options: LoadOptions,
+    target: str,
+) -> LoadReport:
+    """Seed the scenario's users, then drive its request mix.
+
+    :raises LoadTestError: If the scenario has no requests or seeding fails.
+    """
+    if not scenario.requests:
+        msg = f"Scenario {scenario.name!r} has no requests."
+        raise LoadTestError(msg)
+    run = uuid4().hex[:8]
+    serial = count()
+    user_ids = await seed_users(client, scenario.users, run, serial)
+    rng = random.Random(options.seed)  # noqa: S311
+    pick = _picker(scenario.requests, rng)
+    recorder = _Recorder()
+
+    def values() -> dict[str, str]:
+        return {
+            "run": run,
+            "n": str(next(serial)),
+            "user_id": rng.choice(user_ids) if user_ids else "",
+        }
+
+    async def worker(deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            template = pick()
+            filled = values()
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    template.method,
+                    render(template.path, filled),
+                    json=render(template.json, filled),
+                )
+            except httpx.HTTPError as exc:
+                latency = time.perf_counter() - started
+                recorder.record(template.name, latency, type(exc).__name__, ok=False)
+                continue
+            latency = time.perf_counter() - started
+            recorder.record(
+                template.name,
+                latency,
+                str(response.status_code),
+                ok=response.status_code in template.expect,
+            )
+
+    pool_before = await _pool_counters(client)
+    started = time.perf_counter()
+    deadline = started + options.duration
+    await asyncio.gather(*(worker(deadline) for _ in range(options.concurrency)))
+    elapsed = time.perf_counter() - started
+    pool_after = await _pool_counters(client)
+
+    everything = [
+        latency for samples in recorder.latencies.values() for latency in samples
+    ]
+    return LoadReport(
+        scenario=scenario.name,
+        target=target,
+        concurrency=options.concurrency,
+        elapsed=elapsed,
+        total=summarize(everything, sum(recorder.errors.values())),
+        requests={
+            name: summarize(samples, recorder.errors[name])
+            for name, samples in sorted(recorder.latencies.items())
+        },
+        statuses=dict(sorted(recorder.statuses.items())),
+        histogram=histogram(everything),
+        pool=_pool_wait(pool_before, pool_after),
+    )
+
+
+@asynccontextmanager
+async def remote_client(url: str, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """Open a client to a running server with a connection per worker."""
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    )
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+        yield client
+
+
+@asynccontextmanager
+async def in_process_client(
+    database_url: str | None = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Serve the production app in-process and open a client to it.
+
+    Without ``database_url`` the app runs against a fresh SQLite database
+    in a temporary directory, migrated to the latest schema. Everything
+    else is configured from the environment, as in production.
+    """
+    from kairo.presentation.http.application import (  # noqa: PLC0415
+        get_production_app,
+    )
+
+    async with AsyncExitStack() as stack:
+        if database_url is None:
+            tmp = stack.enter_context(tempfile.TemporaryDirectory())
+            database_url = f"sqlite+aiosqlite:///{Path(tmp) / 'loadtest.db'}"
+            engine = create_engine(DatabaseConfig(url=database_url))
+            try:
+                await MigrationEngine(engine, MIGRATIONS).upgrade()
+            finally:
+                await engine.dispose()
+        previous_url = os.environ.get("KAIRO_DATABASE_URL")
+        os.environ["KAIRO_DATABASE_URL"] = database_url
+        stack.callback(_restore_env, "KAIRO_DATABASE_URL", previous_url)
+        app = get_production_app()
+        await stack.enter_async_context(app.router.lifespan_context(app))
+        yield await stack.enter_async_context(
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://loadtest",
+            ),
+        )
+
+
+def _restore_env(key: str, value: str | None) -> None:
+    if value is None:
+        os.environ.pop(key, None)
+    else:
+        os.environ[key] = value
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:9.1f}"
+
+
+def format_report(report: LoadReport) -> str:
+    """Render a report as a plain-text table and histogram."""
+    total = report.total
+    error_rate = total.errors / total.count if total.count else 0.0
+    lines = [
+        f"Scenario {report.scenario} against {report.target}: "
+        f"{report.concurrency} workers for {report.elapsed:.1f}s",
+        f"{total.count} requests, {report.throughput:.1f} req/s, "
+        f"{total.errors} errors ({error_rate:.2%})",
+        "",
+        f"{'request':<24}{'count':>8}{'errors':>8}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+    ]
+    for name, summary in [*report.requests.items(), ("all", total)]:
+        lines.append(
+            f"{name:<24}{summary.count:>8}{summary.errors:>8}"
+            f"{_ms(summary.p50):>10}{_ms(summary.p95):>10}"
+            f"{_ms(summary.p99):>10}{_ms(summary.max):>10}",
+        )
+    lines += ["", "Latency histogram:"]
+    largest = max((n for _, n in report.histogram), default=0)
+    for bound, n in report.histogram:
+        if not n:
+            continue
+        if bound is None:
+            label = f"> {HISTOGRAM_BOUNDS[-1] * 1000:g} ms"
+        else:
+            label = f"<= {bound * 1000:g} ms"
+        bar = "#" * max(round(n / largest * HISTOGRAM_WIDTH), 1)
+        lines.append(f"{label:>14} {bar:<{HISTOGRAM_WIDTH}} {n}")
+    statuses = ", ".join(f"{status}: {n}" for status, n in report.statuses.items())
+    lines += ["", f"Responses: {statuses}"]
+    if report.pool is not None:
+        pool = report.pool
+        mean = pool.total_wait / pool.checkouts if pool.checkouts else 0.0
+        lines.append(
+            f"Pool: {pool.checkouts} checkouts, {pool.timeouts} timeouts, "
+            f"wait {pool.total_wait * 1000:.1f} ms total, "
+            f"{mean * 1000:.2f} ms mean, {pool.max_wait * 1000:.1f} ms max",
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,133 @@
+"""Declarative load test scenarios.
+
+A scenario is a weighted mix of request templates. Before it runs, the
+load test creates ``users`` users through the bulk endpoint; templates
+then refer to them and to fresh values through placeholders in the path
+and in string values of the JSON body:
+
+- ``{user_id}``: the id of a random seeded user.
+- ``{n}``: a number unique within the run.
+- ``{run}``: a token unique to the run, so repeated runs against the same
+  database do not collide.
+
+Scenarios can also be loaded from a TOML file with one ``[[scenarios]]``
+table per scenario and one ``[[scenarios.requests]]`` table per request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import tomllib
+from adaptix import Retort
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_retort = Retort()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RequestTemplate:
+    """One kind of request in a scenario's mix.
+
+    Attributes
+    ----------
+        name (str): Label the results are reported under.
+        method (str): HTTP method.
+        path (str): Path template, relative to the API root.
+        weight (int): Relative frequency within the mix.
+        json (Any): Body template, sent as JSON when not None.
+        expect (list[int]): Status codes counted as success.
+
+    """
+
+    name: str
+    method: str = "GET"
+    path: str
+    weight: int = 1
+    json: Any = None
+    expect: list[int] = field(default_factory=lambda: [200])
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Scenario:
+    """A named, weighted mix of requests.
+
+    Attributes
+    ----------
+        name (str): Name the scenario is selected by.
+        description (str): One line shown in ``kairo loadtest --list``.
+        users (int): Users to create before the run.
+        requests (list[RequestTemplate]): The request mix.
+
+    """
+
+    name: str
+    description: str = ""
+    users: int = 100
+    requests: list[RequestTemplate]
+
+
+# Body of a user unique to its run and number; also used to seed users.
+NEW_USER = {
+    "email": "loadtest-{run}-{n}@example.com",
+    "username": "loadtest-{run}-{n}",
+    "password": "password123",
+}
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario(
+            name="users-read",
+            description="Fetch random users by id.",
+            requests=[
+                RequestTemplate(name="get user", path="/api/v1/users/{user_id}"),
+            ],
+        ),
+        Scenario(
+            name="users-mixed",
+            description="Mostly user reads, with project listings and signups.",
+            requests=[
+                RequestTemplate(
+                    name="get user",
+                    path="/api/v1/users/{user_id}",
+                    weight=16,
+                ),
+                RequestTemplate(
+                    name="list projects",
+                    path="/api/v1/users/{user_id}/projects",
+                    weight=2,
+                ),
+                RequestTemplate(
+                    name="create user",
+                    method="POST",
+                    path="/api/v1/users",
+                    json=NEW_USER,
+                    weight=2,
+                ),
+            ],
+        ),
+    ]
+}
+
+
+def load_scenarios(path: Path) -> dict[str, Scenario]:
+    """Load scenarios from a TOML file, keyed by name."""
+    with path.open("rb") as file:
+        data = tomllib.load(file)
+    scenarios = _retort.load(data.get("scenarios", []), list[Scenario])
+    return {scenario.name: scenario for scenario in scenarios}
+
+
+def render(template: Any, values: dict[str, str]) -> Any:  # noqa: ANN401
+    """Fill the placeholders of every string inside ``template``."""
+    if isinstance(template, str):
+        return template.format_map(values)
+    if isinstance(template, dict):
+        return {key: render(value, values) for key, value in template.items()}
+    if isinstance(template, list):
+        return [render(value, values) for value in template]
+    return template
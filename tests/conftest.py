@@ -6,3 +6,9 @@ from faker import Faker
 def get_faker():
     """Fixture to provide a Faker instance for generating test data."""
     return Faker()
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
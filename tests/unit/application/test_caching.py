@@ -0,0 +1,208 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from kairo.application.caching import (
+    CacheInvalidatingSession,
+    CachingUserGateway,
+    SingleFlight,
+    UserCache,
+)
+from kairo.domain.entities.user import User
+from kairo.infrastructure.cache.memory import InMemoryCache
+
+
+class FakeUserGateway:
+    def __init__(self, users):
+        self.users = {user.id: user for user in users}
+        self.reads = 0
+
+    async def get_by_id(self, user_id):
+        self.reads += 1
+        await asyncio.sleep(0)
+        user = self.users.get(user_id)
+        return replace(user) if user else None
+
+    async def get_many_by_ids(self, user_ids):
+        self.reads += 1
+        return {uid: replace(self.users[uid]) for uid in user_ids if uid in self.users}
+
+    async def update(self, user):
+        self.users[user.id] = user
+        return user
+
+    async def delete(self, user):
+        self.users.pop(user.id, None)
+
+
+class FakeSession:
+    def __init__(self):
+        self.committed = False
+        self.rolled_back = False
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+    async def flush(self):
+        pass
+
+
+@pytest.fixture
+def user():
+    return User(email="test@example.com", username="testuser", password="password123")
+
+
+@pytest.fixture
+def user_cache():
+    return UserCache(InMemoryCache(max_size=100, ttl=60))
+
+
+@pytest.mark.anyio
+async def test_second_read_is_served_from_cache(user, user_cache) -> None:
+    gateway = FakeUserGateway([user])
+    caching = CachingUserGateway(gateway, user_cache)
+
+    assert await caching.get_by_id(user.id) == user
+    assert await caching.get_by_id(user.id) == user
+
+    assert gateway.reads == 1
+    stats = user_cache.backend.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_are_coalesced(user, user_cache) -> None:
+    gateway = FakeUserGateway([user])
+    requests = [CachingUserGateway(gateway, user_cache) for _ in range(10)]
+
+    results = await asyncio.gather(*(r.get_by_id(user.id) for r in requests))
+
+    assert all(result == user for result in results)
+    assert gateway.reads == 1
+
+
+@pytest.mark.anyio
+async def test_cached_users_are_not_shared_between_callers(user, user_cache) -> None:
+    caching = CachingUserGateway(FakeUserGateway([user]), user_cache)
+
+    first = await caching.get_by_id(user.id)
+    first.username = "changed"
+
+    assert (await caching.get_by_id(user.id)).username == "testuser"
+
+
+@pytest.mark.anyio
+async def test_update_evicts_only_after_commit(user, user_cache) -> None:
+    gateway = FakeUserGateway([user])
+    reader = CachingUserGateway(gateway, user_cache)
+    await reader.get_by_id(user.id)
+
+    writer = CachingUserGateway(gateway, user_cache)
+    session = CacheInvalidatingSession(FakeSession(), writer)
+    await writer.update(replace(user, username="renamed"))
+
+    assert (await reader.get_by_id(user.id)).username == "testuser"
+
+    await session.commit()
+
+    assert (await reader.get_by_id(user.id)).username == "renamed"
+
+
+@pytest.mark.anyio
+async def test_rollback_keeps_cached_entry(user, user_cache) -> None:
+    gateway = FakeUserGateway([user])
+    writer = CachingUserGateway(gateway, user_cache)
+    session = CacheInvalidatingSession(FakeSession(), writer)
+    await writer.get_by_id(user.id)
+
+    await writer.delete(user)
+    await session.rollback()
+
+    assert await user_cache.backend.get(UserCache.key(user.id)) is not None
+
+
+@pytest.mark.anyio
+async def test_get_many_by_ids_only_queries_missing(user, user_cache) -> None:
+    other = User(email="other@example.com", username="other", password="password123")
+    gateway = FakeUserGateway([user, other])
+    caching = CachingUserGateway(gateway, user_cache)
+    await caching.get_by_id(user.id)
+
+    found = await caching.get_many_by_ids([user.id, other.id])
+
+    assert set(found) == {user.id, other.id}
+    assert gateway.reads == 2
+    assert await caching.get_many_by_ids([user.id, other.id]) == found
+    assert gateway.reads == 2
+
+
+@pytest.mark.anyio
+async def test_single_flight_follower_takes_over_after_leader_cancel() -> None:
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    calls = []
+
+    async def slow():
+        calls.append("leader")
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast():
+        calls.append("follower")
+        return "value"
+
+    leader = asyncio.create_task(single_flight.do("key", slow))
+    await started.wait()
+    follower = asyncio.create_task(single_flight.do("key", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "value"
+    assert calls == ["leader", "follower"]
+
+
+class SlowReadGateway(FakeUserGateway):
+    """Reads the row, then waits for ``release`` before returning it."""
+
+    def __init__(self, users):
+        super().__init__(users)
+        self.read = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def get_by_id(self, user_id):
+        return (await self.get_many_by_ids([user_id])).get(user_id)
+
+    async def get_many_by_ids(self, user_ids):
+        found = await super().get_many_by_ids(user_ids)
+        self.read.set()
+        await self.release.wait()
+        return found
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read", ["get_by_id", "get_many_by_ids"])
+async def test_load_racing_a_commit_does_not_cache_the_old_row(
+    user,
+    user_cache,
+    read,
+) -> None:
+    gateway = SlowReadGateway([user])
+    reader = CachingUserGateway(gateway, user_cache)
+    if read == "get_by_id":
+        loading = asyncio.create_task(reader.get_by_id(user.id))
+    else:
+        loading = asyncio.create_task(reader.get_many_by_ids([user.id]))
+    await gateway.read.wait()
+
+    writer = CachingUserGateway(gateway, user_cache)
+    await writer.update(replace(user, username="renamed"))
+    await CacheInvalidatingSession(FakeSession(), writer).commit()
+    gateway.release.set()
+    await loading
+
+    assert await user_cache.backend.get(UserCache.key(user.id)) is None
+    assert (await reader.get_by_id(user.id)).username == "renamed"
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from uuid_extensions import uuid7
+
+from kairo.application.loaders import BatchedUserReader, DataLoader
+from kairo.domain.entities.user import User
+
+
+class RecordingBatchLoad:
+    def __init__(self, values, error=None):
+        self.values = values
+        self.error = error
+        self.calls = []
+
+    async def __call__(self, keys):
+        self.calls.append(list(keys))
+        if self.error is not None:
+            raise self.error
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+@pytest.mark.anyio
+async def test_concurrent_loads_are_coalesced_into_one_batch() -> None:
+    batch_load = RecordingBatchLoad({1: "one", 2: "two", 3: "three"})
+    loader = DataLoader(batch_load)
+
+    results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 3, 2, 1)))
+
+    assert results == ["one", "two", "three", "two", "one"]
+    assert batch_load.calls == [[1, 2, 3]]
+
+
+@pytest.mark.anyio
+async def test_missing_keys_resolve_to_none() -> None:
+    loader = DataLoader(RecordingBatchLoad({1: "one"}))
+
+    assert await asyncio.gather(loader.load(1), loader.load(2)) == ["one", None]
+
+
+@pytest.mark.anyio
+async def test_loaded_values_are_memoized() -> None:
+    batch_load = RecordingBatchLoad({1: "one"})
+    loader = DataLoader(batch_load)
+
+    await loader.load(1)
+    await loader.load(1)
+
+    assert batch_load.calls == [[1]]
+
+
+@pytest.mark.anyio
+async def test_clear_forces_a_reload() -> None:
+    batch_load = RecordingBatchLoad({1: "one"})
+    loader = DataLoader(batch_load)
+
+    await loader.load(1)
+    loader.clear(1)
+    await loader.load(1)
+
+    assert batch_load.calls == [[1], [1]]
+
+
+@pytest.mark.anyio
+async def test_max_batch_size_splits_batches() -> None:
+    batch_load = RecordingBatchLoad({key: key for key in range(5)})
+    loader = DataLoader(batch_load, max_batch_size=2)
+
+    await loader.load_many(range(5))
+
+    assert batch_load.calls == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.anyio
+async def test_failures_propagate_and_are_not_memoized() -> None:
+    batch_load = RecordingBatchLoad({1: "one"}, error=RuntimeError("boom"))
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+
+    batch_load.error = None
+    assert await loader.load(1) == "one"
+
+
+@pytest.mark.anyio
+async def test_batched_user_reader_uses_get_many_by_ids() -> None:
+    users = [
+        User(email=f"user{i}@example.com", username=f"user{i}", password="password123")
+        for i in range(3)
+    ]
+
+    class Reader:
+        def __init__(self):
+            self.calls = []
+
+        async def get_many_by_ids(self, user_ids):
+            self.calls.append(set(user_ids))
+            return {u.id: u for u in users if u.id in user_ids}
+
+    reader = Reader()
+    batched = BatchedUserReader(reader)
+    missing_id = uuid7()
+
+    found = await asyncio.gather(
+        *(batched.get_by_id(user.id) for user in users),
+        batched.get_by_id(missing_id),
+    )
+
+    assert found == [*users, None]
+    assert reader.calls == [{*(u.id for u in users), missing_id}]
@@ -1,22 +1,46 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID
 from uuid_extensions import uuid7
 
-from kairo.application.dto.user import CreateUserDTO, GetUserByIdQuery
-from kairo.application.interactors.user import CreateUserUseCase, GetUserByIdUseCase
+from kairo.application.dto.user import (
+    CreateUserDTO,
+    GetUserByIdQuery,
+    VerifyCredentialsDTO,
+)
+from kairo.application.interactors.user import (
+    CreateUsersBulkUseCase,
+    CreateUserUseCase,
+    GetUserByIdUseCase,
+    VerifyCredentialsUseCase,
+)
+from kairo.application.interfaces import DBSession, PasswordHasher
 from kairo.domain.entities.user import User
-from kairo.domain.exceptions import DomainError
+from kairo.domain.exceptions import (
+    DomainError,
+    InvalidCredentialsError,
+    UserAlreadyExistsError,
+)
 from kairo.domain.gateways.user_gateway import UserGateway, UserReader
 
 
+@pytest.fixture
+def mock_password_hasher():
+    """Password hasher that marks passwords instead of hashing them."""
+    hasher = AsyncMock(spec=PasswordHasher)
+    hasher.hash.side_effect = lambda password: f"hashed:{password}"
+    hasher.hash_many.side_effect = lambda passwords: [f"hashed:{p}" for p in passwords]
+    hasher.verify.side_effect = lambda password, password_hash: password_hash == f"hashed:{password}"
+    return hasher
+
+
 class TestGetUserByIdUseCase:
     """Test suite for GetUserByIdUseCase."""
 
     @pytest.fixture
     def mock_user_reader(self):
         """Mock user reader fixture."""
-        return Mock(spec=UserReader)
+        return AsyncMock(spec=UserReader)
 
     @pytest.fixture
     def get_user_by_id_use_case(self, mock_user_reader):
@@ -43,38 +67,41 @@ class TestGetUserByIdUseCase:
             password="password123"
         )
 
-    def test_get_user_by_id_success(self, get_user_by_id_use_case, mock_user_reader, get_user_query, mock_user):
+    @pytest.mark.anyio
+    async def test_get_user_by_id_success(self, get_user_by_id_use_case, mock_user_reader, get_user_query, mock_user):
         """Test successful user retrieval by ID."""
         # Arrange
         mock_user_reader.get_by_id.return_value = mock_user
 
         # Act
-        result = get_user_by_id_use_case(get_user_query)
+        result = await get_user_by_id_use_case(get_user_query)
 
         # Assert
         assert result == mock_user
-        mock_user_reader.get_by_id.assert_called_once_with(get_user_query.user_id)
+        mock_user_reader.get_by_id.assert_awaited_once_with(get_user_query.user_id)
 
-    def test_get_user_by_id_not_found(self, get_user_by_id_use_case, mock_user_reader, get_user_query):
+    @pytest.mark.anyio
+    async def test_get_user_by_id_not_found(self, get_user_by_id_use_case, mock_user_reader, get_user_query):
         """Test user retrieval when user does not exist."""
         # Arrange
         mock_user_reader.get_by_id.return_value = None
 
         # Act
-        result = get_user_by_id_use_case(get_user_query)
+        result = await get_user_by_id_use_case(get_user_query)
 
         # Assert
         assert result is None
-        mock_user_reader.get_by_id.assert_called_once_with(get_user_query.user_id)
+        mock_user_reader.get_by_id.assert_awaited_once_with(get_user_query.user_id)
 
-    def test_get_user_by_id_with_different_user_ids(self, get_user_by_id_use_case, mock_user_reader):
+    @pytest.mark.anyio
+    async def test_get_user_by_id_with_different_user_ids(self, get_user_by_id_use_case, mock_user_reader):
         """Test user retrieval with different user IDs."""
         # Arrange
         user_id_1 = uuid7()
         user_id_2 = uuid7()
         query_1 = GetUserByIdQuery(user_id=user_id_1)
         query_2 = GetUserByIdQuery(user_id=user_id_2)
-        
+
         user_1 = User(
             id=user_id_1,
             email="user1@example.com",
@@ -87,22 +114,22 @@ class TestGetUserByIdUseCase:
             username="user2",
             password="password456"
         )
-        
+
         mock_user_reader.get_by_id.side_effect = lambda uid: user_1 if uid == user_id_1 else user_2
 
         # Act
-        result_1 = get_user_by_id_use_case(query_1)
-        result_2 = get_user_by_id_use_case(query_2)
+        result_1 = await get_user_by_id_use_case(query_1)
+        result_2 = await get_user_by_id_use_case(query_2)
 
         # Assert
         assert result_1 == user_1
         assert result_2 == user_2
-        assert mock_user_reader.get_by_id.call_count == 2
+        assert mock_user_reader.get_by_id.await_count == 2
 
     def test_get_user_by_id_query_immutability(self, user_id):
         """Test that GetUserByIdQuery is immutable (frozen dataclass)."""
         query = GetUserByIdQuery(user_id=user_id)
-        
+
         with pytest.raises(AttributeError):
             query.user_id = uuid7()  # Should raise an error since the dataclass is frozen
 
@@ -110,9 +137,9 @@ class TestGetUserByIdUseCase:
         """Test that the use case correctly stores the user reader dependency."""
         # Act
         use_case = GetUserByIdUseCase(mock_user_reader)
-        
+
         # Assert
-        assert use_case._user_reader is mock_user_reader
+        assert use_case.user_reader is mock_user_reader
 
 
 class TestCreateUserUseCase:
@@ -121,12 +148,19 @@ class TestCreateUserUseCase:
     @pytest.fixture
     def mock_user_gateway(self):
         """Mock user gateway fixture."""
-        return Mock(spec=UserGateway)
+        gateway = AsyncMock(spec=UserGateway)
+        gateway.save.side_effect = lambda user: user
+        return gateway
 
     @pytest.fixture
-    def create_user_use_case(self, mock_user_gateway):
+    def mock_db_session(self):
+        """Mock database session fixture."""
+        return AsyncMock(spec=DBSession)
+
+    @pytest.fixture
+    def create_user_use_case(self, mock_db_session, mock_user_gateway, mock_password_hasher):
         """CreateUserUseCase instance with mocked dependencies."""
-        return CreateUserUseCase(mock_user_gateway)
+        return CreateUserUseCase(mock_db_session, mock_user_gateway, mock_password_hasher)
 
     @pytest.fixture
     def valid_user_dto(self):
@@ -137,84 +171,56 @@ class TestCreateUserUseCase:
             password="password123"
         )
 
-    @pytest.fixture
-    def mock_user(self):
-        """Mock user entity fixture."""
-        return User(
-            email="test@example.com",
-            username="testuser",
-            password="password123"
-        )
-
-    def test_create_user_success(self, create_user_use_case, mock_user_gateway, valid_user_dto, mock_user):
+    @pytest.mark.anyio
+    async def test_create_user_success(self, create_user_use_case, mock_user_gateway, mock_db_session, valid_user_dto):
         """Test successful user creation."""
-        # Arrange
-        mock_user_gateway.get_by_email.return_value = None
-        mock_user_gateway.get_by_username.return_value = None
-        mock_user_gateway.create.return_value = mock_user
-
         # Act
-        result = create_user_use_case(valid_user_dto)
+        result = await create_user_use_case(valid_user_dto)
 
         # Assert
-        assert result == mock_user
-        mock_user_gateway.get_by_email.assert_called_once_with("test@example.com")
-        mock_user_gateway.get_by_username.assert_called_once_with("testuser")
-        mock_user_gateway.create.assert_called_once()
-        
-        # Verify the user passed to create has the correct attributes
-        created_user = mock_user_gateway.create.call_args[0][0]
+        mock_user_gateway.save.assert_awaited_once()
+        mock_db_session.commit.assert_awaited_once()
+
+        # Verify the user passed to save has the correct attributes
+        created_user = mock_user_gateway.save.call_args[0][0]
+        assert result == created_user
         assert created_user.email == "test@example.com"
         assert created_user.username == "testuser"
-        assert created_user.password == "password123"
+        assert created_user.password == "hashed:password123"
         assert isinstance(created_user.id, UUID)
 
-    def test_create_user_email_already_exists(self, create_user_use_case, mock_user_gateway, valid_user_dto, mock_user):
-        """Test user creation fails when email already exists."""
-        # Arrange
-        mock_user_gateway.get_by_email.return_value = mock_user
-        mock_user_gateway.get_by_username.return_value = None
+    @pytest.mark.anyio
+    async def test_create_user_does_not_read_before_insert(self, create_user_use_case, mock_user_gateway, valid_user_dto):
+        """Test that uniqueness is left to the insert instead of extra lookups."""
+        # Act
+        await create_user_use_case(valid_user_dto)
 
-        # Act & Assert
-        with pytest.raises(DomainError) as exc_info:
-            create_user_use_case(valid_user_dto)
-        
-        assert str(exc_info.value) == "User with email 'test@example.com' already exists."
-        mock_user_gateway.get_by_email.assert_called_once_with("test@example.com")
+        # Assert
+        mock_user_gateway.get_by_email.assert_not_called()
         mock_user_gateway.get_by_username.assert_not_called()
-        mock_user_gateway.create.assert_not_called()
 
-    def test_create_user_username_already_exists(self, create_user_use_case, mock_user_gateway, valid_user_dto, mock_user):
-        """Test user creation fails when username already exists."""
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("field", "value", "message"),
+        [
+            ("email", "test@example.com", "User with email 'test@example.com' already exists."),
+            ("username", "testuser", "User with username 'testuser' already exists."),
+        ],
+    )
+    async def test_create_user_already_exists(self, create_user_use_case, mock_user_gateway, mock_db_session, valid_user_dto, field, value, message):
+        """Test user creation fails when the email or username is taken."""
         # Arrange
-        mock_user_gateway.get_by_email.return_value = None
-        mock_user_gateway.get_by_username.return_value = mock_user
+        mock_user_gateway.save.side_effect = UserAlreadyExistsError(field, value)
 
         # Act & Assert
         with pytest.raises(DomainError) as exc_info:
-            create_user_use_case(valid_user_dto)
-        
-        assert str(exc_info.value) == "User with username 'testuser' already exists."
-        mock_user_gateway.get_by_email.assert_called_once_with("test@example.com")
-        mock_user_gateway.get_by_username.assert_called_once_with("testuser")
-        mock_user_gateway.create.assert_not_called()
-
-    def test_create_user_both_email_and_username_exist(self, create_user_use_case, mock_user_gateway, valid_user_dto, mock_user):
-        """Test user creation fails when both email and username already exist - email check happens first."""
-        # Arrange
-        mock_user_gateway.get_by_email.return_value = mock_user
-        mock_user_gateway.get_by_username.return_value = mock_user
+            await create_user_use_case(valid_user_dto)
 
-        # Act & Assert
-        with pytest.raises(DomainError) as exc_info:
-            create_user_use_case(valid_user_dto)
-        
-        assert str(exc_info.value) == "User with email 'test@example.com' already exists."
-        mock_user_gateway.get_by_email.assert_called_once_with("test@example.com")
-        mock_user_gateway.get_by_username.assert_not_called()
-        mock_user_gateway.create.assert_not_called()
+        assert str(exc_info.value) == message
+        mock_db_session.commit.assert_not_called()
 
-    def test_create_user_with_different_emails(self, create_user_use_case, mock_user_gateway, mock_user):
+    @pytest.mark.anyio
+    async def test_create_user_with_different_emails(self, create_user_use_case, mock_user_gateway):
         """Test user creation with different email addresses."""
         # Arrange
         user_dto = CreateUserDTO(
@@ -222,32 +228,127 @@ class TestCreateUserUseCase:
             username="anotheruser",
             password="password456"
         )
-        mock_user_gateway.get_by_email.return_value = None
-        mock_user_gateway.get_by_username.return_value = None
-        mock_user_gateway.create.return_value = mock_user
 
         # Act
-        result = create_user_use_case(user_dto)
+        result = await create_user_use_case(user_dto)
 
         # Assert
-        assert result == mock_user
-        mock_user_gateway.get_by_email.assert_called_once_with("another@example.com")
-        mock_user_gateway.get_by_username.assert_called_once_with("anotheruser")
-
-    def test_create_user_gateway_create_called_with_user_entity(self, create_user_use_case, mock_user_gateway, valid_user_dto, mock_user):
-        """Test that the gateway create method is called with a User entity."""
-        # Arrange
-        mock_user_gateway.get_by_email.return_value = None
-        mock_user_gateway.get_by_username.return_value = None
-        mock_user_gateway.create.return_value = mock_user
+        assert result.email == "another@example.com"
+        assert result.username == "anotheruser"
 
+    @pytest.mark.anyio
+    async def test_create_user_gateway_save_called_with_user_entity(self, create_user_use_case, mock_user_gateway, valid_user_dto):
+        """Test that the gateway save method is called with a User entity."""
         # Act
-        create_user_use_case(valid_user_dto)
+        await create_user_use_case(valid_user_dto)
 
         # Assert
-        mock_user_gateway.create.assert_called_once()
-        created_user_arg = mock_user_gateway.create.call_args[0][0]
+        mock_user_gateway.save.assert_awaited_once()
+        created_user_arg = mock_user_gateway.save.call_args[0][0]
         assert isinstance(created_user_arg, User)
         assert created_user_arg.email == valid_user_dto.email
         assert created_user_arg.username == valid_user_dto.username
-        assert created_user_arg.password == valid_user_dto.password
+        assert created_user_arg.password == f"hashed:{valid_user_dto.password}"
+
+    @pytest.mark.anyio
+    async def test_create_user_validates_the_password_before_hashing(self, create_user_use_case, mock_password_hasher):
+        """Test that a short password is rejected without being hashed."""
+        user_dto = CreateUserDTO(email="test@example.com", username="testuser", password="short")
+
+        with pytest.raises(DomainError):
+            await create_user_use_case(user_dto)
+
+        mock_password_hasher.hash.assert_not_called()
+
+
+class TestCreateUsersBulkUseCase:
+    """Test suite for CreateUsersBulkUseCase."""
+
+    @pytest.fixture
+    def mock_user_gateway(self):
+        """Mock user gateway that accepts every user."""
+        gateway = AsyncMock(spec=UserGateway)
+        gateway.save_many.side_effect = lambda users: list(users)
+        gateway.get_many_by_emails.return_value = {}
+        return gateway
+
+    @pytest.fixture
+    def mock_db_session(self):
+        """Mock database session fixture."""
+        return AsyncMock(spec=DBSession)
+
+    @pytest.fixture
+    def use_case(self, mock_db_session, mock_user_gateway, mock_password_hasher):
+        """CreateUsersBulkUseCase instance with mocked dependencies."""
+        return CreateUsersBulkUseCase(mock_db_session, mock_user_gateway, mock_user_gateway, mock_password_hasher)
+
+    @pytest.mark.anyio
+    async def test_creates_chunk_with_one_save_and_commit(self, use_case, mock_user_gateway, mock_db_session):
+        """Test that a chunk is saved and committed once."""
+        dtos = [
+            CreateUserDTO(email=f"user{i}@example.com", username=f"user{i}", password="password123")
+            for i in range(3)
+        ]
+
+        results = await use_case(dtos)
+
+        assert all(result.user_id is not None for result in results)
+        mock_user_gateway.save_many.assert_awaited_once()
+        saved = mock_user_gateway.save_many.call_args[0][0]
+        assert [user.password for user in saved] == ["hashed:password123"] * 3
+        mock_user_gateway.get_many_by_emails.assert_not_called()
+        mock_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_reports_invalid_and_conflicting_rows_in_order(self, use_case, mock_user_gateway):
+        """Test per-row errors for validation failures and conflicts."""
+        taken = User(email="taken@example.com", username="taken", password="password123")
+        mock_user_gateway.save_many.side_effect = lambda users: [u for u in users if u.email != taken.email]
+        mock_user_gateway.get_many_by_emails.return_value = {taken.email: taken}
+        dtos = [
+            CreateUserDTO(email="ok@example.com", username="okuser", password="password123"),
+            CreateUserDTO(email="not-an-email", username="baduser", password="password123"),
+            CreateUserDTO(email=taken.email, username="someone", password="password123"),
+        ]
+
+        results = await use_case(dtos)
+
+        assert results[0].user_id is not None
+        assert results[1].user_id is None
+        assert results[1].error
+        assert results[2].error == "User with email 'taken@example.com' already exists."
+
+
+class TestVerifyCredentialsUseCase:
+    """Test suite for VerifyCredentialsUseCase."""
+
+    @pytest.fixture
+    def user(self):
+        """Stored user with a hashed password."""
+        return User(email="test@example.com", username="testuser", password="hashed:password123")
+
+    @pytest.fixture
+    def use_case(self, user, mock_password_hasher):
+        """VerifyCredentialsUseCase over a reader that knows one user."""
+        reader = AsyncMock(spec=UserReader)
+        reader.get_by_email.side_effect = lambda email: user if email == user.email else None
+        return VerifyCredentialsUseCase(reader, mock_password_hasher)
+
+    @pytest.mark.anyio
+    async def test_matching_credentials_return_the_user(self, use_case, user):
+        """Test a successful login."""
+        result = await use_case(VerifyCredentialsDTO(email=user.email, password="password123"))
+
+        assert result is user
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("email", "expected_hash"),
+        [("test@example.com", "hashed:password123"), ("nobody@example.com", None)],
+    )
+    async def test_wrong_password_and_unknown_email_both_verify(self, use_case, mock_password_hasher, email, expected_hash):
+        """Test that a miss is rejected after the same hashing work as a wrong password."""
+        with pytest.raises(InvalidCredentialsError):
+            await use_case(VerifyCredentialsDTO(email=email, password="wrong-password"))
+
+        mock_password_hasher.verify.assert_awaited_once_with("wrong-password", expected_hash)
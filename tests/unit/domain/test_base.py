@@ -0,0 +1,200 @@
+import pytest
+
+from kairo.domain.entities.base import (
+    EntityCollection,
+    LazyEntityCollection,
+    trusted_constructor,
+)
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.domain.exceptions import CollectionNotLoadedError, UserValidationError
+from kairo.domain.pagination import Page
+
+
+@pytest.fixture
+def tasks():
+    return [Task(name=f"Task {i}", description="Description") for i in range(4)]
+
+
+def test_collection_keeps_insertion_order(tasks) -> None:
+    collection = EntityCollection(tasks)
+
+    assert list(collection) == tasks
+    assert collection == tasks
+    assert collection.ids() == [task.id for task in tasks]
+    assert collection[0] is tasks[0]
+    assert collection[-1] is tasks[-1]
+    assert collection[1:3] == tasks[1:3]
+
+
+def test_collection_membership_by_entity_and_by_id(tasks) -> None:
+    collection = EntityCollection(tasks[:2])
+
+    assert tasks[0] in collection
+    assert tasks[1].id in collection
+    assert tasks[2] not in collection
+    assert tasks[2].id not in collection
+    assert "not an id" not in collection
+
+
+def test_collection_lookup_and_remove_by_id(tasks) -> None:
+    collection = EntityCollection(tasks)
+
+    removed = collection.remove(tasks[1].id)
+
+    assert removed is tasks[1]
+    assert collection.get(tasks[1].id) is None
+    assert collection.get(tasks[2].id) is tasks[2]
+    assert collection == [tasks[0], tasks[2], tasks[3]]
+    with pytest.raises(KeyError):
+        collection.remove(tasks[1].id)
+
+
+def test_collection_rejects_duplicate_ids(tasks) -> None:
+    collection = EntityCollection(tasks[:1])
+
+    with pytest.raises(ValueError):
+        collection.add(tasks[0])
+
+
+def test_collection_index_out_of_range() -> None:
+    with pytest.raises(IndexError):
+        EntityCollection()[0]
+
+
+def test_add_many_subtasks_keeps_order() -> None:
+    parent = Task(name="Parent", description="Description")
+    subtasks = [Task(name=f"Sub {i}", description="Description") for i in range(1000)]
+
+    for subtask in subtasks:
+        parent.add_subtask(subtask)
+    parent.remove_subtask(subtasks[500].id)
+
+    assert len(parent.subtasks) == 999
+    assert subtasks[500] not in parent.subtasks
+    assert parent.subtasks.ids() == [s.id for s in subtasks if s is not subtasks[500]]
+
+
+class FakeLoader:
+    """Serves stored tasks in keyset pages and counts calls."""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.calls = 0
+
+    async def __call__(self, *, cursor, limit):
+        self.calls += 1
+        start = int(cursor) if cursor else 0
+        items = self.stored[start : start + limit]
+        end = start + len(items)
+        return Page(items=items, next_cursor=str(end) if end < len(self.stored) else None)
+
+
+@pytest.mark.anyio
+async def test_lazy_collection_loads_nothing_until_iterated(tasks) -> None:
+    loader = FakeLoader(tasks)
+    collection = LazyEntityCollection(loader=loader, page_size=3)
+
+    assert not collection.is_loaded
+    assert loader.calls == 0
+    with pytest.raises(CollectionNotLoadedError):
+        len(collection)
+
+    streamed = [task async for task in collection]
+
+    assert streamed == tasks
+    assert loader.calls == 2
+    assert not collection.is_loaded
+
+
+@pytest.mark.anyio
+async def test_lazy_collection_records_changes_without_loading(tasks) -> None:
+    loader = FakeLoader(tasks[:3])
+    collection = LazyEntityCollection(loader=loader)
+    new = Task(name="New", description="Description")
+
+    collection.add(new)
+    collection.remove(tasks[1].id)
+
+    assert loader.calls == 0
+    assert collection.added == [new]
+    assert collection.removed == [tasks[1].id]
+    assert await collection.load() == [tasks[0], tasks[2], new]
+
+
+def test_lazy_collection_cancels_opposite_changes(tasks) -> None:
+    collection = LazyEntityCollection(loader=FakeLoader(tasks))
+    new = Task(name="New", description="Description")
+
+    collection.add(new)
+    collection.remove(new.id)
+    collection.remove(tasks[0].id)
+    collection.add(tasks[0])
+
+    assert not collection.has_changes
+
+
+def test_lazy_collection_without_loader_starts_loaded(tasks) -> None:
+    collection = LazyEntityCollection(tasks[:2])
+
+    assert collection.is_loaded
+    assert collection == tasks[:2]
+    assert collection.added == tasks[:2]
+
+    collection.mark_saved()
+
+    assert not collection.has_changes
+    assert collection == tasks[:2]
+
+
+def test_trusted_constructor_skips_validation_but_not_defaults() -> None:
+    restore_user = trusted_constructor(User)
+
+    user = restore_user(username="legacy", email="not-an-email", password="short")
+
+    assert type(user) is User
+    assert user.email == "not-an-email"
+    assert user.id is not None
+    assert user.created_at is not None
+    with pytest.raises(UserValidationError):
+        User(username="legacy", email="not-an-email", password="short")
+
+
+def test_trusted_constructor_builds_equal_entities() -> None:
+    task = Task(name="Task", description="Description")
+
+    restored = trusted_constructor(Task)(
+        id=task.id,
+        name=task.name,
+        description=task.description,
+    )
+
+    assert restored == task
+    assert restored.subtasks is not task.subtasks
+
+
+def test_new_entity_reports_every_tracked_field_as_changed() -> None:
+    task = Task(name="Task", description="Description")
+
+    assert task.changed_fields() == {
+        "name": "Task",
+        "description": "Description",
+        "project_id": None,
+        "parent_id": None,
+    }
+
+
+def test_restored_entity_reports_only_what_changed() -> None:
+    user = trusted_constructor(User)(
+        username="user",
+        email="user@example.com",
+        password="password123",
+    )
+    assert user.changed_fields() == {}
+
+    user.username = "renamed"
+    user.email = "user@example.com"
+
+    assert user.changed_fields() == {"username": "renamed"}
+    user.mark_saved()
+    assert user.changed_fields() == {}
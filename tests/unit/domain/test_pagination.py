@@ -0,0 +1,42 @@
+import pytest
+from uuid_extensions import uuid7
+
+from kairo.domain.exceptions import InvalidCursorError
+from kairo.domain.pagination import (
+    MAX_PAGE_LIMIT,
+    decode_cursor,
+    decode_ranked_cursor,
+    encode_cursor,
+    encode_ranked_cursor,
+    validate_limit,
+)
+
+
+def test_cursor_round_trip() -> None:
+    last_id = uuid7()
+
+    assert decode_cursor(encode_cursor(last_id)) == last_id
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "AAAA"])
+def test_malformed_cursor_is_rejected(cursor) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("limit", [0, -1, MAX_PAGE_LIMIT + 1])
+def test_out_of_range_limit_is_rejected(limit) -> None:
+    with pytest.raises(InvalidCursorError):
+        validate_limit(limit)
+
+
+def test_ranked_cursor_round_trip() -> None:
+    last_id = uuid7()
+
+    assert decode_ranked_cursor(encode_ranked_cursor(-1.25, last_id)) == (-1.25, last_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "AAAA", encode_cursor(uuid7())])
+def test_malformed_ranked_cursor_is_rejected(cursor) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_ranked_cursor(cursor)
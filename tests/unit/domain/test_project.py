@@ -2,6 +2,7 @@ from faker import Faker
 import pytest
 
 from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
 from kairo.domain.entities.user import User
 from kairo.domain.exceptions import ProjectValidationError
 
@@ -28,3 +29,36 @@ def test_project_creation_with_empty_fields(faker: Faker) -> None:
 
     with pytest.raises(ProjectValidationError) as e:
         Project(name="Test Project", description="A test project", owner=None)
+
+
+def test_add_and_remove_task(faker: Faker) -> None:
+    user = User(username=faker.user_name(), email=faker.email(), password="password123")
+    project = Project(name="Test Project", description="A test project", owner=user)
+    task = Task(name="Task", description="A task")
+
+    project.add_task(task)
+
+    assert project.tasks == [task]
+    assert project.tasks.get(task.id) is task
+
+    project.remove_task(task.id)
+
+    assert project.tasks == []
+
+
+def test_add_duplicate_task(faker: Faker) -> None:
+    user = User(username=faker.user_name(), email=faker.email(), password="password123")
+    project = Project(name="Test Project", description="A test project", owner=user)
+    task = Task(name="Task", description="A task")
+    project.add_task(task)
+
+    with pytest.raises(ProjectValidationError):
+        project.add_task(task)
+
+
+def test_remove_missing_task(faker: Faker) -> None:
+    user = User(username=faker.user_name(), email=faker.email(), password="password123")
+    project = Project(name="Test Project", description="A test project", owner=user)
+
+    with pytest.raises(ProjectValidationError):
+        project.remove_task(Task(name="Task", description="A task").id)
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import event
+
+from kairo.config import DatabaseConfig
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.instrumentation import (
+    expect_queries,
+    instrument_engine,
+)
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+
+
+@pytest.fixture
+async def migrated_engine(tmp_path):
+    """Engine over a fresh SQLite file with the schema at the latest version."""
+    engine = create_engine(
+        DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'kairo.db'}"),
+    )
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(migrated_engine):
+    """Session bound to the migrated engine."""
+    async with create_session_maker(migrated_engine)() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(migrated_engine):
+    """SQL statements executed on the migrated engine, in order."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        captured.append(statement)
+
+    event.listen(
+        migrated_engine.sync_engine,
+        "before_cursor_execute",
+        before_cursor_execute,
+    )
+    yield captured
+    event.remove(
+        migrated_engine.sync_engine,
+        "before_cursor_execute",
+        before_cursor_execute,
+    )
+
+
+@pytest.fixture
+def max_queries(migrated_engine):
+    """Query budget for the migrated engine: ``with max_queries(2): ...``.
+
+    Fails the test if the block runs more statements than allowed or
+    repeats one with different parameters.
+    """
+    instrument_engine(migrated_engine)
+    return expect_queries
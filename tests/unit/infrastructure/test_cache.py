@@ -0,0 +1,105 @@
+import pytest
+
+from kairo.domain.entities.user import User
+from kairo.infrastructure.cache.memory import InMemoryCache
+from kairo.infrastructure.cache.redis_cache import RedisCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Local stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.closed = False
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value.encode()
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.anyio
+async def test_memory_cache_counts_hits_and_misses() -> None:
+    cache = InMemoryCache(max_size=10, ttl=60)
+    await cache.set("a", 1)
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = InMemoryCache(max_size=2, ttl=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+
+    await cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.anyio
+async def test_memory_cache_expires_entries() -> None:
+    clock = FakeClock()
+    cache = InMemoryCache(max_size=10, ttl=5, clock=clock)
+    await cache.set("a", 1)
+
+    clock.now = 5
+
+    assert await cache.get("a") is None
+    assert cache.stats().expirations == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_memory_cache_delete() -> None:
+    cache = InMemoryCache(max_size=10, ttl=60)
+    await cache.set("a", 1)
+
+    await cache.delete("a", "missing")
+
+    assert await cache.get("a") is None
+
+
+@pytest.mark.anyio
+async def test_redis_cache_round_trips_users() -> None:
+    client = FakeRedis()
+    cache = RedisCache(client, User, ttl=60)
+    user = User(email="test@example.com", username="testuser", password="password123")
+
+    await cache.set("user", user)
+
+    assert await cache.get("user") == user
+    assert await cache.get_many(["user", "missing"]) == {"user": user}
+    await cache.delete("user")
+    assert await cache.get("user") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+
+    await cache.close()
+    assert client.closed
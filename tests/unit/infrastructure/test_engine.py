@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from kairo.config import DatabaseConfig
+from kairo.infrastructure.sqlalchemy.engine import (
+    InstrumentedAsyncAdaptedQueuePool,
+    create_engine,
+    create_session_maker,
+    get_pool_metrics,
+)
+from kairo.infrastructure.sqlalchemy.instrumentation import (
+    instrument_engine,
+    track_queries,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    config = DatabaseConfig(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    engine = create_engine(config)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_engine_uses_instrumented_pool(engine) -> None:
+    assert isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool)
+    assert engine.pool.size() == 2
+
+
+@pytest.mark.anyio
+async def test_session_is_closed_and_connection_returned(engine) -> None:
+    session_maker = create_session_maker(engine)
+
+    async with session_maker() as session:
+        await session.execute(text("SELECT 1"))
+        assert get_pool_metrics(engine).checked_out == 1
+
+    metrics = get_pool_metrics(engine)
+    assert metrics.checked_out == 0
+    assert metrics.checkouts == 1
+
+
+@pytest.mark.anyio
+async def test_pool_metrics_report_saturation_and_timeouts(engine) -> None:
+    session_maker = create_session_maker(engine)
+    release = asyncio.Event()
+
+    async def hold_connection() -> None:
+        async with session_maker() as session:
+            await session.execute(text("SELECT 1"))
+            await release.wait()
+
+    holders = [asyncio.create_task(hold_connection()) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    assert get_pool_metrics(engine).saturation == 1.0
+
+    with pytest.raises(Exception, match="QueuePool limit"):
+        async with session_maker() as session:
+            await session.execute(text("SELECT 1"))
+
+    release.set()
+    await asyncio.gather(*holders)
+
+    metrics = get_pool_metrics(engine)
+    assert metrics.timeouts == 1
+    assert metrics.checked_out == 0
+    assert metrics.max_wait >= 0.2
+
+
+def test_in_memory_sqlite_shares_one_connection() -> None:
+    engine = create_engine(DatabaseConfig(url="sqlite+aiosqlite://"))
+
+    assert get_pool_metrics(engine).size == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("url", ["sqlite+aiosqlite://", "file"])
+async def test_sqlite_connections_enforce_foreign_keys(tmp_path, url) -> None:
+    if url == "file":
+        url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(DatabaseConfig(url=url))
+    try:
+        async with engine.connect() as conn:
+            enabled = await conn.scalar(text("PRAGMA foreign_keys"))
+    finally:
+        await engine.dispose()
+
+    assert enabled == 1
+
+
+@pytest.mark.anyio
+async def test_statements_are_tallied_per_engine_and_per_block(engine) -> None:
+    totals = instrument_engine(engine)
+    session_maker = create_session_maker(engine)
+
+    async with session_maker() as session:
+        await session.execute(text("SELECT 1"))
+        with track_queries() as tally:
+            await session.execute(text("SELECT 2"))
+            with pytest.raises(OperationalError):
+                await session.execute(text("SELECT * FROM missing"))
+
+    assert tally.count == 2
+    assert totals.count == 3
+    assert 0 < tally.duration <= totals.duration
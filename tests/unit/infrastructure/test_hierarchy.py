@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import update
+from uuid_extensions import uuid7
+
+from kairo.domain.entities.task import Task
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.hierarchy import (
+    ancestor_ids,
+    check_task_paths,
+    child_path,
+    compute_paths,
+    depth,
+    repair_task_paths,
+    upper_bound,
+)
+from kairo.infrastructure.sqlalchemy.models.task import TaskModel
+
+
+def test_path_helpers() -> None:
+    root, child, leaf = uuid7(), uuid7(), uuid7()
+    path = child_path(child_path(child_path(None, root), child), leaf)
+
+    assert ancestor_ids(path) == [root, child]
+    assert depth(path) == 2
+    assert path < upper_bound(child_path(None, root))
+    assert child_path(None, uuid7()) > upper_bound(child_path(None, root))
+
+
+def test_compute_paths_handles_any_order_and_skips_cycles() -> None:
+    root, child, leaf, loop_a, loop_b = (uuid7() for _ in range(5))
+
+    paths = compute_paths(
+        [(leaf, child), (child, root), (root, None), (loop_a, loop_b), (loop_b, loop_a)],
+    )
+
+    assert paths[leaf] == child_path(child_path(child_path(None, root), child), leaf)
+    assert loop_a not in paths
+    assert loop_b not in paths
+
+
+@pytest.fixture
+async def chain(session):
+    gateway = TaskGateway(session)
+    root = await gateway.create(Task(name="Root", description="D"))
+    child = await gateway.create(Task(name="Child", description="D", parent_id=root.id))
+    leaf = await gateway.create(Task(name="Leaf", description="D", parent_id=child.id))
+    await session.commit()
+    return root, child, leaf
+
+
+@pytest.mark.anyio
+async def test_check_finds_nothing_on_a_consistent_tree(session, chain) -> None:
+    assert await check_task_paths(session) == []
+
+
+@pytest.mark.anyio
+async def test_check_and_repair_a_corrupted_path(session, chain) -> None:
+    root, child, leaf = chain
+    await session.execute(
+        update(TaskModel).where(TaskModel.id == child.id).values(path="broken/"),
+    )
+
+    mismatches = await check_task_paths(session)
+    repaired = await repair_task_paths(session)
+
+    assert {m.task_id for m in mismatches} == {child.id, leaf.id}
+    assert repaired == 1
+    assert await check_task_paths(session) == []
@@ -0,0 +1,96 @@
+import logging
+
+import pytest
+
+from kairo.application.dto.user import GetUserByIdQuery
+from kairo.application.interactors.user import GetUserByIdUseCase
+from kairo.domain.entities.user import User
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.infrastructure.sqlalchemy.instrumentation import (
+    QueryBudgetError,
+    instrument_engine,
+    track_queries,
+)
+
+
+@pytest.fixture
+async def users(session):
+    saved = await UserGateway(session).save_many(
+        [
+            User(email=f"user{i}@example.com", username=f"user{i}", password="password123")
+            for i in range(3)
+        ],
+    )
+    await session.commit()
+    return saved
+
+
+@pytest.mark.anyio
+async def test_batched_reads_stay_within_budget(session, users, max_queries) -> None:
+    with max_queries(1) as tally:
+        await UserGateway(session).get_many_by_ids([user.id for user in users])
+
+    assert tally.count == 1
+
+
+@pytest.mark.anyio
+async def test_reads_in_a_loop_are_reported_as_repeated(session, users, max_queries) -> None:
+    gateway = UserGateway(session)
+
+    with pytest.raises(QueryBudgetError, match="repeated") as exc_info:  # noqa: PT012
+        with max_queries(5):
+            for user in users:
+                await gateway.get_by_id(user.id)
+
+    assert "3x SELECT" in str(exc_info.value)
+
+
+@pytest.mark.anyio
+async def test_exceeding_the_budget_lists_the_statements(session, users, max_queries) -> None:
+    gateway = UserGateway(session)
+
+    with pytest.raises(QueryBudgetError, match="2 statements ran, at most 1") as exc_info:  # noqa: PT012
+        with max_queries(1):
+            await gateway.get_by_id(users[0].id)
+            await gateway.get_by_email(users[0].email)
+
+    assert "WHERE users.email" in str(exc_info.value)
+
+
+@pytest.mark.anyio
+async def test_use_case_fetches_a_user_with_one_query(session, users, max_queries) -> None:
+    use_case = GetUserByIdUseCase(UserGateway(session))
+
+    with max_queries(1):
+        user = await use_case(GetUserByIdQuery(user_id=users[0].id))
+
+    assert user == users[0]
+
+
+@pytest.mark.anyio
+async def test_nested_blocks_count_towards_the_enclosing_one(session, users, max_queries) -> None:
+    gateway = UserGateway(session)
+
+    with track_queries() as outer:
+        with max_queries(1) as inner:
+            await gateway.get_by_id(users[0].id)
+        await gateway.get_by_id(users[1].id)
+
+    assert (inner.count, outer.count) == (1, 2)
+
+
+@pytest.mark.anyio
+async def test_slow_queries_are_logged_with_route_and_interactor(
+    migrated_engine,
+    session,
+    users,
+    caplog,
+) -> None:
+    instrument_engine(migrated_engine, slow_query_threshold=0.0)
+    use_case = GetUserByIdUseCase(UserGateway(session))
+
+    with caplog.at_level(logging.WARNING), track_queries(route=lambda: "/users/{id}"):
+        await use_case(GetUserByIdQuery(user_id=users[0].id))
+
+    assert "route /users/{id}, interactor GetUserByIdUseCase" in caplog.text
+    assert "FROM users" in caplog.text
@@ -0,0 +1,203 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, inspect, text
+
+from uuid_extensions import uuid7
+
+from kairo.config import DatabaseConfig
+from kairo.infrastructure.sqlalchemy.engine import create_engine
+from kairo.infrastructure.sqlalchemy.migrations import (
+    MIGRATIONS,
+    Migration,
+    MigrationEngine,
+    MigrationError,
+    SchemaOutdatedError,
+)
+from kairo.infrastructure.sqlalchemy.migrations.engine import schema_version_table
+from kairo.presentation.http.application import get_production_app
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_engine(
+        DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'kairo.db'}"),
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_fresh_database_is_created_at_head(engine) -> None:
+    migration_engine = MigrationEngine(engine, MIGRATIONS)
+
+    applied = await migration_engine.upgrade()
+
+    assert [m.version for m in applied] == [m.version for m in MIGRATIONS]
+    assert await migration_engine.current_version() == migration_engine.head
+    await migration_engine.check()
+
+
+@pytest.mark.anyio
+async def test_upgrade_is_idempotent(engine) -> None:
+    migration_engine = MigrationEngine(engine, MIGRATIONS)
+    await migration_engine.upgrade()
+
+    assert await migration_engine.upgrade() == []
+    assert await migration_engine.pending() == []
+
+
+@pytest.mark.anyio
+async def test_task_lookup_indexes_are_created(engine) -> None:
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+
+    async with engine.connect() as connection:
+        indexes = await connection.run_sync(
+            lambda conn: {ix["name"] for ix in inspect(conn).get_indexes("tasks")},
+        )
+
+    assert {"tasks_project_id_idx", "tasks_parent_id_idx"} <= indexes
+
+
+@pytest.mark.anyio
+async def test_pending_migrations_are_applied_in_order(engine) -> None:
+    calls = []
+    migrations = [
+        *MIGRATIONS,
+        Migration(
+            version=MIGRATIONS[-1].version + 2,
+            description="second",
+            upgrade=lambda conn: calls.append("second"),
+        ),
+        Migration(
+            version=MIGRATIONS[-1].version + 1,
+            description="first",
+            upgrade=lambda conn: calls.append("first"),
+        ),
+    ]
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+    migration_engine = MigrationEngine(engine, migrations)
+
+    with pytest.raises(SchemaOutdatedError):
+        await migration_engine.check()
+
+    applied = await migration_engine.upgrade()
+
+    assert [m.description for m in applied] == ["first", "second"]
+    assert calls == ["first", "second"]
+    await migration_engine.check()
+
+
+@pytest.mark.anyio
+async def test_unversioned_existing_schema_is_rejected(engine) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE users (id INTEGER)"))
+
+    with pytest.raises(MigrationError):
+        await MigrationEngine(engine, MIGRATIONS).upgrade()
+
+
+@pytest.mark.anyio
+async def test_application_refuses_to_start_when_schema_is_behind(
+    engine,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+    async with engine.begin() as connection:
+        await connection.execute(delete(schema_version_table))
+    monkeypatch.setenv(
+        "KAIRO_DATABASE_URL",
+        f"sqlite+aiosqlite:///{tmp_path / 'kairo.db'}",
+    )
+
+    with pytest.raises(SchemaOutdatedError), TestClient(get_production_app()):
+        pass
+
+
+@pytest.mark.anyio
+async def test_listing_indexes_lead_with_the_filter_column_then_id(engine) -> None:
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+
+    async with engine.connect() as connection:
+        indexes = await connection.run_sync(
+            lambda conn: {
+                ix["name"]: ix["column_names"]
+                for table in ("tasks", "projects")
+                for ix in inspect(conn).get_indexes(table)
+            },
+        )
+
+    assert indexes["tasks_project_id_idx"] == ["project_id", "id"]
+    assert indexes["tasks_parent_id_idx"] == ["parent_id", "id"]
+    assert indexes["projects_owner_id_idx"] == ["owner_id", "id"]
+
+
+@pytest.mark.anyio
+async def test_keyset_migration_rebuilds_version_one_indexes(engine) -> None:
+    await MigrationEngine(engine, MIGRATIONS[:1]).upgrade()
+    async with engine.begin() as connection:
+        await connection.execute(text("DROP INDEX tasks_project_id_idx"))
+        await connection.execute(
+            text("CREATE INDEX tasks_project_id_idx ON tasks (project_id)"),
+        )
+
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+
+    async with engine.connect() as connection:
+        columns = await connection.run_sync(
+            lambda conn: next(
+                ix["column_names"]
+                for ix in inspect(conn).get_indexes("tasks")
+                if ix["name"] == "tasks_project_id_idx"
+            ),
+        )
+    assert columns == ["project_id", "id"]
+
+
+@pytest.mark.anyio
+async def test_task_paths_migration_backfills_existing_tasks(engine) -> None:
+    await MigrationEngine(engine, MIGRATIONS[:2]).upgrade()
+    root, child = uuid7(), uuid7()
+    async with engine.begin() as connection:
+        await connection.execute(text("DROP INDEX tasks_path_idx"))
+        await connection.execute(text("ALTER TABLE tasks DROP COLUMN path"))
+        await connection.execute(
+            text(
+                "INSERT INTO tasks (id, name, description, parent_id) VALUES "
+                "(:root, 'Root', 'D', NULL), (:child, 'Child', 'D', :root)",
+            ),
+            {"root": root.hex, "child": child.hex},
+        )
+
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+
+    async with engine.connect() as connection:
+        path = await connection.scalar(
+            text("SELECT path FROM tasks WHERE id = :id"),
+            {"id": child.hex},
+        )
+    assert path == f"{root.hex}/{child.hex}/"
+
+
+@pytest.mark.anyio
+async def test_task_search_migration_indexes_existing_tasks(engine) -> None:
+    await MigrationEngine(engine, MIGRATIONS[:3]).upgrade()
+    async with engine.begin() as connection:
+        for trigger in ("insert", "update", "delete"):
+            await connection.execute(text(f"DROP TRIGGER tasks_fts_{trigger}"))
+        await connection.execute(text("DROP TABLE tasks_fts"))
+        await connection.execute(
+            text(
+                "INSERT INTO tasks (id, name, description, path) "
+                "VALUES (:id, 'Deploy', 'D', :path)",
+            ),
+            {"id": uuid7().hex, "path": "x/"},
+        )
+
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+
+    async with engine.connect() as connection:
+        matches = await connection.scalar(
+            text("SELECT count(*) FROM tasks_fts WHERE tasks_fts MATCH 'deploy'"),
+        )
+    assert matches == 1
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from kairo.application.exceptions import ServiceOverloadedError
+from kairo.config import PasswordHashConfig
+from kairo.infrastructure.security.scrypt_hasher import (
+    HASH_JOB_SIZE,
+    ScryptPasswordHasher,
+    hash_password,
+    verify_password,
+)
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    hasher = ScryptPasswordHasher(PasswordHashConfig(n=16, workers=2, max_pending=2))
+    yield hasher
+    hasher.close()
+
+
+@pytest.mark.anyio
+async def test_hash_round_trips_through_the_worker_pool(hasher) -> None:
+    password_hash = await hasher.hash("password123")
+
+    assert password_hash.startswith("scrypt$16$8$1$")
+    assert password_hash != await hasher.hash("password123")
+    assert await hasher.verify("password123", password_hash)
+    assert not await hasher.verify("password124", password_hash)
+
+
+@pytest.mark.anyio
+async def test_unknown_users_are_verified_against_a_decoy(hasher) -> None:
+    assert not await hasher.verify("password123", None)
+
+
+@pytest.mark.anyio
+async def test_hash_many_keeps_the_input_order(hasher) -> None:
+    passwords = [f"password{i}" for i in range(5)]
+
+    hashes = await hasher.hash_many(passwords)
+
+    assert [verify_password(p, h) for p, h in zip(passwords, hashes, strict=True)] == [
+        True
+    ] * 5
+
+
+@pytest.mark.anyio
+async def test_work_beyond_max_pending_is_rejected(hasher) -> None:
+    results = await asyncio.gather(
+        *(hasher.hash("password123") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(r, ServiceOverloadedError) for r in results) == 1
+    assert hasher.pending == 0
+
+
+def test_hashes_keep_verifying_after_the_cost_changes() -> None:
+    old = hash_password("password123", n=8, r=4, p=1)
+
+    assert verify_password("password123", old)
+
+
+@pytest.mark.parametrize("stored", ["password123", "scrypt$16$8", "bcrypt$1$2$3$4$5"])
+def test_malformed_or_foreign_hashes_do_not_verify(stored) -> None:
+    assert not verify_password("password123", stored)
+
+
+@pytest.mark.anyio
+async def test_hash_many_does_not_hold_the_pool_for_the_whole_bulk() -> None:
+    hasher = ScryptPasswordHasher(PasswordHashConfig(n=16, workers=1, max_pending=2))
+    try:
+        bulk = asyncio.create_task(
+            hasher.hash_many([f"password{i}" for i in range(8 * HASH_JOB_SIZE)]),
+        )
+        await asyncio.sleep(0)
+        assert hasher.pending == 1
+
+        await hasher.hash("password123")
+
+        assert not bulk.done()
+        assert len(await bulk) == 8 * HASH_JOB_SIZE
+    finally:
+        hasher.close()
@@ -0,0 +1,68 @@
+import pytest
+
+from kairo.infrastructure.metrics.prometheus import Counter, Gauge, Histogram, Registry
+
+
+def test_counters_and_gauges_render_with_escaped_labels() -> None:
+    registry = Registry()
+    requests = registry.register(Counter("requests", "Requests.", ["path"]))
+    in_flight = registry.register(Gauge("in_flight", "Busy.\nNow."))
+    requests.labels('/a"b').inc()
+    requests.labels('/a"b').inc(2)
+    in_flight.labels().inc()
+    in_flight.labels().dec(0.5)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests Requests.",
+        "# TYPE requests counter",
+        'requests_total{path="/a\\"b"} 3',
+        "# HELP in_flight Busy.\\nNow.",
+        "# TYPE in_flight gauge",
+        "in_flight 0.5",
+    ]
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = Registry()
+    latency = registry.register(Histogram("latency", "Latency.", buckets=[0.1, 1]))
+    for value in [0.05, 0.1, 0.5, 3]:
+        latency.labels().observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_bucket{le="0.1"} 2',
+        'latency_bucket{le="1"} 3',
+        'latency_bucket{le="+Inf"} 4',
+        "latency_sum 3.65",
+        "latency_count 4",
+    ]
+
+
+def test_labels_must_match_the_declared_names() -> None:
+    counter = Counter("requests", "Requests.", ["method", "route"])
+
+    with pytest.raises(ValueError, match="takes labels"):
+        counter.labels("GET")
+
+
+def test_metric_names_are_unique_per_registry() -> None:
+    registry = Registry()
+    registry.register(Gauge("busy", "Busy."))
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("busy", "Busy."))
+
+
+def test_constant_labels_come_first_on_every_sample() -> None:
+    registry = Registry({"pid": "42"})
+    registry.register(Gauge("busy", "Busy.")).labels().set(1)
+    latency = registry.register(Histogram("latency", "Latency.", buckets=[1]))
+    latency.labels().observe(0.5)
+
+    samples = [line for line in registry.render().splitlines() if line[0] != "#"]
+    assert samples == [
+        'busy{pid="42"} 1',
+        'latency_bucket{pid="42",le="1"} 1',
+        'latency_bucket{pid="42",le="+Inf"} 1',
+        'latency_sum{pid="42"} 0.5',
+        'latency_count{pid="42"} 1',
+    ]
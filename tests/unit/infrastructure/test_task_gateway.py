@@ -0,0 +1,327 @@
+import pytest
+
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.domain.exceptions import InvalidCursorError, TaskValidationError
+from kairo.infrastructure.sqlalchemy.gateways import task_gateway as task_gateway_module
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+
+
+@pytest.fixture
+async def project(session):
+    owner = await UserGateway(session).save(
+        User(email="owner@example.com", username="owner", password="password123"),
+    )
+    project = await ProjectGateway(session).create(
+        Project(name="Project", description="Description", owner=owner),
+    )
+    await session.commit()
+    return project
+
+
+@pytest.fixture
+async def tasks(session, project):
+    gateway = TaskGateway(session)
+    created = [
+        await gateway.create(
+            Task(name=f"Task {i}", description="Description", project_id=project.id),
+        )
+        for i in range(7)
+    ]
+    await session.commit()
+    return created
+
+
+async def _collect_pages(fetch, limit):
+    pages = []
+    cursor = None
+    while True:
+        page = await fetch(cursor=cursor, limit=limit)
+        pages.append(page)
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.anyio
+async def test_get_by_project_id_pages_through_tasks_in_id_order(session, project, tasks) -> None:
+    gateway = TaskGateway(session)
+
+    pages = await _collect_pages(
+        lambda **kwargs: gateway.get_by_project_id(project.id, **kwargs),
+        limit=3,
+    )
+
+    assert [len(page.items) for page in pages] == [3, 3, 1]
+    assert [task.id for page in pages for task in page.items] == [task.id for task in tasks]
+
+
+@pytest.mark.anyio
+async def test_exact_multiple_of_limit_has_no_empty_trailing_page(session, project, tasks) -> None:
+    page = await TaskGateway(session).get_by_project_id(project.id, limit=len(tasks))
+
+    assert len(page.items) == len(tasks)
+    assert page.next_cursor is None
+
+
+@pytest.mark.anyio
+async def test_get_by_parent_id_pages_through_subtasks(session, project, tasks) -> None:
+    gateway = TaskGateway(session)
+    parent = tasks[0]
+    subtasks = [
+        await gateway.create(Task(name=f"Sub {i}", description="Description", parent_id=parent.id))
+        for i in range(3)
+    ]
+    await session.commit()
+
+    pages = await _collect_pages(
+        lambda **kwargs: gateway.get_by_parent_id(parent.id, **kwargs),
+        limit=2,
+    )
+
+    assert [task.id for page in pages for task in page.items] == [task.id for task in subtasks]
+    assert all(task.parent_id == parent.id for page in pages for task in page.items)
+
+
+@pytest.mark.anyio
+async def test_stream_by_project_id_yields_every_task_in_id_order(
+    session,
+    project,
+    tasks,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(task_gateway_module, "STREAM_BATCH_SIZE", 2)
+
+    streamed = [task async for task in TaskGateway(session).stream_by_project_id(project.id)]
+
+    assert [task.id for task in streamed] == [task.id for task in tasks]
+
+
+@pytest.mark.anyio
+async def test_invalid_cursor_is_rejected(session, project) -> None:
+    with pytest.raises(InvalidCursorError):
+        await TaskGateway(session).get_by_project_id(project.id, cursor="garbage!")
+
+
+@pytest.mark.anyio
+async def test_get_by_user_id_pages_through_projects_with_owner(session, project) -> None:
+    gateway = ProjectGateway(session)
+    more = [
+        await gateway.create(Project(name=f"P{i}", description="D", owner=project.owner))
+        for i in range(2)
+    ]
+    await session.commit()
+
+    pages = await _collect_pages(
+        lambda **kwargs: gateway.get_by_user_id(project.owner.id, **kwargs),
+        limit=2,
+    )
+
+    projects = [p for page in pages for p in page.items]
+    assert [p.id for p in projects] == [project.id, *(p.id for p in more)]
+    assert {p.owner.id for p in projects} == {project.owner.id}
+
+
+@pytest.fixture
+async def tree(session, project):
+    """Root with two children; the first child has two children of its own."""
+    gateway = TaskGateway(session)
+    root = await gateway.create(Task(name="Root", description="D", project_id=project.id))
+    child_a = await gateway.create(Task(name="A", description="D", parent_id=root.id))
+    child_b = await gateway.create(Task(name="B", description="D", parent_id=root.id))
+    for name in ("A1", "A2"):
+        await gateway.create(Task(name=name, description="D", parent_id=child_a.id))
+    await session.commit()
+    return root
+
+
+def _shape(task):
+    return (task.name, [_shape(subtask) for subtask in task.subtasks])
+
+
+@pytest.mark.anyio
+async def test_get_tree_loads_the_subtree_in_one_query(session, tree, statements) -> None:
+    statements.clear()
+
+    root = await TaskGateway(session).get_tree(tree.id)
+
+    assert len(statements) == 1
+    assert "RECURSIVE" in statements[0].upper()
+    assert _shape(root) == ("Root", [("A", [("A1", []), ("A2", [])]), ("B", [])])
+    assert root.subtasks[0].subtasks[0].parent_id == root.subtasks[0].id
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("max_depth", "expected"),
+    [
+        (0, ("Root", [])),
+        (1, ("Root", [("A", []), ("B", [])])),
+    ],
+)
+async def test_get_tree_stops_at_max_depth(session, tree, max_depth, expected) -> None:
+    root = await TaskGateway(session).get_tree(tree.id, max_depth=max_depth)
+
+    assert _shape(root) == expected
+
+
+@pytest.mark.anyio
+async def test_get_tree_of_a_subtask_starts_there(session, tree) -> None:
+    child_a = (await TaskGateway(session).get_by_parent_id(tree.id)).items[0]
+
+    subtree = await TaskGateway(session).get_tree(child_a.id)
+
+    assert _shape(subtree) == ("A", [("A1", []), ("A2", [])])
+
+
+@pytest.mark.anyio
+async def test_get_tree_of_a_missing_task_is_none(session, project) -> None:
+    assert await TaskGateway(session).get_tree(Task(name="X", description="D").id) is None
+
+
+@pytest.mark.anyio
+async def test_loading_a_project_does_not_load_its_tasks(session, project, tasks, statements) -> None:
+    statements.clear()
+
+    loaded = await ProjectGateway(session).get_by_id(project.id)
+
+    assert len(statements) == 1
+    assert not loaded.tasks.is_loaded
+    assert [task.id async for task in loaded.tasks] == [task.id for task in tasks]
+
+
+@pytest.mark.anyio
+async def test_saving_a_project_writes_only_task_changes(session, project, tasks, statements) -> None:
+    gateway = ProjectGateway(session)
+    loaded = await gateway.get_by_id(project.id)
+    loaded.name = "Renamed"
+    loaded.add_task(Task(name="New", description="Description"))
+    loaded.remove_task(tasks[0].id)
+    statements.clear()
+
+    await gateway.update(loaded)
+    await session.commit()
+
+    assert len(statements) == 3
+    assert not loaded.tasks.has_changes
+    reloaded = await gateway.get_by_id(project.id)
+    names = [task.name for task in await reloaded.tasks.load()]
+    assert reloaded.name == "Renamed"
+    assert names == [task.name for task in tasks[1:]] + ["New"]
+
+
+@pytest.mark.anyio
+async def test_renaming_a_project_does_not_touch_tasks(session, project, tasks, statements) -> None:
+    gateway = ProjectGateway(session)
+    loaded = await gateway.get_by_id(project.id)
+    loaded.name = "Renamed"
+    statements.clear()
+
+    await gateway.update(loaded)
+
+    assert len(statements) == 1
+    assert "tasks" not in statements[0]
+
+
+@pytest.mark.anyio
+async def test_creating_a_project_writes_its_tasks(session, project) -> None:
+    gateway = ProjectGateway(session)
+    new = Project(name="New", description="Description", owner=project.owner)
+    new.add_task(Task(name="First", description="Description"))
+    await gateway.create(new)
+    await session.commit()
+
+    page = await TaskGateway(session).get_by_project_id(new.id)
+
+    assert [task.name for task in page.items] == ["First"]
+
+
+async def _by_name(gateway, root, name):
+    page = await gateway.get_descendants(root.id, limit=100)
+    return next(task for task in page.items if task.name == name)
+
+
+@pytest.mark.anyio
+async def test_get_descendants_is_one_range_scan(session, tree, statements) -> None:
+    gateway = TaskGateway(session)
+    statements.clear()
+
+    page = await gateway.get_descendants(tree.id)
+
+    assert sorted(task.name for task in page.items) == ["A", "A1", "A2", "B"]
+    assert not any("RECURSIVE" in statement.upper() for statement in statements)
+
+
+@pytest.mark.anyio
+async def test_get_ancestors_root_first(session, tree) -> None:
+    gateway = TaskGateway(session)
+    leaf = await _by_name(gateway, tree, "A1")
+
+    ancestors = await gateway.get_ancestors(leaf.id)
+
+    assert [task.name for task in ancestors] == ["Root", "A"]
+    assert await gateway.get_ancestors(tree.id) == []
+
+
+@pytest.mark.anyio
+async def test_moving_a_subtree_rewrites_paths_in_one_update(session, tree, statements) -> None:
+    gateway = TaskGateway(session)
+    child_a = await _by_name(gateway, tree, "A")
+    child_b = await _by_name(gateway, tree, "B")
+    child_a.parent_id = child_b.id
+    statements.clear()
+
+    await gateway.update(child_a)
+    await session.commit()
+
+    path_updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE") and "substr" in s]
+    assert len(path_updates) == 1
+    leaf = await _by_name(gateway, tree, "A1")
+    assert [task.name for task in await gateway.get_ancestors(leaf.id)] == ["Root", "B", "A"]
+    assert sorted(t.name for t in (await gateway.get_descendants(child_b.id)).items) == ["A", "A1", "A2"]
+
+
+@pytest.mark.anyio
+async def test_moving_a_task_under_its_own_subtree_is_rejected(session, tree) -> None:
+    gateway = TaskGateway(session)
+    child_a = await _by_name(gateway, tree, "A")
+    leaf = await _by_name(gateway, tree, "A1")
+    child_a.parent_id = leaf.id
+
+    with pytest.raises(TaskValidationError):
+        await gateway.update(child_a)
+
+
+@pytest.mark.anyio
+async def test_create_many_builds_paths_for_new_and_existing_parents(session, tree) -> None:
+    gateway = TaskGateway(session)
+    parent = Task(name="New parent", description="D", parent_id=tree.id)
+    child = Task(name="New child", description="D", parent_id=parent.id)
+
+    await gateway.create_many([child, parent])
+    await session.commit()
+
+    assert [task.name for task in await gateway.get_ancestors(child.id)] == ["Root", "New parent"]
+
+
+@pytest.mark.anyio
+async def test_deleting_a_project_deletes_its_tasks(session, project, tasks) -> None:
+    await ProjectGateway(session).delete(project)
+    await session.commit()
+
+    assert await TaskGateway(session).get_by_id(tasks[0].id) is None
+
+
+@pytest.mark.anyio
+async def test_deleting_a_task_deletes_its_subtasks(session, tree) -> None:
+    gateway = TaskGateway(session)
+    child_a = (await gateway.get_by_parent_id(tree.id)).items[0]
+
+    await gateway.delete(child_a)
+    await session.commit()
+
+    remaining = (await gateway.get_descendants(tree.id)).items
+    assert [task.name for task in remaining] == ["B"]
@@ -0,0 +1,175 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.domain.exceptions import InvalidQueryError
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.infrastructure.sqlalchemy.task_query import (
+    compile_shape,
+    compile_task_query,
+    normalize,
+    tokenize,
+)
+
+
+def test_queries_differing_only_in_values_share_a_normalized_shape() -> None:
+    first, first_values = tokenize('project = "Alpha" and text ~ login')
+    second, second_values = tokenize("PROJECT='Beta'   AND  text~ 'sign up'")
+
+    assert first == second
+    assert normalize(first) == "project = ?text AND text ~ ?text"
+    assert first_values == ["Alpha", "login"]
+    assert second_values == ["Beta", "sign up"]
+
+
+def test_compiled_statements_are_cached_by_shape() -> None:
+    compile_shape.cache_clear()
+
+    first, first_params = compile_task_query("parent IS EMPTY AND text ~ a", "sqlite")
+    second, second_params = compile_task_query("parent is empty and text ~ b", "sqlite")
+
+    assert first is second
+    assert first_params != second_params
+    assert compile_shape.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "project =",
+        "(parent IS EMPTY",
+        "parent IS FULL",
+        "parent IS EMPTY parent IS EMPTY",
+        "colour = red",
+        "text = login",
+        "parent IS EMPTY ORDER BY name",
+        "parent IS EMPTY ORDER BY created, id",
+        'parent = "x',
+    ],
+)
+def test_malformed_queries_are_rejected(query) -> None:
+    with pytest.raises(InvalidQueryError):
+        compile_task_query(query, "sqlite")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        'name ~ "login"',
+        "parent IS NOT EMPTY",
+        "NOT parent IS EMPTY",
+        'parent IS EMPTY OR description ~ "x"',
+    ],
+)
+def test_queries_no_index_can_narrow_are_rejected(query) -> None:
+    with pytest.raises(InvalidQueryError, match="cannot use an index"):
+        compile_task_query(query, "sqlite")
+
+
+def test_unindexed_conditions_next_to_indexed_ones_are_reported(caplog) -> None:
+    compile_shape.cache_clear()
+
+    with caplog.at_level(logging.WARNING):
+        compiled, _ = compile_task_query('parent IS EMPTY AND name ~ "fix"', "sqlite")
+
+    assert compiled.warnings == ("name ~ ?",)
+    assert "name ~ ?" in caplog.text
+
+
+def test_values_of_the_wrong_type_are_rejected() -> None:
+    with pytest.raises(InvalidQueryError, match="not a valid id"):
+        compile_task_query("parent = nope", "sqlite")
+    with pytest.raises(InvalidQueryError, match="not a valid date"):
+        compile_task_query("created > yesterday", "sqlite")
+
+
+@pytest.fixture
+async def tree(session):
+    owner = await UserGateway(session).save(
+        User(email="owner@example.com", username="owner", password="password123"),
+    )
+    project = await ProjectGateway(session).create(
+        Project(name="Billing", description="Description", owner=owner),
+    )
+    gateway = TaskGateway(session)
+    root = Task(name="Fix login", description="Users cannot sign in", project_id=project.id)
+    other = Task(name="Release", description="Ship it", project_id=project.id)
+    child = Task(name="Reproduce", description="Login fails", parent_id=root.id)
+    grandchild = Task(name="Write test", description="Cover it", parent_id=child.id)
+    await gateway.create_many([root, other, child, grandchild])
+    await session.commit()
+    return {
+        "owner": owner,
+        "project": project,
+        "root": root,
+        "other": other,
+        "child": child,
+        "grandchild": grandchild,
+    }
+
+
+async def _find_names(gateway, query, limit=50):
+    names = []
+    cursor = None
+    while True:
+        page = await gateway.find(query, cursor=cursor, limit=limit)
+        names.extend(task.name for task in page.items)
+        if page.next_cursor is None:
+            return names
+        cursor = page.next_cursor
+
+
+@pytest.mark.anyio
+async def test_find_combines_conditions_in_one_statement(session, tree, statements) -> None:
+    gateway = TaskGateway(session)
+    statements.clear()
+
+    page = await gateway.find(
+        f'project = {tree["project"].id} AND parent IS EMPTY AND text ~ "login"',
+    )
+
+    assert [task.name for task in page.items] == ["Fix login"]
+    assert len(statements) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("ancestor = {root}", ["Reproduce", "Write test"]),
+        ("parent IN ({root}, {child})", ["Reproduce", "Write test"]),
+        ('project = "Billing"', ["Fix login", "Release"]),
+        ("owner = {owner}", ["Fix login", "Release"]),
+        ("id = {other} OR id = {child}", ["Release", "Reproduce"]),
+        ('project IS EMPTY AND description ~ "LOGIN"', ["Reproduce"]),
+        ("", ["Fix login", "Release", "Reproduce", "Write test"]),
+    ],
+)
+async def test_find_filters_by_field(session, tree, query, expected) -> None:
+    ids = {name: entity.id for name, entity in tree.items()}
+
+    assert await _find_names(TaskGateway(session), query.format(**ids)) == expected
+
+
+@pytest.mark.anyio
+async def test_find_orders_by_created_descending_across_pages(session, tree) -> None:
+    names = await _find_names(TaskGateway(session), "ORDER BY created DESC", limit=3)
+
+    assert names == ["Write test", "Reproduce", "Release", "Fix login"]
+
+
+@pytest.mark.anyio
+async def test_find_filters_by_creation_time(session, tree) -> None:
+    gateway = TaskGateway(session)
+    today = datetime.now(UTC).date()
+    tomorrow = today + timedelta(days=1)
+
+    assert len(await _find_names(gateway, f"created = {today}")) == 4
+    assert await _find_names(gateway, f"created >= {tomorrow}") == []
+    assert await _find_names(gateway, f"created < {today}") == []
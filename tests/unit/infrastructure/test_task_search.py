@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from kairo.domain.entities.task import Task
+from kairo.domain.exceptions import InvalidCursorError
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.search import rebuild_task_search, search_tasks
+
+
+async def _search_names(gateway, query, limit=50):
+    names = []
+    cursor = None
+    while True:
+        page = await gateway.search(query, cursor=cursor, limit=limit)
+        names.extend(task.name for task in page.items)
+        if page.next_cursor is None:
+            return names
+        cursor = page.next_cursor
+
+
+@pytest.fixture
+async def gateway(session):
+    gateway = TaskGateway(session)
+    for name, description in [
+        ("Deploy the billing service", "Roll out to production"),
+        ("Write release notes", "Mention the newly deployed pipeline"),
+        ("Fix login form", "Password field loses focus"),
+    ]:
+        await gateway.create(Task(name=name, description=description))
+    await session.commit()
+    return gateway
+
+
+@pytest.mark.anyio
+async def test_search_matches_stemmed_words_with_name_matches_first(gateway) -> None:
+    assert await _search_names(gateway, "deploying") == [
+        "Deploy the billing service",
+        "Write release notes",
+    ]
+
+
+@pytest.mark.anyio
+async def test_search_requires_every_word_to_match(gateway) -> None:
+    assert await _search_names(gateway, "deploy production") == [
+        "Deploy the billing service",
+    ]
+
+
+@pytest.mark.anyio
+async def test_search_ignores_query_syntax_in_user_input(gateway) -> None:
+    assert await _search_names(gateway, 'login" OR NEAR(*') == []
+    assert await _search_names(gateway, '"login"') == ["Fix login form"]
+    assert await _search_names(gateway, "?!") == []
+
+
+@pytest.mark.anyio
+async def test_search_pages_through_ties_without_repeats(session) -> None:
+    gateway = TaskGateway(session)
+    await gateway.create_many(
+        [Task(name=f"Task {i}", description="Same text") for i in range(7)],
+    )
+    await session.commit()
+
+    assert await _search_names(gateway, "task", limit=3) == [f"Task {i}" for i in range(7)]
+
+
+@pytest.mark.anyio
+async def test_search_index_follows_updates_and_deletes(session, gateway) -> None:
+    page = await gateway.search("login")
+    task = page.items[0]
+
+    task.name = "Fix signup form"
+    await gateway.update(task)
+    await session.commit()
+    assert await _search_names(gateway, "login") == []
+    assert await _search_names(gateway, "signup") == ["Fix signup form"]
+
+    await gateway.delete(task)
+    await session.commit()
+    assert await _search_names(gateway, "signup") == []
+
+
+@pytest.mark.anyio
+async def test_search_rejects_a_malformed_cursor(gateway) -> None:
+    with pytest.raises(InvalidCursorError):
+        await gateway.search("deploy", cursor="AAAA")
+
+
+@pytest.mark.anyio
+async def test_rebuild_repopulates_the_index(session, gateway) -> None:
+    await session.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('delete-all')"))
+    await session.commit()
+    assert await _search_names(gateway, "login") == []
+
+    connection = await session.connection()
+    await connection.run_sync(rebuild_task_search)
+    await session.commit()
+
+    assert await _search_names(gateway, "login") == ["Fix login form"]
+
+
+def test_postgresql_search_uses_the_generated_vector() -> None:
+    statement = search_tasks("postgresql", "deploy: now!")
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "plainto_tsquery('english'::regconfig" in sql
+    assert "tasks.search_vector @@" in sql
+    assert "ts_rank(" in sql
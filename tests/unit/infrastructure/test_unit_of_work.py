@@ -0,0 +1,323 @@
+import json
+
+import pytest
+
+from kairo.application.caching import CachingUserGateway
+from kairo.application.interactors.user import CreateUsersBulkUseCase
+from kairo.config import CacheConfig
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.domain.exceptions import TaskValidationError
+from kairo.infrastructure.cache.factory import create_user_cache
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.infrastructure.sqlalchemy.unit_of_work import UnitOfWork
+from kairo.presentation.http.bulk import provision_users
+
+
+@pytest.fixture
+async def users(session):
+    gateway = UserGateway(session)
+    saved = [
+        await gateway.save(
+            User(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                password="password123",
+            ),
+        )
+        for i in range(3)
+    ]
+    await session.commit()
+    return saved
+
+
+@pytest.fixture
+def unit_of_work(session):
+    return UnitOfWork(session)
+
+
+@pytest.mark.anyio
+async def test_loading_a_user_twice_is_one_object_and_one_query(
+    session,
+    unit_of_work,
+    users,
+    max_queries,
+) -> None:
+    gateway = UserGateway(session, unit_of_work)
+
+    with max_queries(1):
+        first = await gateway.get_by_id(users[0].id)
+        second = await gateway.get_by_id(users[0].id)
+
+    assert first is second
+
+
+@pytest.mark.anyio
+async def test_batch_lookup_only_queries_unmapped_users(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    gateway = UserGateway(session, unit_of_work)
+    first = await gateway.get_by_id(users[0].id)
+    statements.clear()
+
+    found = await gateway.get_many_by_ids([users[0].id, users[1].id])
+
+    assert found[users[0].id] is first
+    assert len(statements) == 1
+
+
+@pytest.mark.anyio
+async def test_writes_wait_for_commit_and_are_batched(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    gateway = UserGateway(session, unit_of_work)
+    for user in users[:2]:
+        user.username = f"renamed-{user.username}"
+        await gateway.update(user)
+    await gateway.delete(users[2])
+    assert statements == []
+
+    await unit_of_work.commit()
+
+    writes = [s for s in statements if s.startswith(("UPDATE", "DELETE"))]
+    # Users are updated one by one, to refresh their updated_at.
+    assert [s.split()[0] for s in writes] == ["UPDATE", "UPDATE", "DELETE"]
+    fresh = UserGateway(session)
+    assert (await fresh.get_by_id(users[0].id)).username == "renamed-user0"
+    assert await fresh.get_by_id(users[2].id) is None
+
+
+@pytest.mark.anyio
+async def test_a_removed_user_is_not_found_before_the_flush(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    gateway = UserGateway(session, unit_of_work)
+
+    await gateway.delete(users[0])
+
+    assert await gateway.get_by_id(users[0].id) is None
+    assert statements == []
+
+
+@pytest.mark.anyio
+async def test_new_projects_and_tasks_are_inserted_parents_first(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    projects = ProjectGateway(session, unit_of_work)
+    tasks = TaskGateway(session, unit_of_work)
+    project = Project(name="Project", description="Description", owner=users[0])
+    parent = Task(name="Parent", description="Description", project_id=project.id)
+    child = Task(
+        name="Child",
+        description="Description",
+        project_id=project.id,
+        parent_id=parent.id,
+    )
+    # Registered children first; the flush still inserts parents first.
+    await tasks.create(child)
+    await tasks.create(parent)
+    await projects.create(project)
+
+    await unit_of_work.commit()
+
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert [s.split()[2] for s in inserts] == ["projects", "tasks"]
+    ancestors = await TaskGateway(session).get_ancestors(child.id)
+    assert [task.id for task in ancestors] == [parent.id]
+
+
+@pytest.mark.anyio
+async def test_an_entity_created_and_removed_is_never_written(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    project = await ProjectGateway(session).create(
+        Project(name="Project", description="Description", owner=users[0]),
+    )
+    await session.commit()
+    gateway = TaskGateway(session, unit_of_work)
+    task = await gateway.create(
+        Task(name="Task", description="Description", project_id=project.id),
+    )
+    task.name = "Renamed"
+    await gateway.update(task)
+    await gateway.delete(task)
+    statements.clear()
+
+    await unit_of_work.commit()
+
+    assert not any(s.startswith(("INSERT", "UPDATE", "DELETE")) for s in statements)
+
+
+@pytest.mark.anyio
+async def test_an_invalid_move_is_reported_at_commit(
+    session,
+    unit_of_work,
+    users,
+) -> None:
+    project = await ProjectGateway(session).create(
+        Project(name="Project", description="Description", owner=users[0]),
+    )
+    parent = Task(name="Parent", description="Description", project_id=project.id)
+    child = Task(
+        name="Child",
+        description="Description",
+        project_id=project.id,
+        parent_id=parent.id,
+    )
+    await TaskGateway(session).create_many([parent, child])
+    await session.commit()
+    parent.parent_id = child.id
+
+    await TaskGateway(session, unit_of_work).update(parent)
+
+    with pytest.raises(TaskValidationError):
+        await unit_of_work.commit()
+
+
+@pytest.mark.anyio
+async def test_rollback_discards_pending_writes(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    gateway = UserGateway(session, unit_of_work)
+    users[0].username = "renamed"
+    await gateway.update(users[0])
+
+    await unit_of_work.rollback()
+    await unit_of_work.commit()
+
+    assert not any(s.startswith("UPDATE") for s in statements)
+
+
+@pytest.mark.anyio
+async def test_updates_are_grouped_by_changed_columns(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    saved = [
+        await ProjectGateway(session).create(
+            Project(name=f"Project {i}", description="Description", owner=users[0]),
+        )
+        for i in range(3)
+    ]
+    await session.commit()
+    gateway = ProjectGateway(session, unit_of_work)
+    loaded = [await gateway.get_by_id(project.id) for project in saved]
+    loaded[0].name = "Renamed 0"
+    loaded[1].name = "Renamed 1"
+    loaded[2].description = "Changed"
+    for project in loaded:
+        await gateway.update(project)
+    statements.clear()
+
+    await unit_of_work.commit()
+
+    updates = sorted(s for s in statements if s.startswith("UPDATE"))
+    assert [s.split("=")[0] for s in updates] == [
+        "UPDATE projects SET description",
+        "UPDATE projects SET name",
+    ]
+
+
+@pytest.mark.anyio
+async def test_delete_many_waits_for_commit(
+    session,
+    unit_of_work,
+    users,
+    statements,
+) -> None:
+    project = await ProjectGateway(session).create(
+        Project(name="Project", description="Description", owner=users[0]),
+    )
+    await session.commit()
+    statements.clear()
+
+    await ProjectGateway(session, unit_of_work).delete_many([project.id])
+    await UserGateway(session, unit_of_work).delete_many([users[1].id, users[2].id])
+    assert statements == []
+    await unit_of_work.commit()
+
+    deletes = [s.split()[2] for s in statements if s.startswith("DELETE")]
+    assert deletes == ["projects", "users"]
+
+
+@pytest.mark.anyio
+async def test_cached_users_go_through_the_identity_map(
+    session,
+    unit_of_work,
+    users,
+) -> None:
+    user_cache = create_user_cache(CacheConfig())
+    # Fill the cache from another request.
+    await CachingUserGateway(UserGateway(session), user_cache).get_by_id(users[0].id)
+    gateway = CachingUserGateway(
+        UserGateway(session, unit_of_work),
+        user_cache,
+        unit_of_work,
+    )
+
+    first = await gateway.get_by_id(users[0].id)
+    first.username = "renamed"
+    second = await gateway.get_by_id(users[0].id)
+    many = await gateway.get_many_by_ids([users[0].id, users[1].id])
+
+    assert second is first
+    assert many[users[0].id] is first
+    assert second.username == "renamed"
+    assert many[users[1].id] is await gateway.get_by_id(users[1].id)
+
+
+class PlainHasher:
+    async def hash_many(self, passwords):
+        return [f"hashed-{password}" for password in passwords]
+
+
+@pytest.mark.anyio
+async def test_a_chunked_import_does_not_keep_committed_users(
+    session,
+    unit_of_work,
+) -> None:
+    gateway = UserGateway(session, unit_of_work)
+    use_case = CreateUsersBulkUseCase(unit_of_work, gateway, gateway, PlainHasher())
+    committed = []
+
+    async def lines():
+        for i in range(5):
+            yield json.dumps(
+                {
+                    "email": f"bulk{i}@example.com",
+                    "username": f"bulk{i}",
+                    "password": "password123",
+                },
+            ).encode()
+            committed.append(len(unit_of_work._identity_map))
+
+    results = await provision_users(lines(), use_case, chunk_size=2)
+
+    ids = [json.loads(line)["id"] for line in results]
+    assert len(ids) == 5
+    # Only the chunk being imported is ever held in the map.
+    assert max(committed) <= 2
+    assert unit_of_work._identity_map == {}
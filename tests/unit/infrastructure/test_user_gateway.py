@@ -0,0 +1,244 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kairo.application.dto.user import CreateUserDTO
+from kairo.application.interactors.user import CreateUserUseCase
+from kairo.application.interfaces import DBSession, PasswordHasher
+from kairo.config import (
+    CacheConfig,
+    DatabaseConfig,
+    PasswordHashConfig,
+    ServerConfig,
+    Settings,
+)
+from kairo.domain.entities.user import User
+from kairo.domain.exceptions import UserAlreadyExistsError
+from kairo.domain.gateways.user_gateway import UserGateway as UserGatewayInterface
+from kairo.infrastructure.sqlalchemy.engine import create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.ioc import create_container
+
+
+@pytest.fixture
+async def users(session):
+    gateway = UserGateway(session)
+    saved = [
+        await gateway.save(
+            User(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                password="password123",
+            ),
+        )
+        for i in range(5)
+    ]
+    await session.commit()
+    return saved
+
+
+@pytest.mark.anyio
+async def test_get_by_id(session, users) -> None:
+    gateway = UserGateway(session)
+
+    user = await gateway.get_by_id(users[0].id)
+
+    assert user is not None
+    assert user.email == users[0].email
+
+
+@pytest.mark.anyio
+async def test_get_many_by_ids_uses_one_query(session, users, statements) -> None:
+    gateway = UserGateway(session)
+    wanted = [users[0].id, users[2].id, users[0].id]
+
+    found = await gateway.get_many_by_ids(wanted)
+
+    assert set(found) == {users[0].id, users[2].id}
+    assert found[users[2].id].username == users[2].username
+    assert len(statements) == 1
+
+
+@pytest.mark.anyio
+async def test_get_many_by_emails(session, users) -> None:
+    gateway = UserGateway(session)
+
+    found = await gateway.get_many_by_emails(
+        [users[1].email, "missing@example.com"],
+    )
+
+    assert list(found) == [users[1].email]
+
+
+@pytest.mark.anyio
+async def test_get_many_with_no_keys_skips_the_query(session, statements) -> None:
+    gateway = UserGateway(session)
+
+    assert await gateway.get_many_by_ids([]) == {}
+    assert statements == []
+
+
+@pytest.mark.anyio
+async def test_update_and_delete(session, users) -> None:
+    gateway = UserGateway(session)
+    users[0].username = "renamed"
+
+    updated = await gateway.update(users[0])
+    await gateway.delete(users[1])
+    await session.commit()
+
+    assert updated.username == "renamed"
+    assert (await gateway.get_by_id(users[0].id)).username == "renamed"
+    assert await gateway.get_by_id(users[1].id) is None
+
+
+@pytest.mark.anyio
+async def test_save_is_a_single_statement(session, statements) -> None:
+    gateway = UserGateway(session)
+    user = User(email="new@example.com", username="new", password="password123")
+
+    saved = await gateway.save(user)
+
+    assert (saved.id, saved.email, saved.username) == (user.id, user.email, user.username)
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("INSERT")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("email", "username", "message"),
+    [
+        ("user0@example.com", "fresh", "User with email 'user0@example.com' already exists."),
+        ("fresh@example.com", "user0", "User with username 'user0' already exists."),
+    ],
+)
+async def test_save_maps_unique_violations(session, users, email, username, message) -> None:
+    gateway = UserGateway(session)
+
+    with pytest.raises(UserAlreadyExistsError) as exc_info:
+        await gateway.save(User(email=email, username=username, password="password123"))
+
+    assert str(exc_info.value) == message
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicate_signups_create_one_user(migrated_engine) -> None:
+    session_maker = create_session_maker(migrated_engine)
+    password_hasher = AsyncMock(spec=PasswordHasher)
+    password_hasher.hash.return_value = "hashed"
+
+    async def sign_up(username):
+        async with session_maker() as session:
+            use_case = CreateUserUseCase(session, UserGateway(session), password_hasher)
+            return await use_case(
+                CreateUserDTO(
+                    email="race@example.com",
+                    username=username,
+                    password="password123",
+                ),
+            )
+
+    results = await asyncio.gather(
+        sign_up("racer1"),
+        sign_up("racer2"),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(r, User) for r in results) == 1
+    assert sum(isinstance(r, UserAlreadyExistsError) for r in results) == 1
+
+
+@pytest.mark.anyio
+async def test_save_many_skips_conflicts_in_one_statement(session, users, statements) -> None:
+    gateway = UserGateway(session)
+    fresh = User(email="fresh@example.com", username="fresh", password="password123")
+    taken = User(email=users[0].email, username="other", password="password123")
+    statements.clear()
+
+    created = await gateway.save_many([fresh, taken])
+    await session.commit()
+
+    assert [user.id for user in created] == [fresh.id]
+    assert len([s for s in statements if s.lstrip().upper().startswith("INSERT")]) == 1
+    assert await gateway.get_by_id(taken.id) is None
+
+
+@pytest.mark.anyio
+async def test_update_writes_only_changed_columns_in_one_statement(
+    session,
+    users,
+    statements,
+) -> None:
+    gateway = UserGateway(session)
+    user = await gateway.get_by_id(users[0].id)
+    user.username = "renamed"
+    statements.clear()
+
+    updated = await gateway.update(user)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE users SET username=")
+    assert "email" not in statements[0]
+    assert "RETURNING" in statements[0]
+    assert updated.changed_fields() == {}
+
+
+@pytest.mark.anyio
+async def test_update_without_changes_writes_nothing(session, users, statements) -> None:
+    gateway = UserGateway(session)
+    user = await gateway.get_by_id(users[0].id)
+    statements.clear()
+
+    await gateway.update(user)
+
+    assert statements == []
+
+
+@pytest.mark.anyio
+async def test_delete_does_not_read_the_user_first(session, users, statements) -> None:
+    gateway = UserGateway(session)
+
+    await gateway.delete(users[0])
+    await gateway.delete_many([users[1].id, users[2].id])
+
+    assert [statement.split()[0] for statement in statements] == ["DELETE", "DELETE"]
+    assert await gateway.get_by_id(users[1].id) is None
+
+
+@pytest.mark.anyio
+async def test_container_wired_update_refreshes_and_reports_missing_users(
+    migrated_engine,
+    users,
+) -> None:
+    settings = Settings(
+        database=DatabaseConfig(
+            url=migrated_engine.url.render_as_string(hide_password=False),
+        ),
+        cache=CacheConfig(),
+        password=PasswordHashConfig(workers=1),
+        server=ServerConfig(),
+    )
+
+    async with create_container(settings) as container:
+        async with container.enter() as request:
+            gateway = await request.get(UserGatewayInterface)
+            db_session = await request.get(DBSession)
+            user = await gateway.get_by_id(users[0].id)
+            user.username = "renamed"
+            stale_updated_at = user.updated_at
+            await gateway.update(user)
+            await db_session.commit()
+
+            assert user.updated_at != stale_updated_at
+            assert (await gateway.get_by_id(users[0].id)).username == "renamed"
+
+        async with container.enter() as request:
+            gateway = await request.get(UserGatewayInterface)
+            db_session = await request.get(DBSession)
+            await gateway.update(
+                User(email="ghost@example.com", username="ghost", password="password123"),
+            )
+
+            with pytest.raises(ValueError, match="does not exist"):
+                await db_session.commit()
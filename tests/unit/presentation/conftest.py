@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from kairo.config import DatabaseConfig
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.infrastructure.sqlalchemy.engine import create_engine, create_session_maker
+from kairo.infrastructure.sqlalchemy.gateways.project_gateway import ProjectGateway
+from kairo.infrastructure.sqlalchemy.gateways.task_gateway import TaskGateway
+from kairo.infrastructure.sqlalchemy.gateways.user_gateway import UserGateway
+from kairo.infrastructure.sqlalchemy.migrations import MIGRATIONS, MigrationEngine
+
+
+async def _seed(url):
+    engine = create_engine(DatabaseConfig(url=url))
+    await MigrationEngine(engine, MIGRATIONS).upgrade()
+    async with create_session_maker(engine)() as session:
+        owner = await UserGateway(session).save(
+            User(email="owner@example.com", username="owner", password="password123"),
+        )
+        project = await ProjectGateway(session).create(
+            Project(name="Project", description="Description", owner=owner),
+        )
+        for i in range(5):
+            await TaskGateway(session).create(
+                Task(
+                    name=f"Task {i}", description="Description", project_id=project.id
+                ),
+            )
+        await session.commit()
+    await engine.dispose()
+    return project.id
+
+
+@pytest.fixture
+def project_id(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'kairo.db'}"
+    project_id = asyncio.run(_seed(url))
+    monkeypatch.setenv("KAIRO_DATABASE_URL", url)
+    monkeypatch.setenv("KAIRO_CACHE_BACKEND", "none")
+    monkeypatch.setenv("KAIRO_PASSWORD_SCRYPT_N", "16")
+    monkeypatch.setenv("KAIRO_PASSWORD_WORKERS", "1")
+    return project_id
@@ -0,0 +1,26 @@
+from fastapi.testclient import TestClient
+
+from kairo.presentation.http.application import get_production_app
+
+
+def test_login_accepts_the_signup_password_only(project_id) -> None:
+    credentials = {"email": "new@example.com", "password": "password123"}
+    with TestClient(get_production_app()) as client:
+        created = client.post(
+            "/api/v1/users",
+            json={**credentials, "username": "new"},
+        ).json()
+        login = client.post("/api/v1/auth/login", json=credentials)
+        wrong = client.post(
+            "/api/v1/auth/login",
+            json={**credentials, "password": "password124"},
+        )
+        unknown = client.post(
+            "/api/v1/auth/login",
+            json={**credentials, "email": "nobody@example.com"},
+        )
+
+    assert login.status_code == 200
+    assert login.json() == created
+    assert wrong.status_code == unknown.status_code == 401
+    assert wrong.json() == unknown.json()
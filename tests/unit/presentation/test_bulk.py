@@ -0,0 +1,83 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from kairo.application.dto.user import CreateUserResult
+from kairo.presentation.http import bulk
+from kairo.presentation.http.bulk import iter_results, provision_users
+from kairo.presentation.http.ndjson import iter_ndjson_lines
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(lines):
+    return [line async for line in lines]
+
+
+@pytest.mark.anyio
+async def test_iter_ndjson_lines_joins_lines_split_across_chunks() -> None:
+    lines = iter_ndjson_lines(_chunks(b'{"a": 1}\n{"b"', b': 2}\n', b'{"c": 3}'), 64)
+
+    assert await _collect(lines) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+@pytest.mark.anyio
+async def test_iter_ndjson_lines_drops_overlong_lines() -> None:
+    lines = iter_ndjson_lines(_chunks(b"short\n" + b"x" * 10, b"x" * 10 + b"\nok\n"), 8)
+
+    assert await _collect(lines) == [b"short", None, b"ok"]
+
+
+@pytest.mark.anyio
+async def test_provision_users_chunks_rows_and_reports_per_line() -> None:
+    user_id = uuid7()
+    use_case = AsyncMock(
+        side_effect=lambda dtos: [CreateUserResult(user_id=user_id) for _ in dtos],
+    )
+    row = json.dumps(
+        {"email": "user@example.com", "username": "user", "password": "password123"},
+    ).encode()
+
+    results = await provision_users(
+        iter_ndjson_lines(_chunks(row, b"\n", b"\n{broken\n", row, b"\n", row), 1024),
+        use_case,
+        chunk_size=2,
+    )
+    lines = [json.loads(line) for line in iter_results(results)]
+
+    assert use_case.await_count == 2
+    assert lines == [
+        {"line": 1, "id": str(user_id)},
+        {"line": 3, "error": lines[1]["error"]},
+        {"line": 4, "id": str(user_id)},
+        {"line": 5, "id": str(user_id)},
+    ]
+    assert lines[1]["error"].startswith("Invalid row")
+    assert results.closed
+
+
+@pytest.mark.anyio
+async def test_provision_users_does_not_buffer_invalid_lines(monkeypatch) -> None:
+    written = []
+    monkeypatch.setattr(
+        bulk,
+        "_write_result",
+        lambda results, line, result: written.append(line),
+    )
+    buffered = []
+
+    async def invalid_lines():
+        for line_number in range(1, 11):
+            # Lines read so far that have no result yet.
+            buffered.append(line_number - 1 - len(written))
+            yield b"{broken"
+
+    await provision_users(invalid_lines(), AsyncMock(), chunk_size=3)
+
+    assert max(buffered) < 3
+    assert written == list(range(1, 11))
@@ -0,0 +1,93 @@
+import os
+from dataclasses import replace
+
+import pytest
+
+from kairo.presentation.cli.main import main
+from kairo.presentation.loadtest.runner import (
+    LoadOptions,
+    histogram,
+    in_process_client,
+    run_scenario,
+    summarize,
+)
+from kairo.presentation.loadtest.scenarios import SCENARIOS, load_scenarios, render
+
+
+def test_summary_uses_nearest_rank_percentiles() -> None:
+    summary = summarize([i / 1000 for i in range(100, 0, -1)], errors=2)
+
+    assert (summary.count, summary.errors) == (100, 2)
+    assert (summary.p50, summary.p95, summary.p99, summary.max) == (
+        0.05,
+        0.095,
+        0.099,
+        0.1,
+    )
+
+
+def test_histogram_buckets_are_upper_bounds_with_an_overflow_bucket() -> None:
+    buckets = dict(histogram([0.0005, 0.001, 0.0015, 100.0]))
+
+    assert buckets[0.001] == 2
+    assert buckets[0.002] == 1
+    assert buckets[None] == 1
+    assert sum(buckets.values()) == 4
+
+
+def test_render_fills_placeholders_in_nested_bodies() -> None:
+    template = {"email": "u{n}@example.com", "tags": ["{run}"], "age": 3}
+
+    assert render(template, {"n": "7", "run": "abc"}) == {
+        "email": "u7@example.com",
+        "tags": ["abc"],
+        "age": 3,
+    }
+
+
+def test_scenarios_load_from_toml(tmp_path) -> None:
+    path = tmp_path / "scenarios.toml"
+    path.write_text(
+        """
+        [[scenarios]]
+        name = "login"
+        users = 5
+
+        [[scenarios.requests]]
+        name = "bad login"
+        method = "POST"
+        path = "/api/v1/auth/login"
+        json = { email = "nobody@example.com", password = "password123" }
+        expect = [401]
+        """,
+    )
+
+    scenario = load_scenarios(path)["login"]
+
+    assert scenario.users == 5
+    assert scenario.requests[0].expect == [401]
+    assert scenario.requests[0].weight == 1
+
+
+@pytest.mark.anyio
+async def test_mixed_scenario_runs_in_process(project_id) -> None:
+    scenario = replace(SCENARIOS["users-mixed"], users=3)
+    options = LoadOptions(concurrency=4, duration=0.3, seed=1)
+
+    async with in_process_client(os.environ["KAIRO_DATABASE_URL"]) as client:
+        report = await run_scenario(client, scenario, options, "in-process")
+
+    assert report.total.count > 0
+    assert report.total.errors == 0
+    assert set(report.requests) <= {"get user", "list projects", "create user"}
+    assert sum(n for _, n in report.histogram) == report.total.count
+    assert report.pool is not None
+    assert report.pool.checkouts > 0
+
+
+def test_cli_rejects_an_unknown_scenario(capsys) -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        main(["loadtest", "nope"])
+
+    assert exit_info.value.code == 1
+    assert "Unknown scenario 'nope'" in capsys.readouterr().err
@@ -0,0 +1,72 @@
+import os
+import re
+
+from fastapi.testclient import TestClient
+
+from kairo.presentation.http.application import get_production_app
+
+
+def _sample(text, name, **labels):
+    # Every sample carries the pid of the worker that recorded it.
+    labels = {"pid": str(os.getpid()), **labels}
+    rendered = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    series = f"{name}{{{rendered}}}" if labels else name
+    pattern = r"(?m)^" + re.escape(series) + r" (\S+)$"
+    match = re.search(pattern, text)
+    assert match, f"{name} {labels} not found"
+    return float(match.group(1))
+
+
+def test_metrics_report_requests_by_route_template(project_id) -> None:
+    with TestClient(get_production_app()) as client:
+        for _ in range(2):
+            client.get(f"/api/v1/projects/{project_id}/tasks")
+        client.get("/nowhere")
+        response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    route = "/api/v1/projects/{project_id}/tasks"
+    assert (
+        _sample(
+            text,
+            "kairo_http_requests_total",
+            method="GET",
+            route=route,
+            status="200",
+        )
+        == 2
+    )
+    assert (
+        _sample(
+            text,
+            "kairo_http_requests_total",
+            method="GET",
+            route="unmatched",
+            status="404",
+        )
+        == 1
+    )
+    assert str(project_id) not in text
+    assert (
+        _sample(text, "kairo_http_request_duration_seconds_count", method="GET", route=route)
+        == 2
+    )
+    assert _sample(text, "kairo_http_requests_in_flight") == 1
+
+
+def test_metrics_attribute_statements_to_requests(project_id) -> None:
+    with TestClient(get_production_app()) as client:
+        client.get(f"/api/v1/projects/{project_id}/tasks")
+        text = client.get("/metrics").text
+
+    route = "/api/v1/projects/{project_id}/tasks"
+    queries = _sample(text, "kairo_http_request_db_queries_sum", method="GET", route=route)
+    assert queries >= 1
+    assert _sample(text, "kairo_db_queries_total") >= queries
+    assert (
+        _sample(text, "kairo_http_request_db_duration_seconds_sum", method="GET", route=route)
+        > 0
+    )
+    assert _sample(text, "kairo_db_pool_checkouts_total") >= 1
+    assert _sample(text, "kairo_db_pool_size") > 0
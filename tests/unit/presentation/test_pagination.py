@@ -0,0 +1,49 @@
+
+from fastapi.testclient import TestClient
+
+from kairo.presentation.http.application import get_production_app
+
+
+def test_list_endpoint_follows_next_links_to_the_end(project_id) -> None:
+    names = []
+    with TestClient(get_production_app()) as client:
+        url = f"/api/v1/projects/{project_id}/tasks?limit=2"
+        while url is not None:
+            body = client.get(url).json()
+            names.extend(task["name"] for task in body["items"])
+            url = body["links"]["next"]
+
+    assert names == [f"Task {i}" for i in range(5)]
+
+
+def test_list_endpoint_rejects_a_malformed_cursor(project_id) -> None:
+    with TestClient(get_production_app()) as client:
+        response = client.get(f"/api/v1/projects/{project_id}/tasks?cursor=%21%21")
+
+    assert response.status_code == 400
+
+
+def test_search_endpoint_pages_through_equally_ranked_tasks_by_id(project_id) -> None:
+    names = []
+    with TestClient(get_production_app()) as client:
+        url = "/api/v1/tasks:search?q=task&limit=2"
+        while url is not None:
+            body = client.get(url).json()
+            names.extend(task["name"] for task in body["items"])
+            url = body["links"]["next"]
+
+    assert names == [f"Task {i}" for i in range(5)]
+
+
+def test_query_endpoint_filters_tasks_and_rejects_invalid_queries(project_id) -> None:
+    with TestClient(get_production_app()) as client:
+        found = client.get(
+            "/api/v1/tasks",
+            params={"q": f"project = {project_id} ORDER BY created DESC", "limit": 2},
+        ).json()
+        invalid = client.get("/api/v1/tasks", params={"q": 'name ~ "Task"'})
+
+    assert [task["name"] for task in found["items"]] == ["Task 4", "Task 3"]
+    assert found["next_cursor"] is not None
+    assert invalid.status_code == 400
+    assert "cannot use an index" in invalid.json()["detail"]
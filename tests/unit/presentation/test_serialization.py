@@ -0,0 +1,71 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from kairo.domain.entities.project import Project
+from kairo.domain.entities.task import Task
+from kairo.domain.entities.user import User
+from kairo.presentation.http.application import get_production_app
+from kairo.presentation.http.schemas import ProjectResponse, UserResponse
+from kairo.presentation.http.serialization import encode, to_response
+
+
+def _user():
+    return User(email="owner@example.com", username="owner", password="password123")
+
+
+def test_users_are_encoded_without_their_password() -> None:
+    user = _user()
+
+    encoded = json.loads(encode(to_response(user)))
+
+    assert encoded == {
+        "id": str(user.id),
+        "username": "owner",
+        "email": "owner@example.com",
+        "created_at": user.created_at.isoformat().replace("+00:00", "Z"),
+        "updated_at": user.updated_at.isoformat().replace("+00:00", "Z"),
+    }
+
+
+def test_projects_carry_their_public_owner_and_no_tasks() -> None:
+    project = Project(name="Project", description="Description", owner=_user())
+    project.add_task(Task(name="Task", description="Description"))
+
+    response = to_response(project)
+
+    assert isinstance(response, ProjectResponse)
+    assert isinstance(response.owner, UserResponse)
+    assert not hasattr(response, "tasks")
+
+
+def test_tasks_carry_their_loaded_subtasks() -> None:
+    task = Task(name="Parent", description="Description")
+    task.add_subtask(Task(name="Child", description="Description"))
+
+    response = to_response(task)
+
+    assert [subtask.name for subtask in response.subtasks] == ["Child"]
+    assert response.subtasks[0].parent_id == task.id
+
+
+def test_encode_writes_compact_json() -> None:
+    assert encode({"a": [1, None]}) == b'{"a":[1,null]}'
+
+
+def test_user_endpoints_never_return_the_password(project_id) -> None:
+    with TestClient(get_production_app()) as client:
+        created = client.post(
+            "/api/v1/users",
+            json={
+                "email": "new@example.com",
+                "username": "new",
+                "password": "password123",
+            },
+        ).json()
+        fetched = client.get(f"/api/v1/users/{created['id']}").json()
+        schema = client.get("/openapi.json").json()["components"]["schemas"]
+
+    assert "password" not in created
+    assert fetched == created
+    assert "password" not in schema["UserResponse"]["properties"]
@@ -0,0 +1,20 @@
+from kairo.config import ServerConfig
+from kairo.presentation.http.server import production_config
+
+
+def test_production_config_uses_the_fast_loop_and_parser() -> None:
+    config = production_config(
+        ServerConfig(workers=3, keep_alive=7, max_requests=500, graceful_timeout=12),
+    )
+
+    assert config.workers == 3
+    assert config.loop == "uvloop"
+    assert config.http == "httptools"
+    assert config.timeout_keep_alive == 7
+    assert config.limit_max_requests == 500
+    assert config.timeout_graceful_shutdown == 12
+    assert not config.reload
+
+
+def test_workers_are_not_recycled_when_max_requests_is_zero() -> None:
+    assert production_config(ServerConfig(max_requests=0)).limit_max_requests is None
@@ -0,0 +1,81 @@
+import json
+from dataclasses import asdict, dataclass
+
+import pytest
+from fastapi.testclient import TestClient
+
+from kairo.presentation.http import streaming
+from kairo.presentation.http.application import get_production_app
+from kairo.presentation.http.streaming import json_array_stream, ndjson_stream
+
+
+@dataclass
+class Item:
+    n: int
+
+
+async def _items(count):
+    for n in range(count):
+        yield Item(n)
+
+
+def _serialize(item):
+    return json.dumps(asdict(item), separators=(",", ":")).encode()
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("count", [0, 1, 3])
+async def test_json_array_stream_is_valid_json(count) -> None:
+    body = b"".join(await _collect(json_array_stream(_items(count), _serialize)))
+
+    assert json.loads(body) == [{"n": n} for n in range(count)]
+
+
+@pytest.mark.anyio
+async def test_ndjson_stream_writes_one_line_per_item() -> None:
+    body = b"".join(await _collect(ndjson_stream(_items(3), _serialize)))
+
+    assert body == b'{"n":0}\n{"n":1}\n{"n":2}\n'
+
+
+@pytest.mark.anyio
+async def test_streams_coalesce_items_into_bounded_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_SIZE", 16)
+
+    chunks = await _collect(ndjson_stream(_items(10), _serialize))
+
+    assert [len(chunk) for chunk in chunks] == [16] * 5
+
+
+@pytest.mark.anyio
+async def test_streams_pull_items_only_as_chunks_are_consumed(monkeypatch) -> None:
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_SIZE", 1)
+    pulled = []
+
+    async def items():
+        for n in range(100):
+            pulled.append(n)
+            yield Item(n)
+
+    chunks = ndjson_stream(items(), _serialize)
+    await anext(chunks)
+    await chunks.aclose()
+
+    assert pulled == [0]
+
+
+def test_export_endpoint_streams_ndjson_and_json(project_id) -> None:
+    url = f"/api/v1/projects/{project_id}/tasks:export"
+    with TestClient(get_production_app()) as client:
+        ndjson = client.get(url)
+        array = client.get(url, params={"format": "json"})
+
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [task["name"] for task in lines] == [f"Task {i}" for i in range(5)]
+    assert array.headers["content-type"] == "application/json"
+    assert array.json() == lines
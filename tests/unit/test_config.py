@@ -0,0 +1,68 @@
+import tomllib
+
+import pytest
+
+from kairo import config
+from kairo.config import CONFIG_FILE_ENV, ServerConfig, Settings
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "kairo.toml"
+    path.write_text(
+        "[database]\n"
+        'url = "sqlite+aiosqlite:///from-file.db"\n'
+        "pool_size = 3\n"
+        "[cache]\n"
+        'backend = "none"\n'
+        "[server]\n"
+        "workers = 4\n"
+        "access_log = true\n",
+    )
+    monkeypatch.setenv(CONFIG_FILE_ENV, str(path))
+    for name in ["DATABASE_URL", "DATABASE_POOL_SIZE", "SERVER_WORKERS"]:
+        monkeypatch.delenv(f"KAIRO_{name}", raising=False)
+    return path
+
+
+def test_settings_are_read_from_the_config_file(config_file) -> None:
+    settings = Settings.from_env()
+
+    assert settings.database.url == "sqlite+aiosqlite:///from-file.db"
+    assert settings.database.pool_size == 3
+    assert settings.cache.backend == "none"
+    assert settings.server.workers == 4
+    assert settings.server.access_log is True
+    assert settings.server.port == ServerConfig().port
+
+
+def test_environment_variables_override_the_config_file(
+    config_file,
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("KAIRO_SERVER_WORKERS", "2")
+
+    assert ServerConfig.from_env().workers == 2
+
+
+def test_config_file_values_must_be_in_sections(config_file) -> None:
+    config_file.write_text("workers = 4\n")
+
+    with pytest.raises(ValueError, match="section"):
+        ServerConfig.from_env()
+
+
+def test_config_file_is_parsed_once(config_file, monkeypatch) -> None:
+    loads = []
+    tomllib_load = tomllib.load
+
+    def load(file):
+        loads.append(file)
+        return tomllib_load(file)
+
+    monkeypatch.setattr(config.tomllib, "load", load)
+
+    Settings.from_env()
+    Settings.from_env()
+
+    assert len(loads) == 1
@@ -0,0 +1,131 @@
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from kairo.ioc import ContainerError, Registry, Scope
+
+
+class Config:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Pool:
+    pass
+
+
+class Session:
+    def __init__(self, pool: Pool) -> None:
+        self.pool = pool
+
+
+class Repository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+class Unit:
+    def __init__(self, repository: Repository, config: Config) -> None:
+        self.repository = repository
+        self.config = config
+
+
+def registry_with_log(log: list[str]) -> Registry:
+    async def provide_pool() -> AsyncIterator[Pool]:
+        log.append("pool open")
+        yield Pool()
+        log.append("pool closed")
+
+    def provide_session(pool: Pool) -> Iterator[Session]:
+        log.append("session open")
+        yield Session(pool)
+        log.append("session closed")
+
+    registry = Registry()
+    registry.context(Config, scope=Scope.APP)
+    registry.provide(provide_pool, scope=Scope.APP)
+    registry.provide(provide_session, scope=Scope.REQUEST)
+    registry.provide(Repository, scope=Scope.REQUEST)
+    registry.provide(Unit, scope=Scope.ACTION)
+    return registry
+
+
+@pytest.mark.anyio
+async def test_scopes_share_and_finalize_their_objects() -> None:
+    log: list[str] = []
+    container = registry_with_log(log).build({Config: Config("test")})
+
+    async with container:
+        assert log == ["pool open"]
+        pool = await container.get(Pool)
+        async with container.enter() as request:
+            repository = await request.get(Repository)
+            assert repository is await request.get(Repository)
+            assert repository.session.pool is pool
+            async with request.enter() as action:
+                unit = await action.get(Unit)
+                assert unit.repository is repository
+                assert unit.config.name == "test"
+            assert log == ["pool open", "session open"]
+        assert log == ["pool open", "session open", "session closed"]
+        async with container.enter() as request:
+            assert await request.get(Repository) is not repository
+    assert log[-1] == "pool closed"
+
+
+@pytest.mark.anyio
+async def test_objects_of_closed_scopes_are_not_resolved_from_outer_ones() -> None:
+    container = registry_with_log([]).build({Config: Config("test")})
+
+    async with container:
+        with pytest.raises(ContainerError, match="REQUEST scope"):
+            await container.get(Repository)
+        async with container.enter() as request:
+            with pytest.raises(ContainerError, match="has no provider"):
+                await request.get(str)
+
+
+@pytest.mark.anyio
+async def test_context_values_must_be_passed_in() -> None:
+    with pytest.raises(ContainerError, match="Config"):
+        async with registry_with_log([]).build():
+            pass
+
+
+@pytest.mark.anyio
+async def test_aliases_resolve_to_the_same_object() -> None:
+    registry = registry_with_log([])
+    registry.alias(object, to=Repository)
+
+    async with registry.build({Config: Config("test")}) as container:
+        async with container.enter() as request:
+            assert await request.get(object) is await request.get(Repository)
+
+
+def test_missing_dependencies_are_reported_at_build_time() -> None:
+    registry = Registry()
+    registry.provide(Repository, scope=Scope.REQUEST)
+
+    with pytest.raises(ContainerError, match="Repository needs Session"):
+        registry.build()
+
+
+def test_longer_lived_objects_cannot_depend_on_shorter_lived_ones() -> None:
+    registry = Registry()
+    registry.provide(Session, scope=Scope.APP)
+    registry.provide(Pool, scope=Scope.REQUEST)
+
+    with pytest.raises(ContainerError, match="cannot depend"):
+        registry.build()
+
+
+def test_dependency_cycles_are_rejected() -> None:
+    def provide_pool(session: Session) -> Pool:
+        return Pool()
+
+    registry = Registry()
+    registry.provide(provide_pool, scope=Scope.APP)
+    registry.provide(Session, scope=Scope.APP)
+
+    with pytest.raises(ContainerError, match="cycle"):
+        registry.build()